@@ -0,0 +1,63 @@
+import argparse
+import json
+from typing import Dict
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "queries_per_call")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="두 벤치마크 결과 JSON을 케이스별로 비교합니다.")
+    parser.add_argument("baseline", help="기준 결과 JSON")
+    parser.add_argument("candidate", help="비교할 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="이 비율(%%) 이상 느려지면 표시")
+    return parser.parse_args()
+
+
+def load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "-"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    args = parse_args()
+    baseline = load(args.baseline)
+    candidate = load(args.candidate)
+    
+    if baseline["benchmark"] != candidate["benchmark"]:
+        raise SystemExit(f"종류가 다른 결과입니다: {baseline['benchmark']} / {candidate['benchmark']}")
+    if baseline["dataset"]["params"] != candidate["dataset"]["params"]:
+        print("경고: 데이터셋 규모가 다릅니다.")
+    
+    print(f"{baseline['git_commit']} -> {candidate['git_commit']} ({baseline['benchmark']})")
+    
+    before_by_name = {result["name"]: result for result in baseline["results"]}
+    width = max(len(result["name"]) for result in candidate["results"])
+    metrics = [metric for metric in METRICS if metric in candidate["results"][0]]
+    
+    print(f"{'name':<{width}} " + " ".join(f"{metric:>24}" for metric in metrics))
+    regressions = 0
+    for result in candidate["results"]:
+        before = before_by_name.get(result["name"])
+        if before is None:
+            print(f"{result['name']:<{width}} (새 케이스)")
+            continue
+        
+        cells = []
+        for metric in metrics:
+            cells.append(f"{before[metric]:>9} -> {result[metric]:<9} {change(before[metric], result[metric]):>7}")
+        
+        slower = before["p95_ms"] and (result["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 >= args.threshold
+        regressions += bool(slower)
+        print(f"{result['name']:<{width}} " + " ".join(cells) + (" !" if slower else ""))
+    
+    print(f"\np95가 {args.threshold}% 이상 느려진 케이스: {regressions}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, select
+
+from src.model.day_schedule import DaySchedule
+from src.model.marker import Marker
+from src.model.plan import Plan
+from src.model.schedule_slot import ScheduleSlot
+from src.model.users_in_plan import UsersInPlan
+from src.util.database import engine
+
+SEARCH_KEYWORDS = ["서울", "제주", "부산 맛집", "힐링", "도쿄 가족", "캠핑 여행", "미술관", "없는검색어"]
+
+
+@dataclass
+class BenchData:
+    # 벤치마크가 요청 대상을 고를 때 쓰는 ID 목록. 작업용 DB에서 한 번 읽어 둔다.
+    plan_ids: List[int] = field(default_factory=list)
+    owners: Dict[int, int] = field(default_factory=dict)
+    members: Dict[int, List[int]] = field(default_factory=lambda: defaultdict(list))
+    days: Dict[int, List[int]] = field(default_factory=lambda: defaultdict(list))
+    slots: Dict[int, List[int]] = field(default_factory=lambda: defaultdict(list))
+    markers: Dict[int, List[Tuple[int, float, float]]] = field(default_factory=lambda: defaultdict(list))
+    day_plan: Dict[int, int] = field(default_factory=dict)
+    max_user_id: int = 0
+    next_voter_id: int = 0
+    
+    def random_plan(self, rng: random.Random) -> int:
+        return rng.choice(self.plan_ids)
+    
+    def random_member(self, rng: random.Random, plan_id: int) -> int:
+        return rng.choice(self.members[plan_id])
+    
+    def random_day(self, rng: random.Random, plan_id: int) -> int:
+        return rng.choice(self.days[plan_id])
+    
+    def new_voter(self) -> int:
+        # 아직 투표하지 않은 사용자 ID. 투표 API는 (슬롯, 사용자)당 한 번만 허용한다.
+        self.next_voter_id += 1
+        return self.next_voter_id
+
+
+def load_bench_data() -> BenchData:
+    data = BenchData()
+    
+    with engine.connect() as connection:
+        for plan_id, owner_id in connection.execute(
+            select(Plan.id, Plan.created_user_id).filter(Plan.is_deleted == False).order_by(Plan.id)
+        ):
+            data.plan_ids.append(plan_id)
+            data.owners[plan_id] = owner_id
+        
+        for plan_id, user_id in connection.execute(
+            select(UsersInPlan.plan_id, UsersInPlan.user_id).order_by(UsersInPlan.id)
+        ):
+            data.members[plan_id].append(user_id)
+        
+        for day_id, plan_id in connection.execute(
+            select(DaySchedule.id, DaySchedule.plan_id).order_by(DaySchedule.plan_id, DaySchedule.date)
+        ):
+            data.days[plan_id].append(day_id)
+            data.day_plan[day_id] = plan_id
+        
+        for slot_id, day_id in connection.execute(
+            select(ScheduleSlot.id, ScheduleSlot.day_schedule_id).order_by(
+                ScheduleSlot.day_schedule_id, ScheduleSlot.order_num
+            )
+        ):
+            data.slots[day_id].append(slot_id)
+        
+        for marker_id, plan_id, latitude, longitude in connection.execute(
+            select(Marker.id, Marker.plan_id, Marker.latitude, Marker.longitude).order_by(Marker.id)
+        ):
+            data.markers[plan_id].append((marker_id, latitude, longitude))
+        
+        data.max_user_id = connection.scalar(select(func.max(UsersInPlan.user_id))) or 0
+    
+    data.next_voter_id = data.max_user_id + 1_000_000
+    return data
@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import random
+import time
+from collections import Counter
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Any, Dict, List
+
+import bcrypt
+from sqlalchemy import create_engine, event
+
+from bench.standin import DATA_DIR, DATASET_PATH, MANIFEST_PATH
+from src.util.config import settings
+from src.util.database import Base, set_sqlite_pragmas
+from src.model.day_schedule import DaySchedule
+from src.model.marker import Marker
+from src.model.plan import Plan
+from src.model.schedule_slot import ScheduleSlot
+from src.model.slot_vote_tally import SlotVoteTally
+from src.model.slot_voting import SlotVoting
+from src.model.user import User
+from src.model.users_in_plan import UsersInPlan
+
+SCALES = {
+    "small": dict(users=1_000, plans=500, members=4, days=3, slots=5, markers=8, votes=20_000),
+    "medium": dict(users=10_000, plans=5_000, members=5, days=4, slots=5, markers=10, votes=200_000),
+    "large": dict(users=20_000, plans=10_000, members=5, days=4, slots=5, markers=10, votes=1_000_000),
+}
+
+CITIES = [
+    ("서울", 37.5665, 126.9780), ("부산", 35.1796, 129.0756), ("제주", 33.4996, 126.5312),
+    ("경주", 35.8562, 129.2247), ("강릉", 37.7519, 128.8761), ("전주", 35.8242, 127.1480),
+    ("여수", 34.7604, 127.6622), ("도쿄", 35.6762, 139.6503), ("오사카", 34.6937, 135.5023),
+    ("파리", 48.8566, 2.3522), ("뉴욕", 40.7128, -74.0060), ("방콕", 13.7563, 100.5018),
+]
+THEMES = ["가족", "맛집", "힐링", "배낭", "출장", "캠핑", "미술관", "해변"]
+SPENDING_MINUTES = [30, 60, 90, 120, 180]
+
+BASE_TIME = datetime(2024, 1, 1)
+BENCH_PASSWORD = "bench-password"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터셋(SQLite)을 시드 기반으로 생성합니다.")
+    parser.add_argument("--scale", choices=SCALES, default="small", help="기본 규모 (개별 옵션으로 덮어쓸 수 있음)")
+    parser.add_argument("--users", type=int, help="사용자 수")
+    parser.add_argument("--plans", type=int, help="플랜 수")
+    parser.add_argument("--members", type=int, help="플랜당 멤버 수 (소유자 포함)")
+    parser.add_argument("--days", type=int, help="플랜당 일정(일) 수")
+    parser.add_argument("--slots", type=int, help="일정당 슬롯 수")
+    parser.add_argument("--markers", type=int, help="플랜당 마커 수")
+    parser.add_argument("--votes", type=int, help="전체 투표 수 (슬롯당 멤버 수를 넘지 않음)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000, help="INSERT 한 번에 넣을 행 수")
+    return parser.parse_args()
+
+
+class BatchWriter:
+    # 테이블별로 행을 모아 executemany로 넣는다. 100만 건 투표도 메모리에 다 올리지 않는다.
+    
+    def __init__(self, connection, batch_size: int):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.buffers: Dict[Any, List[Dict[str, Any]]] = {}
+        self.counts: Counter = Counter()
+    
+    def add(self, model, row: Dict[str, Any]) -> None:
+        buffer = self.buffers.setdefault(model.__table__, [])
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush(model.__table__)
+    
+    def flush(self, table=None) -> None:
+        for target in ([table] if table is not None else list(self.buffers)):
+            rows = self.buffers.get(target)
+            if rows:
+                self.connection.execute(target.insert(), rows)
+                self.counts[target.name] += len(rows)
+                rows.clear()
+
+
+def generate(writer: BatchWriter, rng: random.Random, scale: Dict[str, int]) -> None:
+    # 모든 ID와 시각을 직접 정해서 같은 시드면 같은 데이터셋이 나온다.
+    password = bcrypt.hashpw(BENCH_PASSWORD.encode("utf-8"), b"$2b$04$" + b"." * 22).decode("utf-8")
+    for user_id in range(1, scale["users"] + 1):
+        created_at = BASE_TIME + timedelta(minutes=user_id)
+        writer.add(User, dict(
+            id=user_id, nickname=f"bench{user_id:07d}", password=password, thumbnail="",
+            created_at=created_at, updated_at=created_at
+        ))
+    
+    member_count = min(scale["members"], scale["users"])
+    total_slots = scale["plans"] * scale["days"] * scale["slots"]
+    votes_per_slot, extra_votes = divmod(scale["votes"], total_slots) if total_slots else (0, 0)
+    day_id = slot_id = marker_id = 0
+    
+    for plan_id in range(1, scale["plans"] + 1):
+        city, latitude, longitude = rng.choice(CITIES)
+        theme = rng.choice(THEMES)
+        start_date = date(2024, 3, 1) + timedelta(days=rng.randrange(365))
+        # 커서 페이지네이션이 마이크로초까지 비교하도록 created_at에 마이크로초를 넣는다.
+        created_at = BASE_TIME + timedelta(seconds=plan_id * 17, microseconds=plan_id * 7919 % 1_000_000)
+        owner_id = rng.randint(1, scale["users"])
+        members = [owner_id] + [user_id for user_id in rng.sample(range(1, scale["users"] + 1), member_count) if user_id != owner_id]
+        members = members[:member_count]
+        
+        writer.add(Plan, dict(
+            id=plan_id, name=f"{city} {theme} 여행", city_to_stay=city,
+            description=f"{city}에서 {scale['days']}일 동안 {theme} 위주로 다니는 일정",
+            init_latitude=latitude, init_longitude=longitude,
+            start_date=start_date, end_date=start_date + timedelta(days=max(scale["days"] - 1, 0)),
+            created_user_id=owner_id, is_deleted=False, version=1,
+            created_at=created_at, updated_at=created_at
+        ))
+        for user_id in members:
+            writer.add(UsersInPlan, dict(
+                user_id=user_id, plan_id=plan_id, owner=user_id == owner_id,
+                created_at=created_at, updated_at=created_at
+            ))
+        
+        markers = []
+        for index in range(scale["markers"]):
+            marker_id += 1
+            markers.append(dict(
+                id=marker_id, plan_id=plan_id, name=f"{city} 장소 {index + 1}",
+                latitude=latitude + rng.uniform(-0.05, 0.05), longitude=longitude + rng.uniform(-0.05, 0.05),
+                is_scheduled=False, created_user_id=rng.choice(members),
+                created_at=created_at, updated_at=created_at
+            ))
+        
+        for day_index in range(scale["days"]):
+            day_id += 1
+            planned_seconds = 0
+            
+            for order in range(1, scale["slots"] + 1):
+                slot_id += 1
+                marker = rng.choice(markers) if markers and rng.random() < 0.8 else None
+                minutes = rng.choice(SPENDING_MINUTES)
+                planned_seconds += minutes * 60
+                if marker is not None:
+                    marker["is_scheduled"] = True
+                
+                writer.add(ScheduleSlot, dict(
+                    id=slot_id, day_schedule_id=day_id, holding_marker_id=marker["id"] if marker else None,
+                    name=f"슬롯 {order}", spending_time=dtime(minutes // 60, minutes % 60),
+                    need_to_reservation=rng.random() < 0.2, is_reserved=False,
+                    order_num=order * settings.slot_order_gap,
+                    created_at=created_at, updated_at=created_at
+                ))
+                
+                if not markers:
+                    continue
+                
+                # 나머지 투표는 슬롯 전체에 고르게 나눠 합계를 정확히 맞춘다.
+                extra = slot_id * extra_votes // total_slots - (slot_id - 1) * extra_votes // total_slots
+                voter_count = min(votes_per_slot + extra, len(members))
+                tallies: Counter = Counter()
+                for voter_id in rng.sample(members, voter_count):
+                    voted_marker_id = rng.choice(markers)["id"]
+                    tallies[voted_marker_id] += 1
+                    writer.add(SlotVoting, dict(
+                        schedule_slot_id=slot_id, marker_id=voted_marker_id, voted_user_id=voter_id,
+                        created_at=created_at, updated_at=created_at
+                    ))
+                for voted_marker_id, vote_count in sorted(tallies.items()):
+                    writer.add(SlotVoteTally, dict(
+                        schedule_slot_id=slot_id, marker_id=voted_marker_id, vote_count=vote_count,
+                        created_at=created_at, updated_at=created_at
+                    ))
+            
+            writer.add(DaySchedule, dict(
+                id=day_id, plan_id=plan_id, date=start_date + timedelta(days=day_index),
+                start_time=dtime(9), end_time=dtime(21), planned_seconds=planned_seconds,
+                last_order_num=scale["slots"] * settings.slot_order_gap,
+                created_at=created_at, updated_at=created_at
+            ))
+        
+        for marker in markers:
+            writer.add(Marker, marker)
+    
+    writer.flush()
+
+
+def main() -> None:
+    args = parse_args()
+    scale = dict(SCALES[args.scale])
+    for key in scale:
+        if getattr(args, key) is not None:
+            scale[key] = getattr(args, key)
+    
+    os.makedirs(DATA_DIR, exist_ok=True)
+    temp_path = DATASET_PATH + ".tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    
+    started = time.perf_counter()
+    engine = create_engine(f"sqlite:///{temp_path}")
+    Base.metadata.create_all(engine)
+    
+    with engine.begin() as connection:
+        connection.exec_driver_sql("PRAGMA synchronous=OFF")
+        writer = BatchWriter(connection, args.batch_size)
+        generate(writer, random.Random(args.seed), scale)
+    
+    # 벤치마크는 데이터셋을 복사해서 쓰므로 WAL 모드를 미리 켜 둔다.
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    with engine.connect() as connection:
+        connection.exec_driver_sql("ANALYZE")
+    engine.dispose()
+    os.replace(temp_path, DATASET_PATH)
+    
+    manifest = {
+        "scale": args.scale,
+        "seed": args.seed,
+        "params": scale,
+        "rows": dict(sorted(writer.counts.items())),
+        "password": BENCH_PASSWORD,
+        "elapsed_seconds": round(time.perf_counter() - started, 2),
+    }
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    
+    print(json.dumps(manifest, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
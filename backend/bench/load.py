@@ -0,0 +1,222 @@
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+from bench.standin import prepare_work_db
+from bench.dataset import SEARCH_KEYWORDS, BenchData, load_bench_data
+from bench.report import print_table, summarize, write_results
+from src.model.users_in_plan import UsersInPlan
+from src.util.auth import issue_token
+from src.util.database import session_scope
+from src.util.metrics import http_request_db_statements, metrics
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+API = "/api/v1"
+SCENARIOS = ("poll", "itinerary", "vote_burst", "reorder", "search")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="앱을 프로세스 안에서(ASGI) 띄우고 실제 요청 비율로 부하를 줍니다.")
+    parser.add_argument("--operations", type=int, default=2000, help="실행할 작업 수 (vote_burst 하나는 --burst-size개 요청)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 요청하는 가상 사용자 수")
+    parser.add_argument("--mix", default="poll=50,itinerary=15,vote_burst=10,reorder=10,search=15", help="시나리오별 비중")
+    parser.add_argument("--burst-size", type=int, default=8, help="한 번의 투표 폭주에서 동시에 보내는 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: bench/results/load-<시각>.json)")
+    return parser.parse_args()
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise SystemExit(f"알 수 없는 시나리오: {name} (가능한 값: {', '.join(SCENARIOS)})")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+class LoadRunner:
+
+    def __init__(self, client, data: BenchData):
+        self.client = client
+        self.data = data
+        self.tokens: Dict[int, str] = {}
+        self.etags: Dict[int, str] = {}
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.errors: Counter = Counter()
+    
+    def headers(self, user_id: int) -> Dict[str, str]:
+        token = self.tokens.get(user_id)
+        if token is None:
+            token = self.tokens[user_id] = issue_token(user_id)[0]
+        return {"Authorization": f"Bearer {token}"}
+    
+    async def request(self, scenario: str, method: str, url: str, expected=(200,), **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except Exception as e:
+            self.errors[scenario] += 1
+            self.statuses[scenario][type(e).__name__] += 1
+            return None
+        self.latencies[scenario].append((time.perf_counter() - started) * 1000)
+        self.statuses[scenario][str(response.status_code)] += 1
+        if response.status_code not in expected:
+            self.errors[scenario] += 1
+        return response
+    
+    async def poll(self, rng: random.Random) -> None:
+        # 클라이언트는 마지막으로 받은 ETag로 폴링하므로 대부분 304가 된다.
+        plan_id = self.data.random_plan(rng)
+        headers = self.headers(self.data.random_member(rng, plan_id))
+        if plan_id in self.etags:
+            headers["If-None-Match"] = self.etags[plan_id]
+        
+        response = await self.request(
+            "poll", "GET", f"{API}/day-schedules", expected=(200, 304), params={"plan_id": plan_id}, headers=headers
+        )
+        if response is not None and "etag" in response.headers:
+            self.etags[plan_id] = response.headers["etag"]
+    
+    async def itinerary(self, rng: random.Random) -> None:
+        plan_id = self.data.random_plan(rng)
+        await self.request(
+            "itinerary", "GET", f"{API}/plans/{plan_id}/itinerary",
+            headers=self.headers(self.data.random_member(rng, plan_id))
+        )
+    
+    async def vote_burst(self, rng: random.Random, burst_size: int) -> None:
+        # 같은 날 일정에 여러 사용자가 동시에 투표한다. 집계 행에 쓰기가 몰리는 경우다.
+        plan_id = self.data.random_plan(rng)
+        slot_ids = self.data.slots[self.data.random_day(rng, plan_id)]
+        markers = self.data.markers[plan_id]
+        voter_ids = [self.data.new_voter() for _ in range(burst_size)]
+        
+        # 투표는 플랜 멤버만 할 수 있으므로 새 투표자를 요청 전에 멤버로 추가한다. 측정 대상은 아니다.
+        async with session_scope() as db:
+            db.add_all(UsersInPlan(user_id=voter_id, plan_id=plan_id) for voter_id in voter_ids)
+            await db.commit()
+        
+        requests = []
+        for voter_id in voter_ids:
+            votes = [{"schedule_slot_id": slot_id, "marker_id": rng.choice(markers)[0]} for slot_id in slot_ids]
+            requests.append(self.request(
+                "vote_burst", "POST", f"{API}/schedule-slots/votes:batch",
+                json={"votes": votes}, headers=self.headers(voter_id)
+            ))
+        await asyncio.gather(*requests)
+    
+    async def reorder(self, rng: random.Random) -> None:
+        plan_id = self.data.random_plan(rng)
+        day_id = self.data.random_day(rng, plan_id)
+        slot_ids = list(self.data.slots[day_id])
+        rng.shuffle(slot_ids)
+        
+        response = await self.request(
+            "reorder", "POST", f"{API}/schedule-slots/reorder",
+            json={"day_schedule_id": day_id, "slot_ids": slot_ids}, headers=self.headers(self.data.owners[plan_id])
+        )
+        if response is not None and response.status_code == 200:
+            self.data.slots[day_id] = slot_ids
+    
+    async def search(self, rng: random.Random) -> None:
+        await self.request(
+            "search", "GET", f"{API}/plans/all", params={"keyword": rng.choice(SEARCH_KEYWORDS)}
+        )
+    
+    async def run(self, operations: List[str], args: argparse.Namespace) -> float:
+        # 작업 목록과 작업별 시드가 고정되어 있어, 동시 실행 순서만 다르고 요청 대상은 실행마다 같다.
+        queue = iter(enumerate(operations))
+        
+        async def worker() -> None:
+            for index, scenario in queue:
+                rng = random.Random(f"{args.seed}:{index}")
+                if scenario == "vote_burst":
+                    await self.vote_burst(rng, args.burst_size)
+                else:
+                    await getattr(self, scenario)(rng)
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        return time.perf_counter() - started
+
+
+def route_query_counts() -> Dict[str, Dict[str, float]]:
+    # 서버 쪽에서 기록한 라우트별 요청당 SQL 수 (src/util/metrics.py).
+    counts = {}
+    for (metric, label_values), entry in metrics.snapshot().items():
+        if metric is not http_request_db_statements:
+            continue
+        requests = sum(entry[:-1])
+        counts[" ".join(label_values)] = {
+            "requests": requests,
+            "queries_per_request": round(entry[-1] / requests, 2) if requests else 0.0,
+        }
+    return dict(sorted(counts.items()))
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    import main as app_module
+    
+    data = load_bench_data()
+    weights = parse_mix(args.mix)
+    operations = random.Random(args.seed).choices(list(weights), weights=list(weights.values()), k=args.operations)
+    
+    await app_module.startup_event()
+    try:
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            runner = LoadRunner(client, data)
+            elapsed = await runner.run(operations, args)
+    finally:
+        await app_module.shutdown_event()
+    
+    results = [
+        {
+            "name": scenario,
+            **summarize(runner.latencies[scenario]),
+            "errors": runner.errors[scenario],
+            "statuses": dict(sorted(runner.statuses[scenario].items())),
+        }
+        for scenario in SCENARIOS if scenario in weights
+    ]
+    requests = sum(len(latencies) for latencies in runner.latencies.values())
+    
+    return {
+        "results": results,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests": requests,
+        "requests_per_sec": round(requests / elapsed, 1) if elapsed else 0.0,
+        "routes": route_query_counts(),
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    if httpx is None:
+        raise SystemExit("부하 시나리오에는 httpx가 필요합니다: pip install httpx")
+    
+    prepare_work_db()
+    outcome = asyncio.run(run(args))
+    
+    print_table(outcome["results"], ("errors",))
+    print(f"\n{outcome['requests']}개 요청, {outcome['elapsed_seconds']}초, {outcome['requests_per_sec']} req/s")
+    for route, counts in outcome["routes"].items():
+        print(f"  {route}: 요청당 SQL {counts['queries_per_request']}개 ({counts['requests']}회)")
+    
+    results = outcome.pop("results")
+    output = write_results("load", vars(args), results, args.output, summary=outcome)
+    print(f"\n결과: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import orjson
+import sqlalchemy
+
+from bench.standin import BENCH_DIR, MANIFEST_PATH, RESULTS_DIR
+
+
+def percentile(sorted_values: Sequence[float], ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * ratio))]
+
+
+def summarize(latencies_ms: List[float]) -> Dict[str, float]:
+    values = sorted(latencies_ms)
+    count = len(values)
+    return {
+        "count": count,
+        "mean_ms": round(sum(values) / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(values, 0.50), 3),
+        "p95_ms": round(percentile(values, 0.95), 3),
+        "p99_ms": round(percentile(values, 0.99), 3),
+        "max_ms": round(values[-1], 3) if count else 0.0,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_manifest() -> Dict[str, Any]:
+    with open(MANIFEST_PATH, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def write_results(kind: str, args: Dict[str, Any], results: List[Dict[str, Any]], output: Optional[str], **extra: Any) -> str:
+    # 실행 환경과 데이터셋 정보를 함께 남겨 `python -m bench.compare`로 실행 간 비교할 수 있게 한다.
+    started_at = datetime.now(timezone.utc)
+    payload = {
+        "benchmark": kind,
+        "created_at": started_at.isoformat(),
+        "git_commit": git_commit(),
+        "python": sys.version.split()[0],
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+        "args": args,
+        "dataset": load_manifest(),
+        "results": results,
+        **extra,
+    }
+    
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{kind}-{started_at.strftime('%Y%m%dT%H%M%SZ')}.json")
+    
+    with open(output, "wb") as file:
+        file.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    
+    return output
+
+
+def print_table(results: List[Dict[str, Any]], extra_columns: Sequence[str] = ()) -> None:
+    columns = ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms") + tuple(extra_columns)
+    width = max([len("name")] + [len(result["name"]) for result in results])
+    
+    print(f"{'name':<{width}} {'count':>7} " + " ".join(f"{column:>10}" for column in columns))
+    for result in results:
+        cells = " ".join(f"{result.get(column, ''):>10}" for column in columns)
+        print(f"{result['name']:<{width}} {result['count']:>7} {cells}")
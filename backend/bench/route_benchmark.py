@@ -0,0 +1,58 @@
+import argparse
+import random
+import statistics
+import time
+from typing import List, Tuple
+
+from src.util.route import haversine_matrix, optimize_route, route_length
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="합성 일정으로 슬롯 경로 최적화 시간과 단축 거리를 측정합니다.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 25, 50, 100, 200], help="하루 슬롯 수 목록")
+    parser.add_argument("--days", type=int, default=20, help="크기별로 만들 일정 수")
+    parser.add_argument("--pinned-ratio", type=float, default=0.1, help="고정 슬롯 비율")
+    parser.add_argument("--budget-ms", type=float, default=50, help="최적화 시간 예산(ms)")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def synthetic_day(rng: random.Random, size: int, pinned_ratio: float) -> Tuple[List[Tuple[float, float]], List[bool]]:
+    # 서울 근처 약 30km 범위에 흩어진 방문지
+    points = [(37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4) for _ in range(size)]
+    pinned = [rng.random() < pinned_ratio for _ in range(size)]
+    return points, pinned
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    
+    print(f"{'slots':>6} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9} {'km before':>10} {'km after':>10}")
+    
+    for size in args.sizes:
+        elapsed = []
+        before = []
+        after = []
+        
+        for _ in range(args.days):
+            points, pinned = synthetic_day(rng, size, args.pinned_ratio)
+            
+            started = time.perf_counter()
+            route = optimize_route(points, pinned, args.budget_ms)
+            elapsed.append((time.perf_counter() - started) * 1000)
+            
+            distances = haversine_matrix(points)
+            before.append(route_length(distances, range(size)))
+            after.append(route_length(distances, route))
+        
+        elapsed.sort()
+        p95 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))]
+        print(
+            f"{size:>6} {statistics.mean(elapsed):>9.2f} {p95:>9.2f} {elapsed[-1]:>9.2f} "
+            f"{statistics.mean(before):>10.1f} {statistics.mean(after):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+import argparse
+import asyncio
+import random
+import time
+from datetime import time as dtime
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from fastapi import BackgroundTasks, HTTPException
+
+from bench.standin import prepare_work_db
+from bench.dataset import SEARCH_KEYWORDS, BenchData, load_bench_data
+from bench.report import print_table, summarize, write_results
+from src.schema.marker import MarkerCreateRequest
+from src.schema.plan import PlanCreateRequest, PlanUpdateRequest
+from src.schema.schedule_slot import (
+    MoveSlotRequest,
+    ScheduleSlotCreateRequest,
+    ScheduleSlotUpdateRequest,
+    SuggestSlotOrderRequest,
+    VoteSlotRequest,
+)
+from src.service import (
+    day_schedule_service,
+    marker_service,
+    membership_service,
+    plan_search_service,
+    plan_service,
+    schedule_slot_service,
+)
+from src.service.export_service import export_ndjson
+from src.service.itinerary_cache import get_plan_version
+from src.util.database import async_engine, engine, session_scope
+from src.util.password_hasher import password_hasher
+from src.util.query_recorder import QueryRecorder, current_recorder
+
+Case = Callable[..., Awaitable[None]]
+
+
+async def get_plans_by_user(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    await plan_service.get_plans_by_user(db, data.random_member(rng, plan_id))
+
+
+async def get_all_plans(db, data: BenchData, rng: random.Random) -> None:
+    await plan_service.get_all_plans(db)
+
+
+async def get_all_plans_keyword(db, data: BenchData, rng: random.Random) -> None:
+    await plan_service.get_all_plans(db, keyword=rng.choice(SEARCH_KEYWORDS))
+
+
+async def search_plans(db, data: BenchData, rng: random.Random) -> None:
+    await plan_search_service.search_plans(db, rng.choice(SEARCH_KEYWORDS))
+
+
+async def get_plan_itinerary(db, data: BenchData, rng: random.Random) -> None:
+    await plan_service.get_plan_itinerary(db, data.random_plan(rng))
+
+
+async def get_day_schedules_json(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    await day_schedule_service.get_day_schedules_json(db, plan_id, await get_plan_version(db, plan_id))
+
+
+async def get_markers_by_plan(db, data: BenchData, rng: random.Random) -> None:
+    await marker_service.get_markers_by_plan(db, data.random_plan(rng))
+
+
+async def get_markers_in_viewport(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    _, latitude, longitude = rng.choice(data.markers[plan_id])
+    await marker_service.get_markers_in_viewport(db, plan_id, latitude - 0.03, latitude + 0.03, longitude - 0.03, longitude + 0.03)
+
+
+async def get_nearby_markers(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    _, latitude, longitude = rng.choice(data.markers[plan_id])
+    await marker_service.get_nearby_markers(db, plan_id, latitude, longitude, 5)
+
+
+async def get_plan_role(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    await membership_service.get_plan_role(db, plan_id, data.random_member(rng, plan_id))
+
+
+async def get_vote_tallies(db, data: BenchData, rng: random.Random) -> None:
+    day_id = data.random_day(rng, data.random_plan(rng))
+    await schedule_slot_service.get_vote_tallies(db, rng.choice(data.slots[day_id]))
+
+
+async def export_plan(db, data: BenchData, rng: random.Random) -> None:
+    async for _ in export_ndjson(data.random_plan(rng)):
+        pass
+
+
+async def suggest_slot_order(db, data: BenchData, rng: random.Random) -> None:
+    day_id = data.random_day(rng, data.random_plan(rng))
+    await schedule_slot_service.suggest_slot_order(db, SuggestSlotOrderRequest(day_schedule_id=day_id))
+
+
+async def vote_schedule_slot(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    slot_id = rng.choice(data.slots[data.random_day(rng, plan_id)])
+    await schedule_slot_service.vote_schedule_slot(db, slot_id, rng.choice(data.markers[plan_id])[0], data.new_voter())
+
+
+async def vote_schedule_slots(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    votes = [
+        VoteSlotRequest(schedule_slot_id=slot_id, marker_id=rng.choice(data.markers[plan_id])[0])
+        for slot_id in data.slots[data.random_day(rng, plan_id)]
+    ]
+    await schedule_slot_service.vote_schedule_slots(db, data.new_voter(), votes)
+
+
+async def reorder_schedule_slots(db, data: BenchData, rng: random.Random) -> None:
+    day_id = data.random_day(rng, data.random_plan(rng))
+    slot_ids = list(data.slots[day_id])
+    rng.shuffle(slot_ids)
+    await schedule_slot_service.reorder_schedule_slots(db, day_id, slot_ids)
+    data.slots[day_id] = slot_ids
+
+
+async def move_schedule_slot(db, data: BenchData, rng: random.Random) -> None:
+    slot_ids = data.slots[data.random_day(rng, data.random_plan(rng))]
+    slot_id, before_slot_id = rng.sample(slot_ids, 2)
+    await schedule_slot_service.move_schedule_slot(
+        db, slot_id, MoveSlotRequest(before_slot_id=before_slot_id), BackgroundTasks()
+    )
+    slot_ids.remove(slot_id)
+    slot_ids.insert(slot_ids.index(before_slot_id), slot_id)
+
+
+async def confirm_schedule_slot(db, data: BenchData, rng: random.Random) -> None:
+    day_id = data.random_day(rng, data.random_plan(rng))
+    await schedule_slot_service.confirm_schedule_slot(db, rng.choice(data.slots[day_id]))
+
+
+async def update_schedule_slot(db, data: BenchData, rng: random.Random) -> None:
+    day_id = data.random_day(rng, data.random_plan(rng))
+    await schedule_slot_service.update_schedule_slot(
+        db, rng.choice(data.slots[day_id]),
+        ScheduleSlotUpdateRequest(spending_time=dtime(rng.randint(0, 3), rng.choice([0, 30])))
+    )
+
+
+async def create_schedule_slot(db, data: BenchData, rng: random.Random) -> None:
+    day_id = data.random_day(rng, data.random_plan(rng))
+    slot = await schedule_slot_service.create_schedule_slot(
+        db, ScheduleSlotCreateRequest(day_schedule_id=day_id, name="벤치 슬롯", spending_time=dtime(1))
+    )
+    data.slots[day_id].append(slot.id)
+
+
+async def create_marker(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    _, latitude, longitude = rng.choice(data.markers[plan_id])
+    marker = await marker_service.create_marker(
+        db, data.random_member(rng, plan_id),
+        MarkerCreateRequest(plan_id=plan_id, name="벤치 마커", latitude=latitude + 0.001, longitude=longitude)
+    )
+    data.markers[plan_id].append((marker.id, marker.latitude, marker.longitude))
+
+
+async def update_plan(db, data: BenchData, rng: random.Random) -> None:
+    await plan_service.update_plan(db, data.random_plan(rng), PlanUpdateRequest(description=f"수정 {rng.random():.6f}"))
+
+
+async def join_plan(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    user_id = data.new_voter()
+    await plan_service.join_plan(db, plan_id, user_id)
+    data.members[plan_id].append(user_id)
+
+
+async def create_plan(db, data: BenchData, rng: random.Random) -> None:
+    plan_id = data.random_plan(rng)
+    await plan_service.create_plan(db, data.owners[plan_id], PlanCreateRequest(
+        name="벤치 여행", init_latitude=37.5, init_longitude=127.0,
+        start_date="2024-05-01", end_date="2024-05-03"
+    ))
+
+
+# 읽기 후 쓰기 순서로 실행한다. 쓰기 케이스는 BenchData를 갱신해 이후 케이스가 같은 ID 목록을 쓰게 한다.
+CASES: List[Tuple[str, Case]] = [
+    ("plan.get_plans_by_user", get_plans_by_user),
+    ("plan.get_all_plans", get_all_plans),
+    ("plan.get_all_plans[keyword]", get_all_plans_keyword),
+    ("plan_search.search_plans", search_plans),
+    ("plan.get_plan_itinerary", get_plan_itinerary),
+    ("day_schedule.get_day_schedules_json", get_day_schedules_json),
+    ("marker.get_markers_by_plan", get_markers_by_plan),
+    ("marker.get_markers_in_viewport", get_markers_in_viewport),
+    ("marker.get_nearby_markers", get_nearby_markers),
+    ("membership.get_plan_role", get_plan_role),
+    ("schedule_slot.get_vote_tallies", get_vote_tallies),
+    ("schedule_slot.suggest_slot_order", suggest_slot_order),
+    ("export.export_ndjson[plan]", export_plan),
+    ("schedule_slot.vote_schedule_slot", vote_schedule_slot),
+    ("schedule_slot.vote_schedule_slots", vote_schedule_slots),
+    ("schedule_slot.reorder_schedule_slots", reorder_schedule_slots),
+    ("schedule_slot.move_schedule_slot", move_schedule_slot),
+    ("schedule_slot.confirm_schedule_slot", confirm_schedule_slot),
+    ("schedule_slot.update_schedule_slot", update_schedule_slot),
+    ("schedule_slot.create_schedule_slot", create_schedule_slot),
+    ("marker.create_marker", create_marker),
+    ("plan.update_plan", update_plan),
+    ("plan.join_plan", join_plan),
+    ("plan.create_plan", create_plan),
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="서비스 함수별 지연 시간과 호출당 SQL 수를 측정합니다.")
+    parser.add_argument("--iterations", type=int, default=200, help="케이스별 측정 횟수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전에 버리는 횟수 (캐시/색인 준비)")
+    parser.add_argument("--only", nargs="+", help="이름에 이 문자열이 들어간 케이스만 실행")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: bench/results/services-<시각>.json)")
+    return parser.parse_args()
+
+
+async def run_case(name: str, case: Case, data: BenchData, args: argparse.Namespace) -> Dict:
+    # 케이스마다 이름으로 시드를 정해, 일부 케이스만 실행해도 같은 대상을 고른다.
+    rng = random.Random(f"{args.seed}:{name}")
+    latencies = []
+    statements = 0
+    errors = 0
+    
+    for iteration in range(args.warmup + args.iterations):
+        recorder = QueryRecorder()
+        token = current_recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            async with session_scope() as db:
+                await case(db, data, rng)
+        except HTTPException:
+            errors += 1
+        finally:
+            elapsed = time.perf_counter() - started
+            current_recorder.reset(token)
+        
+        if iteration >= args.warmup:
+            latencies.append(elapsed * 1000)
+            statements += recorder.count
+    
+    return {
+        "name": name,
+        **summarize(latencies),
+        "ops_per_sec": round(len(latencies) / (sum(latencies) / 1000), 1) if latencies else 0.0,
+        "queries_per_call": round(statements / args.iterations, 2),
+        "errors": errors,
+    }
+
+
+async def run(args: argparse.Namespace) -> List[Dict]:
+    data = load_bench_data()
+    results = []
+    
+    try:
+        for name, case in CASES:
+            if args.only and not any(pattern in name for pattern in args.only):
+                continue
+            results.append(await run_case(name, case, data, args))
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+        password_hasher.shutdown()
+    
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    prepare_work_db()
+    
+    results = asyncio.run(run(args))
+    print_table(results, ("ops_per_sec", "queries_per_call", "errors"))
+    
+    output = write_results("services", vars(args), results, args.output)
+    print(f"\n결과: {output}")
+
+
+if __name__ == "__main__":
+    main()
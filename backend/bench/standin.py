@@ -0,0 +1,29 @@
+import os
+import shutil
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.environ.get("BENCH_DATA_DIR", os.path.join(BENCH_DIR, "data"))
+RESULTS_DIR = os.environ.get("BENCH_RESULTS_DIR", os.path.join(BENCH_DIR, "results"))
+DATASET_PATH = os.path.join(DATA_DIR, "dataset.db")
+MANIFEST_PATH = os.path.join(DATA_DIR, "dataset.json")
+WORK_PATH = os.path.join(DATA_DIR, "work.db")
+
+# src의 설정과 엔진은 import 시점에 환경 변수를 읽으므로, 벤치마크 모듈은 src보다 이 모듈을 먼저 import한다.
+# 네트워크 없이 돌 수 있도록 DB는 로컬 SQLite 파일, 캐시와 이벤트는 메모리 백엔드를 쓴다.
+os.environ["DB_URL"] = f"sqlite:///{WORK_PATH}"
+os.environ["DEBUG"] = "false"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["EVENT_BACKEND"] = "memory"
+os.environ.setdefault("AUTH_SECRET_KEY", "bench-secret-key")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+
+def prepare_work_db() -> None:
+    # 매 실행마다 생성된 데이터셋을 복사해서 쓰므로, 쓰기 벤치마크가 있어도 같은 상태에서 시작한다.
+    if not os.path.exists(DATASET_PATH):
+        raise SystemExit(f"데이터셋이 없습니다: {DATASET_PATH}\n먼저 `python -m bench.generate`를 실행하세요.")
+    
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(WORK_PATH + suffix):
+            os.remove(WORK_PATH + suffix)
+    shutil.copyfile(DATASET_PATH, WORK_PATH)
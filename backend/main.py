@@ -1,11 +1,18 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
 import logging
 
 from src.util.config import settings
-from src.util.database import get_db, init_db, check_db_connection
+from src.util.database import engine, async_engine
+from src.util.health import db_probe, pool_status
+from src.util.metrics import metrics, MetricsMiddleware
+from src.util.query_recorder import QueryLogMiddleware
+from src.util.password_hasher import password_hasher
 from src.router import api_gateway
+from src.service.itinerary_cache import itinerary_cache
+from src.service.plan_events import plan_events
+from src.service.membership_service import membership_cache
 
 logging.basicConfig(
     level=logging.INFO if not settings.debug else logging.DEBUG,
@@ -17,7 +24,8 @@ app = FastAPI(
     title="Travel Maker API",
     description="여행 계획 및 추천 서비스 API",
     version="1.0.0",
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(api_gateway.router)
@@ -30,12 +38,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(MetricsMiddleware)
+
+if settings.debug:
+    app.add_middleware(QueryLogMiddleware)
+
+
+def pool_metric(field: str):
+    return lambda: {
+        ("sync",): pool_status(engine.pool)[field],
+        ("async",): pool_status(async_engine.pool)[field],
+    }
+
+
+def cache_metric(field: str):
+    return lambda: {
+        ("itinerary",): itinerary_cache.stats()[field],
+        ("membership",): membership_cache.stats()[field],
+    }
+
+
+metrics.callback("db_pool_size", "커넥션 풀 기본 크기", ("engine",), "gauge", pool_metric("size"))
+metrics.callback("db_pool_checked_out", "사용 중인 커넥션 수", ("engine",), "gauge", pool_metric("checked_out"))
+metrics.callback("db_pool_overflow", "기본 크기를 넘어 연 커넥션 수 (음수면 남은 기본 풀)", ("engine",), "gauge", pool_metric("overflow"))
+metrics.callback("db_probe_latency_seconds", "마지막 DB 상태 확인 지연 시간", (), "gauge", lambda: {(): (db_probe.latency_ms or 0) / 1000})
+metrics.callback("db_probe_up", "마지막 DB 상태 확인 결과", (), "gauge", lambda: {(): int(db_probe.healthy)})
+metrics.callback("password_hasher_pending", "bcrypt 풀에서 실행 중이거나 대기 중인 작업 수", (), "gauge", lambda: {(): password_hasher.pending})
+metrics.callback("password_hasher_capacity", "bcrypt 풀이 받을 수 있는 최대 작업 수", (), "gauge", lambda: {(): password_hasher.max_workers + password_hasher.max_queue})
+metrics.callback("cache_hits_total", "캐시 적중 수", ("cache",), "counter", cache_metric("hits"))
+metrics.callback("cache_misses_total", "캐시 미스 수", ("cache",), "counter", cache_metric("misses"))
+metrics.callback("plan_event_subscribers", "플랜 이벤트 구독자 수", (), "gauge", lambda: {(): plan_events.stats()["subscribers"]})
+metrics.callback("plan_event_overflows_total", "큐가 가득 차 resync로 대체된 횟수", (), "counter", lambda: {(): plan_events.stats()["overflows"]})
+
 
 @app.on_event("startup")
 async def startup_event():
     logger.info("애플리케이션 시작 중...")
     
-    if check_db_connection():
+    if await db_probe.start():
         logger.info("데이터베이스 연결 성공")
     else:
         logger.warning("데이터베이스 연결 실패 - 서비스가 정상 작동하지 않을 수 있습니다")
@@ -44,6 +84,11 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("애플리케이션 종료 중...")
+    await db_probe.stop()
+    password_hasher.shutdown()
+    await plan_events.close()
+    await async_engine.dispose()
+    engine.dispose()
 
 
 @app.get("/")
@@ -56,8 +101,8 @@ async def root():
 
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
-    db_status = check_db_connection()
+async def health_check():
+    db_status = db_probe.healthy
     
     return {
         "status": "healthy" if db_status else "degraded",
@@ -66,6 +111,35 @@ async def health_check(db: Session = Depends(get_db)):
     }
 
 
+@app.get("/health/details")
+async def health_details():
+    return {
+        "status": "healthy" if db_probe.healthy else "degraded",
+        "database": db_probe.details(),
+        "version": "1.0.0"
+    }
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return {
+        "itinerary": itinerary_cache.stats(),
+        "membership": membership_cache.stats()
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/events/stats")
+async def event_stats():
+    return {
+        "plan_events": plan_events.stats()
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -0,0 +1,116 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2024-10-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("nickname", sa.String(length=40), nullable=False),
+        sa.Column("password", sa.String(length=200), nullable=False),
+        sa.Column("thumbnail", sa.String(length=1024), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "plans",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.String(length=512), nullable=True),
+        sa.Column("city_to_stay", sa.String(length=20), nullable=True),
+        sa.Column("init_latitude", sa.Double(), nullable=False),
+        sa.Column("init_longitude", sa.Double(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("created_user_id", sa.BigInteger(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), server_default="0", nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "users_in_plan",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("plan_id", sa.BigInteger(), nullable=False),
+        sa.Column("owner", sa.Boolean(), server_default="0", nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "markers",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("plan_id", sa.BigInteger(), nullable=False),
+        sa.Column("name", sa.String(length=20), nullable=True),
+        sa.Column("description", sa.String(length=512), nullable=True),
+        sa.Column("thumbnail", sa.String(length=512), nullable=True),
+        sa.Column("url", sa.String(length=512), nullable=True),
+        sa.Column("is_scheduled", sa.Boolean(), server_default="0", nullable=False),
+        sa.Column("created_user_id", sa.BigInteger(), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "day_schedules",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("plan_id", sa.BigInteger(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("start_time", sa.Time(), nullable=False),
+        sa.Column("end_time", sa.Time(), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "schedule_slots",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("day_schedule_id", sa.BigInteger(), nullable=False),
+        sa.Column("holding_marker_id", sa.BigInteger(), nullable=True),
+        sa.Column("name", sa.String(length=100), nullable=True),
+        sa.Column("spending_time", sa.Time(), nullable=False),
+        sa.Column("need_to_reservation", sa.Boolean(), server_default="0", nullable=False),
+        sa.Column("is_reserved", sa.Boolean(), server_default="0", nullable=False),
+        sa.Column("order_num", sa.Integer(), nullable=False),
+        *timestamps(),
+        sa.ForeignKeyConstraint(["day_schedule_id"], ["day_schedules.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "slot_voting",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("schedule_slot_id", sa.BigInteger(), nullable=False),
+        sa.Column("marker_id", sa.BigInteger(), nullable=False),
+        sa.Column("voted_user_id", sa.BigInteger(), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("slot_voting")
+    op.drop_table("schedule_slots")
+    op.drop_table("day_schedules")
+    op.drop_table("markers")
+    op.drop_table("users_in_plan")
+    op.drop_table("plans")
+    op.drop_table("users")
@@ -0,0 +1,159 @@
+"""production index set
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-10-01 00:00:00.000000
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.migration import add_index, drop_index
+
+
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("plans", "ix_plans_listing", ["is_deleted", "created_at", "id"], False),
+    ("users", "uq_users_nickname", ["nickname"], True),
+    ("users_in_plan", "uq_users_in_plan_user_plan", ["user_id", "plan_id"], True),
+    ("users_in_plan", "ix_users_in_plan_plan_id", ["plan_id"], False),
+    ("markers", "ix_markers_plan_id", ["plan_id"], False),
+    ("day_schedules", "uq_day_schedules_plan_date", ["plan_id", "date"], True),
+    ("schedule_slots", "ix_schedule_slots_day_order", ["day_schedule_id", "order_num"], False),
+    ("slot_voting", "uq_slot_voting_slot_user", ["schedule_slot_id", "voted_user_id"], True),
+]
+
+
+def check_duplicate_nicknames() -> None:
+    # 계정은 자동으로 합칠 수 없으므로, 중복 닉네임이 있으면 고유 인덱스를 만들기 전에 목록과 함께 중단한다.
+    users = sa.table("users", sa.column("id"), sa.column("nickname"))
+    duplicated = sa.select(users.c.nickname).group_by(users.c.nickname).having(sa.func.count() > 1)
+    rows = op.get_bind().execute(
+        sa.select(users.c.nickname, users.c.id).where(
+            users.c.nickname.in_(duplicated)
+        ).order_by(users.c.nickname, users.c.id)
+    ).all()
+    if rows:
+        user_ids = defaultdict(list)
+        for nickname, user_id in rows:
+            user_ids[nickname].append(str(user_id))
+        conflicts = ", ".join(f"{nickname!r} (users.id {', '.join(ids)})" for nickname, ids in user_ids.items())
+        raise RuntimeError(
+            f"중복된 닉네임이 있어 uq_users_nickname을 만들 수 없습니다: {conflicts}. "
+            "하나만 남기도록 닉네임을 변경한 뒤 마이그레이션을 다시 실행하세요."
+        )
+
+
+def dedupe_memberships() -> None:
+    # 동시 참가 요청으로 중복된 멤버십은 소유자 행을 우선으로, 그다음 먼저 저장된 행을 남긴다.
+    users_in_plan = sa.table(
+        "users_in_plan",
+        sa.column("id"),
+        sa.column("user_id"),
+        sa.column("plan_id"),
+        sa.column("owner"),
+    )
+    bind = op.get_bind()
+    groups = bind.execute(
+        sa.select(users_in_plan.c.user_id, users_in_plan.c.plan_id).group_by(
+            users_in_plan.c.user_id,
+            users_in_plan.c.plan_id,
+        ).having(sa.func.count() > 1)
+    ).all()
+    for user_id, plan_id in groups:
+        rows = bind.execute(
+            sa.select(users_in_plan.c.id).where(
+                users_in_plan.c.user_id == user_id,
+                users_in_plan.c.plan_id == plan_id,
+            ).order_by(users_in_plan.c.owner.desc(), users_in_plan.c.id)
+        ).scalars().all()
+        bind.execute(users_in_plan.delete().where(users_in_plan.c.id.in_(rows[1:])))
+
+
+def merge_duplicate_days() -> None:
+    # 같은 날짜로 중복 생성된 일정은 먼저 만든 일정으로 합친다. 옮겨 오는 슬롯은 기존 슬롯 뒤에 붙는다.
+    day_schedules = sa.table(
+        "day_schedules",
+        sa.column("id"),
+        sa.column("plan_id"),
+        sa.column("date"),
+    )
+    slots = sa.table(
+        "schedule_slots",
+        sa.column("day_schedule_id"),
+        sa.column("order_num"),
+    )
+    bind = op.get_bind()
+    groups = bind.execute(
+        sa.select(day_schedules.c.plan_id, day_schedules.c.date).group_by(
+            day_schedules.c.plan_id,
+            day_schedules.c.date,
+        ).having(sa.func.count() > 1)
+    ).all()
+    for plan_id, date in groups:
+        keep_id, *duplicate_ids = bind.execute(
+            sa.select(day_schedules.c.id).where(
+                day_schedules.c.plan_id == plan_id,
+                day_schedules.c.date == date,
+            ).order_by(day_schedules.c.id)
+        ).scalars().all()
+        for duplicate_id in duplicate_ids:
+            offset = bind.scalar(
+                sa.select(sa.func.coalesce(sa.func.max(slots.c.order_num), 0)).where(
+                    slots.c.day_schedule_id == keep_id
+                )
+            )
+            bind.execute(
+                slots.update().where(slots.c.day_schedule_id == duplicate_id).values(
+                    day_schedule_id=keep_id,
+                    order_num=slots.c.order_num + offset,
+                )
+            )
+        bind.execute(day_schedules.delete().where(day_schedules.c.id.in_(duplicate_ids)))
+
+
+def upgrade() -> None:
+    # 기준 스키마는 아래 고유 인덱스를 강제하지 않았으므로, 인덱스를 만들기 전에 중복 행을 정리한다.
+    check_duplicate_nicknames()
+    dedupe_memberships()
+    merge_duplicate_days()
+
+    # 동시 요청으로 생긴 중복 투표는 가장 먼저 저장된 투표만 남긴다.
+    slot_voting = sa.table(
+        "slot_voting",
+        sa.column("id"),
+        sa.column("schedule_slot_id"),
+        sa.column("voted_user_id"),
+    )
+    first_votes = sa.select(sa.func.min(slot_voting.c.id)).group_by(
+        slot_voting.c.schedule_slot_id,
+        slot_voting.c.voted_user_id,
+    )
+    op.execute(
+        slot_voting.delete().where(
+            slot_voting.c.id.not_in(sa.select(first_votes.subquery().c[0]))
+        )
+    )
+
+    for table_name, index_name, columns, unique in INDEXES:
+        add_index(table_name, index_name, columns, unique=unique)
+
+    add_index(
+        "plans", "ft_plans_search", ["name", "description", "city_to_stay"],
+        prefix="FULLTEXT", parser="ngram"
+    )
+
+
+def downgrade() -> None:
+    drop_index("plans", "ft_plans_search")
+
+    for table_name, index_name, _, _ in reversed(INDEXES):
+        drop_index(table_name, index_name)
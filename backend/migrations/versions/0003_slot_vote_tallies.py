@@ -0,0 +1,81 @@
+"""slot vote tallies
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-10-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.migration import has_table
+
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_table("slot_vote_tallies"):
+        create_tallies_table()
+
+    # create_all로 테이블이 먼저 만들어진 데이터베이스에는 그 이전 투표가 집계되어 있지 않다.
+    # 집계는 투표 행에서 다시 계산할 수 있으므로, 항상 비우고 전체를 다시 채운다.
+    backfill_tallies()
+
+
+def create_tallies_table() -> None:
+    op.create_table(
+        "slot_vote_tallies",
+        sa.Column("schedule_slot_id", sa.BigInteger(), nullable=False),
+        sa.Column("marker_id", sa.BigInteger(), nullable=False),
+        sa.Column("vote_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["schedule_slot_id"], ["schedule_slots.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("schedule_slot_id", "marker_id"),
+    )
+    op.create_index(
+        "ix_slot_vote_tallies_rank",
+        "slot_vote_tallies",
+        ["schedule_slot_id", "vote_count", "marker_id"],
+    )
+
+
+def backfill_tallies() -> None:
+    slot_voting = sa.table(
+        "slot_voting",
+        sa.column("schedule_slot_id"),
+        sa.column("marker_id"),
+    )
+    schedule_slots = sa.table("schedule_slots", sa.column("id"))
+    tallies = sa.table(
+        "slot_vote_tallies",
+        sa.column("schedule_slot_id"),
+        sa.column("marker_id"),
+        sa.column("vote_count"),
+    )
+    op.execute(tallies.delete())
+    op.execute(
+        tallies.insert().from_select(
+            ["schedule_slot_id", "marker_id", "vote_count"],
+            sa.select(
+                slot_voting.c.schedule_slot_id,
+                slot_voting.c.marker_id,
+                sa.func.count(),
+            ).where(
+                slot_voting.c.schedule_slot_id.in_(sa.select(schedule_slots.c.id))
+            ).group_by(
+                slot_voting.c.schedule_slot_id,
+                slot_voting.c.marker_id,
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_slot_vote_tallies_rank", table_name="slot_vote_tallies")
+    op.drop_table("slot_vote_tallies")
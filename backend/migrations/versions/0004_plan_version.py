@@ -0,0 +1,29 @@
+"""plan version
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-10-08 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # MySQL 8.0에서는 기본값이 있는 컬럼 추가가 INSTANT로 처리되어 테이블을 다시 쓰지 않는다.
+    op.add_column(
+        "plans",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("plans", "version")
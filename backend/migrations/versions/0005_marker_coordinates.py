@@ -0,0 +1,69 @@
+"""marker coordinates
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-10-12 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.migration import add_index, drop_index
+
+
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("markers", sa.Column("latitude", sa.Double(), nullable=True))
+    op.add_column("markers", sa.Column("longitude", sa.Double(), nullable=True))
+    
+    # 기존 마커는 좌표가 없으므로 플랜의 시작 좌표로 채운다.
+    markers = sa.table(
+        "markers",
+        sa.column("plan_id"),
+        sa.column("latitude"),
+        sa.column("longitude"),
+    )
+    plans = sa.table(
+        "plans",
+        sa.column("id"),
+        sa.column("init_latitude"),
+        sa.column("init_longitude"),
+    )
+    op.execute(
+        markers.update().values(
+            latitude=sa.select(plans.c.init_latitude).where(plans.c.id == markers.c.plan_id).scalar_subquery(),
+            longitude=sa.select(plans.c.init_longitude).where(plans.c.id == markers.c.plan_id).scalar_subquery(),
+        )
+    )
+    op.execute(
+        markers.update().where(markers.c.latitude.is_(None)).values(latitude=0, longitude=0)
+    )
+    
+    with op.batch_alter_table("markers") as batch_op:
+        batch_op.alter_column("latitude", existing_type=sa.Double(), nullable=False)
+        batch_op.alter_column("longitude", existing_type=sa.Double(), nullable=False)
+    
+    if op.get_bind().dialect.name == "mysql":
+        # SPATIAL 인덱스는 NOT NULL이고 SRID가 지정된 기하 컬럼에만 만들 수 있다.
+        op.execute(
+            "ALTER TABLE markers ADD COLUMN location POINT SRID 0 "
+            "GENERATED ALWAYS AS (POINT(longitude, latitude)) STORED NOT NULL"
+        )
+        add_index("markers", "sp_markers_location", ["location"], prefix="SPATIAL")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "mysql":
+        drop_index("markers", "sp_markers_location")
+        op.drop_column("markers", "location")
+    
+    with op.batch_alter_table("markers") as batch_op:
+        batch_op.drop_column("longitude")
+        batch_op.drop_column("latitude")
@@ -0,0 +1,62 @@
+"""day planned seconds
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-10-15 00:00:00.000000
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.time_budget import seconds_of
+
+
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "day_schedules",
+        sa.Column("planned_seconds", sa.Integer(), server_default="0", nullable=False),
+    )
+    
+    # 기존 일정의 슬롯 시간 합계를 채운다.
+    bind = op.get_bind()
+    if bind.dialect.name == "mysql":
+        op.execute(
+            "UPDATE day_schedules d "
+            "JOIN (SELECT day_schedule_id, SUM(TIME_TO_SEC(spending_time)) AS total "
+            "FROM schedule_slots GROUP BY day_schedule_id) s ON s.day_schedule_id = d.id "
+            "SET d.planned_seconds = s.total"
+        )
+        return
+    
+    slots = sa.table(
+        "schedule_slots",
+        sa.column("day_schedule_id"),
+        sa.column("spending_time", sa.Time()),
+    )
+    day_schedules = sa.table(
+        "day_schedules",
+        sa.column("id"),
+        sa.column("planned_seconds"),
+    )
+    
+    totals = defaultdict(int)
+    for day_schedule_id, spending_time in bind.execute(sa.select(slots.c.day_schedule_id, slots.c.spending_time)):
+        totals[day_schedule_id] += seconds_of(spending_time)
+    
+    for day_schedule_id, total in totals.items():
+        bind.execute(
+            day_schedules.update().where(day_schedules.c.id == day_schedule_id).values(planned_seconds=total)
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("day_schedules", "planned_seconds")
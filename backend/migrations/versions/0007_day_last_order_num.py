@@ -0,0 +1,54 @@
+"""day last order num
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.config import settings
+
+
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "day_schedules",
+        sa.Column("last_order_num", sa.Integer(), server_default="0", nullable=False),
+    )
+    
+    # 기존 순번의 최댓값으로 채우되, 전체 재정렬(슬롯 수 x 간격)보다 작아지지 않게 한다.
+    slots = sa.table(
+        "schedule_slots",
+        sa.column("day_schedule_id"),
+        sa.column("order_num"),
+    )
+    day_schedules = sa.table(
+        "day_schedules",
+        sa.column("id"),
+        sa.column("last_order_num"),
+    )
+    
+    max_order = sa.func.coalesce(sa.func.max(slots.c.order_num), 0)
+    respaced_order = sa.func.count() * settings.slot_order_gap
+    op.execute(
+        day_schedules.update().values(
+            last_order_num=sa.select(
+                sa.case((max_order > respaced_order, max_order), else_=respaced_order)
+            ).where(
+                slots.c.day_schedule_id == day_schedules.c.id
+            ).scalar_subquery()
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("day_schedules", "last_order_num")
@@ -0,0 +1,59 @@
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from src.schema.day_schedule import ItineraryImportRequest
+from src.service.itinerary_import_service import import_itinerary, parse_itinerary_csv
+from src.util.database import session_scope, engine, async_engine
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="일정(JSON 또는 CSV)을 플랜에 한 번에 가져옵니다.")
+    parser.add_argument("path", type=Path, help="가져올 파일 경로 (.json 또는 .csv)")
+    parser.add_argument("--plan-id", type=int, help="대상 플랜 ID (CSV는 필수, JSON은 파일의 plan_id를 덮어씀)")
+    return parser.parse_args()
+
+
+def load_import_data(path: Path, plan_id: int) -> ItineraryImportRequest:
+    if path.suffix.lower() == ".csv":
+        if plan_id is None:
+            raise SystemExit("CSV 파일은 --plan-id가 필요합니다.")
+        return parse_itinerary_csv(plan_id, path.read_bytes())
+    
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if plan_id is not None:
+        data["plan_id"] = plan_id
+    return ItineraryImportRequest.model_validate(data)
+
+
+async def run(path: Path, plan_id: int) -> int:
+    try:
+        import_data = load_import_data(path, plan_id)
+        
+        async with session_scope() as db:
+            result = await import_itinerary(db, import_data)
+    except HTTPException as e:
+        print(f"가져오기 실패: {e.detail}", file=sys.stderr)
+        return 1
+    except ValidationError as e:
+        print(f"가져오기 실패: {e}", file=sys.stderr)
+        return 1
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+    
+    print(f"{result.message} (일정 {result.day_count}개, 슬롯 {result.slot_count}개)")
+    return 0
+
+
+def main() -> None:
+    args = parse_args()
+    sys.exit(asyncio.run(run(args.path, args.plan_id)))
+
+
+if __name__ == "__main__":
+    main()
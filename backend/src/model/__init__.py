@@ -5,6 +5,7 @@ from src.model.marker import Marker
 from src.model.day_schedule import DaySchedule
 from src.model.schedule_slot import ScheduleSlot
 from src.model.slot_voting import SlotVoting
+from src.model.slot_vote_tally import SlotVoteTally
 
 __all__ = [
     "User",
@@ -14,5 +15,6 @@ __all__ = [
     "DaySchedule",
     "ScheduleSlot",
     "SlotVoting",
+    "SlotVoteTally",
 ]
 
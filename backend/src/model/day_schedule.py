@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Time, DateTime, Date
+from sqlalchemy import Column, BigInteger, Integer, Time, DateTime, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.util.database import Base
@@ -6,14 +6,28 @@ from src.util.database import Base
 
 class DaySchedule(Base):
     __tablename__ = "day_schedules"
+    __table_args__ = (
+        Index("uq_day_schedules_plan_date", "plan_id", "date", unique=True),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     plan_id = Column(BigInteger, nullable=False)
     date = Column(Date, nullable=False)
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
+    # 슬롯 spending_time 합계(초). 슬롯 생성/수정/삭제 시 차이만큼 더해 갱신한다.
+    planned_seconds = Column(Integer, nullable=False, server_default="0")
+    # 이 일정의 슬롯 order_num 최댓값 이상인 값. 슬롯을 추가할 때 이 값을 올려 새 슬롯의 순번으로 쓴다.
+    last_order_num = Column(Integer, nullable=False, server_default="0")
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     
-    schedule_slots = relationship("ScheduleSlot", cascade="all, delete-orphan")
+    # 존재 확인이나 권한 확인처럼 일정만 읽는 곳에서 슬롯까지 읽지 않도록 기본은 지연 로딩을 막는다.
+    # 슬롯을 응답에 담는 곳에서만 selectinload로 읽는다.
+    schedule_slots = relationship(
+        "ScheduleSlot",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        order_by="ScheduleSlot.order_num"
+    )
 
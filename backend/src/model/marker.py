@@ -1,10 +1,15 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, DateTime
+from sqlalchemy import Column, BigInteger, String, Boolean, DateTime, Double, Index
 from sqlalchemy.sql import func
 from src.util.database import Base
 
 
 class Marker(Base):
+    # MySQL에서는 마이그레이션이 (longitude, latitude)로 계산되는 POINT 컬럼 location과
+    # SPATIAL 인덱스 sp_markers_location을 추가한다. 모델에는 선언하지 않는다.
     __tablename__ = "markers"
+    __table_args__ = (
+        Index("ix_markers_plan_id", "plan_id"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     plan_id = Column(BigInteger, nullable=False)
@@ -12,6 +17,8 @@ class Marker(Base):
     description = Column(String(512), nullable=True)
     thumbnail = Column(String(512), nullable=True)
     url = Column(String(512), nullable=True)
+    latitude = Column(Double, nullable=False)
+    longitude = Column(Double, nullable=False)
     is_scheduled = Column(Boolean, nullable=False, server_default="0")
     created_user_id = Column(BigInteger, nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -1,10 +1,17 @@
-from sqlalchemy import Column, BigInteger, String, Double, Date, DateTime, Boolean
+from sqlalchemy import Column, BigInteger, Integer, String, Double, Date, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from src.util.database import Base
 
 
 class Plan(Base):
     __tablename__ = "plans"
+    __table_args__ = (
+        Index("ix_plans_listing", "is_deleted", "created_at", "id"),
+        Index(
+            "ft_plans_search", "name", "description", "city_to_stay",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram"
+        ).ddl_if(dialect="mysql"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)
@@ -16,6 +23,7 @@ class Plan(Base):
     end_date = Column(Date, nullable=False)
     created_user_id = Column(BigInteger, nullable=False)
     is_deleted = Column(Boolean, nullable=False, server_default="0")
+    version = Column(Integer, nullable=False, server_default="1")
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
 
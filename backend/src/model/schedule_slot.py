@@ -1,10 +1,14 @@
-from sqlalchemy import Column, BigInteger, String, Time, Integer, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, BigInteger, String, Time, Integer, DateTime, ForeignKey, Boolean, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.util.database import Base
 
 
 class ScheduleSlot(Base):
     __tablename__ = "schedule_slots"
+    __table_args__ = (
+        Index("ix_schedule_slots_day_order", "day_schedule_id", "order_num"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     day_schedule_id = Column(BigInteger, ForeignKey('day_schedules.id', ondelete='CASCADE'), nullable=False)
@@ -16,4 +20,11 @@ class ScheduleSlot(Base):
     order_num = Column(Integer, nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    
+    vote_tallies = relationship(
+        "SlotVoteTally",
+        viewonly=True,
+        lazy="raise",
+        order_by="[SlotVoteTally.vote_count.desc(), SlotVoteTally.marker_id]"
+    )
 
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, BigInteger, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from src.util.database import Base
+
+
+class SlotVoteTally(Base):
+    __tablename__ = "slot_vote_tallies"
+    __table_args__ = (
+        Index("ix_slot_vote_tallies_rank", "schedule_slot_id", "vote_count", "marker_id"),
+    )
+
+    schedule_slot_id = Column(BigInteger, ForeignKey('schedule_slots.id', ondelete='CASCADE'), primary_key=True)
+    marker_id = Column(BigInteger, primary_key=True)
+    vote_count = Column(Integer, nullable=False, server_default="0")
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
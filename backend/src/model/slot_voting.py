@@ -1,10 +1,13 @@
-from sqlalchemy import Column, BigInteger, DateTime
+from sqlalchemy import Column, BigInteger, DateTime, Index
 from sqlalchemy.sql import func
 from src.util.database import Base
 
 
 class SlotVoting(Base):
     __tablename__ = "slot_voting"
+    __table_args__ = (
+        Index("uq_slot_voting_slot_user", "schedule_slot_id", "voted_user_id", unique=True),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     schedule_slot_id = Column(BigInteger, nullable=False)
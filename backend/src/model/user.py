@@ -1,10 +1,13 @@
-from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
 from sqlalchemy.sql import func
 from src.util.database import Base
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("uq_users_nickname", "nickname", unique=True),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     nickname = Column(String(40), nullable=False)
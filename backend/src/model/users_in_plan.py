@@ -1,10 +1,14 @@
-from sqlalchemy import Column, BigInteger, Boolean, DateTime
+from sqlalchemy import Column, BigInteger, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from src.util.database import Base
 
 
 class UsersInPlan(Base):
     __tablename__ = "users_in_plan"
+    __table_args__ = (
+        Index("uq_users_in_plan_user_plan", "user_id", "plan_id", unique=True),
+        Index("ix_users_in_plan_plan_id", "plan_id"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, nullable=False)
@@ -1,33 +1,76 @@
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, status, Query, Header, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from src.util.auth import get_current_user_id
 from src.util.database import get_db
-from src.schema.day_schedule import DayScheduleCreateRequest, DayScheduleUpdateRequest, DayScheduleResponse
-from src.service.day_schedule_service import create_day_schedule, get_day_schedules_by_plan, update_day_schedule, delete_day_schedule
+from src.util.etag import make_etag, etag_matches, not_modified
+from src.schema.day_schedule import DayScheduleCreateRequest, DayScheduleUpdateRequest, DayScheduleResponse, ItineraryImportRequest, ItineraryImportResponse
+from src.service.day_schedule_service import create_day_schedule, get_day_schedules_json, update_day_schedule, delete_day_schedule
+from src.service.itinerary_cache import get_plan_version
+from src.service.membership_service import ensure_plan_member, require_day_member, require_plan_member
+from src.service.itinerary_import_service import import_itinerary, parse_itinerary_csv
 
 router = APIRouter()
 
 
 @router.post("", response_model=DayScheduleResponse, status_code=status.HTTP_201_CREATED)
-def create_new_day_schedule(schedule_data: DayScheduleCreateRequest, db: Session = Depends(get_db)):
-    schedule = create_day_schedule(db, schedule_data)
+async def create_new_day_schedule(
+    schedule_data: DayScheduleCreateRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_plan_member(db, schedule_data.plan_id, user_id)
+    schedule = await create_day_schedule(db, schedule_data)
     return schedule
 
 
-@router.get("", response_model=List[DayScheduleResponse])
-def get_day_schedules(plan_id: int = Query(...), db: Session = Depends(get_db)):
-    schedules = get_day_schedules_by_plan(db, plan_id)
-    return schedules
+@router.post("/import", response_model=ItineraryImportResponse, status_code=status.HTTP_201_CREATED)
+async def import_day_schedules(
+    import_data: ItineraryImportRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_plan_member(db, import_data.plan_id, user_id)
+    result = await import_itinerary(db, import_data)
+    return result
 
 
-@router.put("/{schedule_id}", response_model=DayScheduleResponse)
-def update_existing_day_schedule(schedule_id: int, schedule_data: DayScheduleUpdateRequest, db: Session = Depends(get_db)):
-    schedule = update_day_schedule(db, schedule_id, schedule_data)
+@router.post(
+    "/import/csv",
+    response_model=ItineraryImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_plan_member)]
+)
+async def import_day_schedules_csv(request: Request, plan_id: int = Query(...), db: AsyncSession = Depends(get_db)):
+    import_data = parse_itinerary_csv(plan_id, await request.body())
+    result = await import_itinerary(db, import_data)
+    return result
+
+
+@router.get("", response_model=List[DayScheduleResponse], dependencies=[Depends(require_plan_member)])
+async def get_day_schedules(
+    plan_id: int = Query(...),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    version = await get_plan_version(db, plan_id)
+    etag = make_etag(f"{plan_id}-{version}")
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    body = await get_day_schedules_json(db, plan_id, version)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@router.put("/{schedule_id}", response_model=DayScheduleResponse, dependencies=[Depends(require_day_member)])
+async def update_existing_day_schedule(schedule_id: int, schedule_data: DayScheduleUpdateRequest, db: AsyncSession = Depends(get_db)):
+    schedule = await update_day_schedule(db, schedule_id, schedule_data)
     return schedule
 
 
-@router.delete("/{schedule_id}")
-def delete_existing_day_schedule(schedule_id: int, db: Session = Depends(get_db)):
-    result = delete_day_schedule(db, schedule_id)
+@router.delete("/{schedule_id}", dependencies=[Depends(require_day_member)])
+async def delete_existing_day_schedule(schedule_id: int, db: AsyncSession = Depends(get_db)):
+    result = await delete_day_schedule(db, schedule_id)
     return {"success": result, "message": "일정이 삭제되었습니다."}
 
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Depends, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from src.util.auth import get_current_user_id
+from src.util.database import get_db
+from src.util.response import adapter_response
+from src.schema.marker import (
+    MarkerCreateRequest,
+    MarkerUpdateRequest,
+    MarkerResponse,
+    NearbyMarkerResponse,
+    marker_list_adapter,
+    nearby_marker_list_adapter
+)
+from src.service.membership_service import ensure_plan_member, require_marker_member, require_plan_member
+from src.service.marker_service import (
+    create_marker,
+    get_markers_by_plan,
+    get_markers_in_viewport,
+    get_nearby_markers,
+    update_marker,
+    delete_marker
+)
+
+router = APIRouter()
+
+
+@router.post("", response_model=MarkerResponse, status_code=status.HTTP_201_CREATED)
+async def create_new_marker(
+    marker_data: MarkerCreateRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_plan_member(db, marker_data.plan_id, user_id)
+    marker = await create_marker(db, user_id, marker_data)
+    return marker
+
+
+@router.get("", response_model=List[MarkerResponse], dependencies=[Depends(require_plan_member)])
+async def get_markers(plan_id: int = Query(...), db: AsyncSession = Depends(get_db)):
+    markers = await get_markers_by_plan(db, plan_id)
+    return adapter_response(marker_list_adapter, markers)
+
+
+@router.get("/viewport", response_model=List[MarkerResponse], dependencies=[Depends(require_plan_member)])
+async def get_viewport_markers(
+    plan_id: int = Query(...),
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lng: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lng: float = Query(..., ge=-180, le=180),
+    db: AsyncSession = Depends(get_db)
+):
+    markers = await get_markers_in_viewport(db, plan_id, min_lat, max_lat, min_lng, max_lng)
+    return adapter_response(marker_list_adapter, markers)
+
+
+@router.get("/nearby", response_model=List[NearbyMarkerResponse], dependencies=[Depends(require_plan_member)])
+async def get_nearby(
+    plan_id: int = Query(...),
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    k: int = Query(10, ge=1),
+    db: AsyncSession = Depends(get_db)
+):
+    markers = await get_nearby_markers(db, plan_id, lat, lng, k)
+    return adapter_response(nearby_marker_list_adapter, markers)
+
+
+@router.put("/{marker_id}", response_model=MarkerResponse, dependencies=[Depends(require_marker_member)])
+async def update_existing_marker(marker_id: int, marker_data: MarkerUpdateRequest, db: AsyncSession = Depends(get_db)):
+    marker = await update_marker(db, marker_id, marker_data)
+    return marker
+
+
+@router.delete("/{marker_id}", dependencies=[Depends(require_marker_member)])
+async def delete_existing_marker(marker_id: int, db: AsyncSession = Depends(get_db)):
+    result = await delete_marker(db, marker_id)
+    return {"success": result, "message": "마커가 삭제되었습니다."}
@@ -1,56 +1,196 @@
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from src.util.database import get_db
-from src.schema.plan import PlanCreateRequest, PlanUpdateRequest, PlanResponse
-from src.service.plan_service import create_plan, get_plans_by_user, get_all_plans, update_plan, delete_plan, join_plan, transfer_ownership
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, WebSocket
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from src.util.auth import require_admin, get_current_user_id, get_stream_user_id, bearer_token, user_id_from_token
+from src.util.database import get_db, session_scope
+from src.util.etag import hash_etag, etag_matches, not_modified
+from src.util.response import adapter_response
+from src.schema.plan import (
+    PlanCreateRequest,
+    PlanUpdateRequest,
+    PlanResponse,
+    PlanListResponse,
+    PlanItineraryResponse,
+    plan_list_adapter,
+    plan_itinerary_adapter
+)
+from src.service.export_service import export_ndjson
+from src.service.itinerary_cache import get_plan_version
+from src.service.membership_service import ensure_plan_member, require_plan_member, require_plan_owner
+from src.service.plan_events import plan_event_stream
+from src.service.plan_service import create_plan, get_plan_keys_by_user, get_all_plan_keys, load_plans, get_plan_itinerary, update_plan, delete_plan, join_plan, transfer_ownership
 
 router = APIRouter()
 
 
-@router.post("", response_model=PlanResponse, status_code=status.HTTP_201_CREATED)
-def create_new_plan(plan_data: PlanCreateRequest, db: Session = Depends(get_db)):
-    plan = create_plan(db, plan_data)
-    return plan
+def plan_list_etag(plans, next_cursor: Optional[str]) -> str:
+    return hash_etag([(plan.id, plan.version) for plan in plans], next_cursor)
 
 
-@router.get("/all", response_model=List[PlanResponse])
-def get_all_plans_list(keyword: Optional[str] = Query(None), db: Session = Depends(get_db)):
-    plans = get_all_plans(db, keyword)
-    return plans
+@router.post("", response_model=PlanResponse, status_code=status.HTTP_201_CREATED)
+async def create_new_plan(
+    plan_data: PlanCreateRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    plan = await create_plan(db, user_id, plan_data)
+    return plan
 
 
-@router.get("", response_model=List[PlanResponse])
-def get_plans(user_id: int = Query(...), db: Session = Depends(get_db)):
-    plans = get_plans_by_user(db, user_id)
-    return plans
+@router.get("/all", response_model=PlanListResponse)
+async def get_all_plans_list(
+    keyword: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    keys, next_cursor = await get_all_plan_keys(db, keyword, cursor, limit)
+    etag = plan_list_etag(keys, next_cursor)
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    plans = await load_plans(db, keys, next_cursor)
+    return adapter_response(plan_list_adapter, plans, headers={"ETag": plan_list_etag(plans.items, next_cursor)})
+
+
+@router.get("", response_model=PlanListResponse)
+async def get_plans(
+    user_id: int = Depends(get_current_user_id),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    keys, next_cursor = await get_plan_keys_by_user(db, user_id, cursor, limit)
+    etag = plan_list_etag(keys, next_cursor)
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    plans = await load_plans(db, keys, next_cursor)
+    return adapter_response(plan_list_adapter, plans, headers={"ETag": plan_list_etag(plans.items, next_cursor)})
+
+
+@router.get("/export", dependencies=[Depends(require_admin)])
+async def export_all_plans():
+    return StreamingResponse(
+        export_ndjson(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="plans.ndjson"'}
+    )
+
+
+@router.get("/{plan_id}/export", dependencies=[Depends(require_plan_member)])
+async def export_plan(plan_id: int, db: AsyncSession = Depends(get_db)):
+    await get_plan_version(db, plan_id)
+    
+    return StreamingResponse(
+        export_ndjson(plan_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="plan-{plan_id}.ndjson"'}
+    )
+
+
+@router.get("/{plan_id}/events")
+async def stream_plan_events(
+    plan_id: int,
+    user_id: int = Depends(get_stream_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_plan_member(db, plan_id, user_id)
+    version = await get_plan_version(db, plan_id)
+    
+    async def sse():
+        async for message in plan_event_stream(plan_id, version, user_id):
+            yield b": ping\n\n" if message is None else b"data: " + message + b"\n\n"
+    
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/{plan_id}/ws")
+async def plan_events_websocket(websocket: WebSocket, plan_id: int):
+    try:
+        user_id = user_id_from_token(
+            bearer_token(websocket.headers.get("authorization")) or websocket.query_params.get("access_token")
+        )
+        async with session_scope() as db:
+            await ensure_plan_member(db, plan_id, user_id)
+            version = await get_plan_version(db, plan_id)
+    except HTTPException as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+        return
+    
+    await websocket.accept()
+    
+    # 클라이언트 메시지는 사용하지 않지만, 연결 종료를 바로 알기 위해 계속 받는다.
+    receiver = asyncio.create_task(websocket.receive())
+    stream = plan_event_stream(plan_id, version, user_id)
+    sender = asyncio.create_task(anext(stream))
+    
+    try:
+        while True:
+            done, _ = await asyncio.wait({receiver, sender}, return_when=asyncio.FIRST_COMPLETED)
+            
+            if receiver in done:
+                if receiver.result()["type"] == "websocket.disconnect":
+                    break
+                receiver = asyncio.create_task(websocket.receive())
+            
+            if sender in done:
+                try:
+                    message = sender.result()
+                except StopAsyncIteration:
+                    # 플랜이 삭제되었거나 더 이상 멤버가 아니다.
+                    await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="플랜 멤버만 접근할 수 있습니다.")
+                    break
+                await websocket.send_text(message.decode() if message is not None else '{"type":"ping"}')
+                sender = asyncio.create_task(anext(stream))
+    finally:
+        receiver.cancel()
+        sender.cancel()
+        await asyncio.gather(receiver, sender, return_exceptions=True)
+        await stream.aclose()
+
+
+@router.get("/{plan_id}/itinerary", response_model=PlanItineraryResponse, dependencies=[Depends(require_plan_member)])
+async def get_itinerary(plan_id: int, db: AsyncSession = Depends(get_db)):
+    itinerary = await get_plan_itinerary(db, plan_id)
+    return adapter_response(plan_itinerary_adapter, itinerary)
 
 
 @router.post("/{plan_id}/join")
-def join_existing_plan(plan_id: int, user_id: int = Query(...), db: Session = Depends(get_db)):
-    result = join_plan(db, plan_id, user_id)
+async def join_existing_plan(plan_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
+    result = await join_plan(db, plan_id, user_id)
     return {"success": True, "message": "플랜에 참가했습니다.", "users_in_plan_id": result.id}
 
 
 @router.post("/{plan_id}/transfer")
-def transfer_plan_ownership(
+async def transfer_plan_ownership(
     plan_id: int, 
-    old_owner: int = Query(...), 
     new_owner: int = Query(...), 
-    db: Session = Depends(get_db)
+    user_id: int = Depends(require_plan_owner),
+    db: AsyncSession = Depends(get_db)
 ):
-    result = transfer_ownership(db, plan_id, old_owner, new_owner)
+    result = await transfer_ownership(db, plan_id, user_id, new_owner)
     return {"success": result, "message": "소유자가 변경되었습니다."}
 
 
-@router.put("/{plan_id}", response_model=PlanResponse)
-def update_existing_plan(plan_id: int, plan_data: PlanUpdateRequest, db: Session = Depends(get_db)):
-    plan = update_plan(db, plan_id, plan_data)
+@router.put("/{plan_id}", response_model=PlanResponse, dependencies=[Depends(require_plan_owner)])
+async def update_existing_plan(plan_id: int, plan_data: PlanUpdateRequest, db: AsyncSession = Depends(get_db)):
+    plan = await update_plan(db, plan_id, plan_data)
     return plan
 
 
 @router.delete("/{plan_id}")
-def delete_existing_plan(plan_id: int, user_id: int = Query(...), db: Session = Depends(get_db)):
-    result = delete_plan(db, plan_id, user_id)
+async def delete_existing_plan(plan_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
+    result = await delete_plan(db, plan_id, user_id)
     return {"success": result, "message": "플랜이 삭제되었습니다."}
 
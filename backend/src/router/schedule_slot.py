@@ -1,58 +1,125 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from src.util.auth import get_current_user_id
 from src.util.database import get_db
+from src.util.response import adapter_response
 from src.schema.schedule_slot import (
     ScheduleSlotCreateRequest, 
     ScheduleSlotUpdateRequest, 
     ScheduleSlotResponse,
     ReorderSlotsRequest,
-    VoteSlotRequest
+    MoveSlotRequest,
+    VoteSlotRequest,
+    BatchVoteRequest,
+    SuggestSlotOrderRequest,
+    SuggestSlotOrderResponse,
+    VoteTallyResponse,
+    schedule_slot_list_adapter,
+    vote_tally_list_adapter
 )
+from src.service.membership_service import ensure_plan_member, ensure_slot_member, get_day_plan_id, require_slot_member
 from src.service.schedule_slot_service import (
     create_schedule_slot,
     update_schedule_slot,
     delete_schedule_slot,
     reorder_schedule_slots,
+    move_schedule_slot,
     confirm_schedule_slot,
-    vote_schedule_slot
+    suggest_slot_order,
+    vote_schedule_slot,
+    vote_schedule_slots,
+    get_vote_tallies
 )
 
 router = APIRouter()
 
 
 @router.post("", response_model=ScheduleSlotResponse, status_code=status.HTTP_201_CREATED)
-def create_new_schedule_slot(slot_data: ScheduleSlotCreateRequest, db: Session = Depends(get_db)):
-    slot = create_schedule_slot(db, slot_data)
+async def create_new_schedule_slot(
+    slot_data: ScheduleSlotCreateRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_plan_member(db, await get_day_plan_id(db, slot_data.day_schedule_id), user_id)
+    slot = await create_schedule_slot(db, slot_data)
     return slot
 
 
-@router.put("/{slot_id}", response_model=ScheduleSlotResponse)
-def update_existing_schedule_slot(slot_id: int, slot_data: ScheduleSlotUpdateRequest, db: Session = Depends(get_db)):
-    slot = update_schedule_slot(db, slot_id, slot_data)
+@router.put("/{slot_id}", response_model=ScheduleSlotResponse, dependencies=[Depends(require_slot_member)])
+async def update_existing_schedule_slot(slot_id: int, slot_data: ScheduleSlotUpdateRequest, db: AsyncSession = Depends(get_db)):
+    slot = await update_schedule_slot(db, slot_id, slot_data)
     return slot
 
 
-@router.delete("/{slot_id}")
-def delete_existing_schedule_slot(slot_id: int, db: Session = Depends(get_db)):
-    result = delete_schedule_slot(db, slot_id)
+@router.delete("/{slot_id}", dependencies=[Depends(require_slot_member)])
+async def delete_existing_schedule_slot(slot_id: int, db: AsyncSession = Depends(get_db)):
+    result = await delete_schedule_slot(db, slot_id)
     return {"success": result, "message": "슬롯이 삭제되었습니다."}
 
 
 @router.post("/reorder", response_model=List[ScheduleSlotResponse])
-def reorder_slots(reorder_data: ReorderSlotsRequest, db: Session = Depends(get_db)):
-    slots = reorder_schedule_slots(db, reorder_data.day_schedule_id, reorder_data.slot_ids)
-    return slots
+async def reorder_slots(
+    reorder_data: ReorderSlotsRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_plan_member(db, await get_day_plan_id(db, reorder_data.day_schedule_id), user_id)
+    slots = await reorder_schedule_slots(db, reorder_data.day_schedule_id, reorder_data.slot_ids)
+    return adapter_response(schedule_slot_list_adapter, slots)
 
 
-@router.post("/{slot_id}/confirm", response_model=ScheduleSlotResponse)
-def confirm_slot(slot_id: int, db: Session = Depends(get_db)):
-    slot = confirm_schedule_slot(db, slot_id)
+@router.post("/suggest-order", response_model=SuggestSlotOrderResponse)
+async def suggest_order(
+    suggest_data: SuggestSlotOrderRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_plan_member(db, await get_day_plan_id(db, suggest_data.day_schedule_id), user_id)
+    suggestion = await suggest_slot_order(db, suggest_data)
+    return suggestion
+
+
+@router.post("/{slot_id}/move", response_model=ScheduleSlotResponse, dependencies=[Depends(require_slot_member)])
+async def move_slot(
+    slot_id: int,
+    move_data: MoveSlotRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
+    slot = await move_schedule_slot(db, slot_id, move_data, background_tasks)
+    return slot
+
+
+@router.post("/{slot_id}/confirm", response_model=ScheduleSlotResponse, dependencies=[Depends(require_slot_member)])
+async def confirm_slot(slot_id: int, db: AsyncSession = Depends(get_db)):
+    slot = await confirm_schedule_slot(db, slot_id)
     return slot
 
 
 @router.post("/vote")
-def vote_slot(vote_data: VoteSlotRequest, db: Session = Depends(get_db)):
-    result = vote_schedule_slot(db, vote_data.schedule_slot_id, vote_data.marker_id, vote_data.user_id)
+async def vote_slot(
+    vote_data: VoteSlotRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_slot_member(db, [vote_data.schedule_slot_id], user_id)
+    result = await vote_schedule_slot(db, vote_data.schedule_slot_id, vote_data.marker_id, user_id)
     return {"success": True, "message": "투표가 완료되었습니다.", "vote_id": result.id}
 
+
+@router.post("/votes:batch")
+async def vote_slots_batch(
+    batch_data: BatchVoteRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await ensure_slot_member(db, [vote.schedule_slot_id for vote in batch_data.votes], user_id)
+    count = await vote_schedule_slots(db, user_id, batch_data.votes)
+    return {"success": True, "message": "투표가 완료되었습니다.", "count": count}
+
+
+@router.get("/{slot_id}/votes", response_model=List[VoteTallyResponse], dependencies=[Depends(require_slot_member)])
+async def get_slot_votes(slot_id: int, db: AsyncSession = Depends(get_db)):
+    tallies = await get_vote_tallies(db, slot_id)
+    return adapter_response(vote_tally_list_adapter, tallies)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.util.database import get_db
 from src.schema.user import UserSignupRequest, UserLoginRequest, UserLoginResponse, UserResponse
 from src.service.user_service import create_user, login_user
@@ -8,13 +8,13 @@ router = APIRouter()
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def signup(user_data: UserSignupRequest, db: Session = Depends(get_db)):
-    user = create_user(db, user_data)
+async def signup(user_data: UserSignupRequest, db: AsyncSession = Depends(get_db)):
+    user = await create_user(db, user_data)
     return user
 
 
 @router.post("/login", response_model=UserLoginResponse)
-def login(login_data: UserLoginRequest, db: Session = Depends(get_db)):
-    result = login_user(db, login_data)
+async def login(login_data: UserLoginRequest, db: AsyncSession = Depends(get_db)):
+    result = await login_user(db, login_data)
     return result
 
@@ -1,22 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 from datetime import time, date, datetime
 from typing import Optional, List
-
-
-class ScheduleSlotResponse(BaseModel):
-    id: int
-    day_schedule_id: int
-    holding_marker_id: Optional[int]
-    name: Optional[str]
-    spending_time: time
-    need_to_reservation: bool
-    is_reserved: bool
-    order_num: int
-    created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True
+from src.schema.schedule_slot import ScheduleSlotResponse
+from src.util.time_budget import seconds_of, time_of
 
 
 class DayScheduleCreateRequest(BaseModel):
@@ -26,10 +12,52 @@ class DayScheduleCreateRequest(BaseModel):
     end_time: time
 
 
+DateType = date
+
+
 class DayScheduleUpdateRequest(BaseModel):
-    date: Optional[date] = None
-    start_time: Optional[time] = None
-    end_time: Optional[time] = None
+    # 필드 이름 date가 타입 date를 가리지 않도록 별칭(DateType)으로 선언한다.
+    date: DateType = Field(None)
+    start_time: time = Field(None)
+    end_time: time = Field(None)
+    
+    @field_validator("date", "start_time", "end_time", mode="before")
+    @classmethod
+    def reject_null(cls, value):
+        # 생략할 수는 있지만 null로 지울 수는 없다. (NOT NULL 컬럼)
+        if value is None:
+            raise ValueError("null일 수 없습니다.")
+        return value
+
+
+class ImportSlotRequest(BaseModel):
+    name: Optional[str] = Field(None, max_length=100)
+    spending_time: time
+    need_to_reservation: bool = False
+
+
+class ImportDayRequest(BaseModel):
+    date: date
+    start_time: time
+    end_time: time
+    schedule_slots: List[ImportSlotRequest] = []
+
+
+class ItineraryImportRequest(BaseModel):
+    plan_id: int
+    day_schedules: List[ImportDayRequest] = Field(..., min_length=1, max_length=366)
+
+
+class ItineraryImportResponse(BaseModel):
+    success: bool
+    message: str
+    day_count: int
+    slot_count: int
+
+
+class DaySlotResponse(ScheduleSlotResponse):
+    projected_start_time: Optional[time] = None
+    projected_end_time: Optional[time] = None
 
 
 class DayScheduleResponse(BaseModel):
@@ -38,10 +66,30 @@ class DayScheduleResponse(BaseModel):
     date: date
     start_time: time
     end_time: time
+    planned_seconds: int = 0
+    remaining_seconds: int = 0
+    is_overflowing: bool = False
     created_at: datetime
     updated_at: datetime
-    schedule_slots: List[ScheduleSlotResponse] = []
-
+    schedule_slots: List[DaySlotResponse] = []
+    
     class Config:
         from_attributes = True
+    
+    @model_validator(mode="after")
+    def project_slot_times(self) -> "DayScheduleResponse":
+        # 남은 시간은 슬롯 변경 시 누적 갱신되는 planned_seconds로 계산하고,
+        # 슬롯별 예상 시작/종료 시각은 시작 시간부터 순서대로 spending_time을 더해 채운다.
+        self.remaining_seconds = seconds_of(self.end_time) - seconds_of(self.start_time) - self.planned_seconds
+        self.is_overflowing = self.remaining_seconds < 0
+        
+        elapsed = seconds_of(self.start_time)
+        for slot in self.schedule_slots:
+            slot.projected_start_time = time_of(elapsed)
+            elapsed += seconds_of(slot.spending_time)
+            slot.projected_end_time = time_of(elapsed)
+        
+        return self
+
 
+day_schedule_list_adapter = TypeAdapter(List[DayScheduleResponse])
@@ -0,0 +1,56 @@
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from datetime import datetime
+from typing import Optional, List
+
+
+class MarkerCreateRequest(BaseModel):
+    plan_id: int
+    name: Optional[str] = Field(None, max_length=20)
+    description: Optional[str] = Field(None, max_length=512)
+    thumbnail: Optional[str] = Field(None, max_length=512)
+    url: Optional[str] = Field(None, max_length=512)
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+
+
+class MarkerUpdateRequest(BaseModel):
+    name: Optional[str] = Field(None, max_length=20)
+    description: Optional[str] = Field(None, max_length=512)
+    thumbnail: Optional[str] = Field(None, max_length=512)
+    url: Optional[str] = Field(None, max_length=512)
+    latitude: float = Field(None, ge=-90, le=90)
+    longitude: float = Field(None, ge=-180, le=180)
+    
+    @field_validator("latitude", "longitude", mode="before")
+    @classmethod
+    def reject_null_coordinates(cls, value):
+        # 좌표는 생략할 수는 있지만 null로 지울 수는 없다. (NOT NULL 컬럼)
+        if value is None:
+            raise ValueError("좌표는 null일 수 없습니다.")
+        return value
+
+
+class MarkerResponse(BaseModel):
+    id: int
+    plan_id: int
+    name: Optional[str]
+    description: Optional[str]
+    thumbnail: Optional[str]
+    url: Optional[str]
+    latitude: float
+    longitude: float
+    is_scheduled: bool
+    created_user_id: int
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class NearbyMarkerResponse(MarkerResponse):
+    distance_km: float
+
+
+marker_list_adapter = TypeAdapter(List[MarkerResponse])
+nearby_marker_list_adapter = TypeAdapter(List[NearbyMarkerResponse])
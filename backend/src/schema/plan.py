@@ -1,10 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import date, datetime
 from typing import Optional, List
+from src.schema.day_schedule import DayScheduleResponse, DaySlotResponse
+from src.schema.marker import MarkerResponse
+from src.schema.schedule_slot import VoteTallyResponse
 
 
 class PlanCreateRequest(BaseModel):
-    user_id: int
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=512)
     city_to_stay: Optional[str] = Field(None, max_length=20)
@@ -34,9 +36,44 @@ class PlanResponse(BaseModel):
     start_date: date
     end_date: date
     created_user_id: int
+    version: int
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
 
+
+
+class PlanListResponse(BaseModel):
+    items: List[PlanResponse]
+    next_cursor: Optional[str] = None
+
+
+class PlanMemberResponse(BaseModel):
+    user_id: int
+    nickname: str
+    thumbnail: str
+    owner: bool
+
+    class Config:
+        from_attributes = True
+
+
+class ItinerarySlotResponse(DaySlotResponse):
+    vote_tallies: List[VoteTallyResponse] = []
+
+
+class ItineraryDayResponse(DayScheduleResponse):
+    schedule_slots: List[ItinerarySlotResponse] = []
+
+
+class PlanItineraryResponse(BaseModel):
+    plan: PlanResponse
+    members: List[PlanMemberResponse]
+    day_schedules: List[ItineraryDayResponse]
+    markers: List[MarkerResponse]
+
+
+plan_list_adapter = TypeAdapter(PlanListResponse)
+plan_itinerary_adapter = TypeAdapter(PlanItineraryResponse)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import time, datetime
 from typing import Optional, List
 
@@ -38,8 +38,41 @@ class ReorderSlotsRequest(BaseModel):
     slot_ids: List[int]
 
 
+class MoveSlotRequest(BaseModel):
+    before_slot_id: Optional[int] = None
+    after_slot_id: Optional[int] = None
+
+
+class SuggestSlotOrderRequest(BaseModel):
+    day_schedule_id: int
+    pinned_slot_ids: List[int] = Field(default_factory=list)
+    apply: bool = False
+
+
+class SuggestSlotOrderResponse(BaseModel):
+    day_schedule_id: int
+    slot_ids: List[int]
+    original_distance_km: float
+    distance_km: float
+    applied: bool
+
+
 class VoteSlotRequest(BaseModel):
     schedule_slot_id: int
     marker_id: int
-    user_id: int
 
+
+class BatchVoteRequest(BaseModel):
+    votes: List[VoteSlotRequest] = Field(..., min_length=1, max_length=500)
+
+
+class VoteTallyResponse(BaseModel):
+    marker_id: int
+    vote_count: int
+
+    class Config:
+        from_attributes = True
+
+
+schedule_slot_list_adapter = TypeAdapter(List[ScheduleSlotResponse])
+vote_tally_list_adapter = TypeAdapter(List[VoteTallyResponse])
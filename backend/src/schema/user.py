@@ -29,4 +29,7 @@ class UserLoginResponse(BaseModel):
     success: bool
     message: str
     user: Optional[UserResponse] = None
+    access_token: Optional[str] = None
+    token_type: Optional[str] = None
+    expires_at: Optional[datetime] = None
 
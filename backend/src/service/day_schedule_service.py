@@ -1,14 +1,22 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
-from typing import List
+from collections import defaultdict
+from typing import Any, Dict, List
 from src.model.day_schedule import DaySchedule
-from src.model.schedule_slot import ScheduleSlot
 from src.model.plan import Plan
-from src.schema.day_schedule import DayScheduleCreateRequest, DayScheduleUpdateRequest
+from src.model.schedule_slot import ScheduleSlot
+from src.schema.day_schedule import DayScheduleCreateRequest, DayScheduleUpdateRequest, DayScheduleResponse
+from src.schema.schedule_slot import ScheduleSlotResponse
+from src.service.itinerary_cache import get_cached_itinerary, store_itinerary, invalidate_itinerary, touch_plan
+from src.service.plan_events import publish_plan_event
+from src.util.response import projected_columns
 
 
-def create_day_schedule(db: Session, schedule_data: DayScheduleCreateRequest) -> DaySchedule:
-    plan = db.query(Plan).filter(Plan.id == schedule_data.plan_id).first()
+async def create_day_schedule(db: AsyncSession, schedule_data: DayScheduleCreateRequest) -> DaySchedule:
+    plan = await db.get(Plan, schedule_data.plan_id)
     if not plan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -21,10 +29,12 @@ def create_day_schedule(db: Session, schedule_data: DayScheduleCreateRequest) ->
             detail="삭제된 플랜에는 일정을 추가할 수 없습니다."
         )
     
-    existing_schedule = db.query(DaySchedule).filter(
-        DaySchedule.plan_id == schedule_data.plan_id,
-        DaySchedule.date == schedule_data.date
-    ).first()
+    existing_schedule = await db.scalar(
+        select(DaySchedule.id).filter(
+            DaySchedule.plan_id == schedule_data.plan_id,
+            DaySchedule.date == schedule_data.date
+        )
+    )
     
     if existing_schedule:
         raise HTTPException(
@@ -46,31 +56,90 @@ def create_day_schedule(db: Session, schedule_data: DayScheduleCreateRequest) ->
     )
     
     db.add(new_schedule)
-    db.commit()
-    db.refresh(new_schedule)
+    try:
+        # touch_plan의 UPDATE가 새 일정을 먼저 flush하므로 고유 인덱스 위반은 여기서도 날 수 있다.
+        await touch_plan(db, schedule_data.plan_id)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="해당 날짜에 이미 일정이 존재합니다."
+        )
+    await db.refresh(new_schedule)
+    # 새 일정에는 슬롯이 없으므로 조회하지 않고 빈 목록으로 채운다.
+    set_committed_value(new_schedule, "schedule_slots", [])
+    await invalidate_itinerary(new_schedule.plan_id)
+    await publish_plan_event(
+        db,
+        new_schedule.plan_id,
+        "day_schedule.created",
+        day_schedule={
+            "id": new_schedule.id,
+            "date": new_schedule.date,
+            "start_time": new_schedule.start_time,
+            "end_time": new_schedule.end_time
+        }
+    )
     
     return new_schedule
 
 
-def get_day_schedules_by_plan(db: Session, plan_id: int) -> List[DaySchedule]:
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+DAY_SCHEDULE_COLUMNS = projected_columns(DaySchedule, DayScheduleResponse)
+SCHEDULE_SLOT_COLUMNS = projected_columns(ScheduleSlot, ScheduleSlotResponse)
+
+
+async def load_day_schedule_rows(db: AsyncSession, plan_id: int) -> List[Dict[str, Any]]:
+    # ORM 엔티티 대신 응답에 필요한 컬럼만 조회한다. 일정 수와 무관하게 쿼리는 두 번이다.
+    days = await db.execute(
+        select(*DAY_SCHEDULE_COLUMNS).filter(
+            DaySchedule.plan_id == plan_id
+        ).order_by(DaySchedule.date)
+    )
+    
+    slots = await db.execute(
+        select(*SCHEDULE_SLOT_COLUMNS).join(
+            DaySchedule,
+            DaySchedule.id == ScheduleSlot.day_schedule_id
+        ).filter(
+            DaySchedule.plan_id == plan_id
+        ).order_by(ScheduleSlot.day_schedule_id, ScheduleSlot.order_num)
+    )
+    
+    slots_by_day = defaultdict(list)
+    for slot in slots.all():
+        slots_by_day[slot.day_schedule_id].append(slot)
+    
+    return [
+        {**day._mapping, "schedule_slots": slots_by_day[day.id]}
+        for day in days.all()
+    ]
+
+
+async def get_day_schedules_by_plan(db: AsyncSession, plan_id: int) -> List[Dict[str, Any]]:
+    plan = await db.get(Plan, plan_id)
     if not plan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="플랜을 찾을 수 없습니다."
         )
     
-    schedules = db.query(DaySchedule).options(
-        joinedload(DaySchedule.schedule_slots)
-    ).filter(
-        DaySchedule.plan_id == plan_id
-    ).all()
+    return await load_day_schedule_rows(db, plan_id)
+
+
+async def get_day_schedules_json(db: AsyncSession, plan_id: int, version: int) -> bytes:
+    # 플랜 존재 여부는 버전 조회(get_plan_version)에서 이미 확인했다.
+    cached = await get_cached_itinerary(plan_id, version)
+    if cached is not None:
+        return cached
     
-    return schedules
+    schedules = await load_day_schedule_rows(db, plan_id)
+    
+    return await store_itinerary(plan_id, version, schedules)
 
 
-def update_day_schedule(db: Session, schedule_id: int, schedule_data: DayScheduleUpdateRequest) -> DaySchedule:
-    schedule = db.query(DaySchedule).filter(DaySchedule.id == schedule_id).first()
+async def update_day_schedule(db: AsyncSession, schedule_id: int, schedule_data: DayScheduleUpdateRequest) -> DaySchedule:
+    schedule = await db.get(DaySchedule, schedule_id)
     
     if not schedule:
         raise HTTPException(
@@ -93,14 +162,25 @@ def update_day_schedule(db: Session, schedule_id: int, schedule_data: DaySchedul
     for field, value in update_data.items():
         setattr(schedule, field, value)
     
-    db.commit()
-    db.refresh(schedule)
+    try:
+        await touch_plan(db, schedule.plan_id)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="해당 날짜에 이미 일정이 존재합니다."
+        )
+    await db.refresh(schedule)
+    await db.refresh(schedule, ["schedule_slots"])
+    await invalidate_itinerary(schedule.plan_id)
+    await publish_plan_event(db, schedule.plan_id, "day_schedule.updated", day_schedule_id=schedule.id, changes=update_data)
     
     return schedule
 
 
-def delete_day_schedule(db: Session, schedule_id: int) -> bool:
-    schedule = db.query(DaySchedule).filter(DaySchedule.id == schedule_id).first()
+async def delete_day_schedule(db: AsyncSession, schedule_id: int) -> bool:
+    schedule = await db.get(DaySchedule, schedule_id)
     
     if not schedule:
         raise HTTPException(
@@ -108,8 +188,10 @@ def delete_day_schedule(db: Session, schedule_id: int) -> bool:
             detail="일정을 찾을 수 없습니다."
         )
     
-    db.delete(schedule)
-    db.commit()
+    await db.delete(schedule)
+    await touch_plan(db, schedule.plan_id)
+    await db.commit()
+    await invalidate_itinerary(schedule.plan_id)
+    await publish_plan_event(db, schedule.plan_id, "day_schedule.deleted", day_schedule_id=schedule.id)
     
     return True
-
@@ -0,0 +1,61 @@
+import orjson
+from sqlalchemy import select
+from typing import AsyncIterator, Dict, Optional
+from src.model.plan import Plan
+from src.model.users_in_plan import UsersInPlan
+from src.model.marker import Marker
+from src.model.day_schedule import DaySchedule
+from src.model.schedule_slot import ScheduleSlot
+from src.model.slot_voting import SlotVoting
+from src.model.slot_vote_tally import SlotVoteTally
+from src.util.config import settings
+from src.util.database import session_scope
+
+EXPORT_TABLES = [
+    ("plan", Plan),
+    ("member", UsersInPlan),
+    ("marker", Marker),
+    ("day_schedule", DaySchedule),
+    ("schedule_slot", ScheduleSlot),
+    ("slot_voting", SlotVoting),
+    ("slot_vote_tally", SlotVoteTally),
+]
+
+
+def plan_filters(plan_id: int) -> Dict:
+    day_ids = select(DaySchedule.id).filter(DaySchedule.plan_id == plan_id)
+    slot_ids = select(ScheduleSlot.id).filter(ScheduleSlot.day_schedule_id.in_(day_ids))
+    
+    return {
+        Plan: Plan.id == plan_id,
+        UsersInPlan: UsersInPlan.plan_id == plan_id,
+        Marker: Marker.plan_id == plan_id,
+        DaySchedule: DaySchedule.plan_id == plan_id,
+        ScheduleSlot: ScheduleSlot.day_schedule_id.in_(day_ids),
+        SlotVoting: SlotVoting.schedule_slot_id.in_(slot_ids),
+        SlotVoteTally: SlotVoteTally.schedule_slot_id.in_(slot_ids),
+    }
+
+
+async def export_ndjson(plan_id: Optional[int] = None) -> AsyncIterator[bytes]:
+    # StreamingResponse는 요청 의존성(get_db)이 정리된 뒤에도 계속 읽히므로 세션을 직접 연다.
+    # 테이블마다 서버 측 커서(yield_per)로 export_batch_size 행씩 읽어 한 줄에 한 행씩 내보낸다.
+    filters = plan_filters(plan_id) if plan_id is not None else {}
+    
+    async with session_scope() as db:
+        for kind, model in EXPORT_TABLES:
+            table = model.__table__
+            statement = select(*table.c).order_by(*table.primary_key.columns)
+            
+            if model in filters:
+                statement = statement.filter(filters[model])
+            
+            result = await db.stream(
+                statement.execution_options(yield_per=settings.export_batch_size)
+            )
+            
+            async for rows in result.partitions():
+                yield b"".join(
+                    orjson.dumps({"type": kind, **row._mapping}, option=orjson.OPT_APPEND_NEWLINE)
+                    for row in rows
+                )
@@ -0,0 +1,79 @@
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+from src.model.day_schedule import DaySchedule
+from src.model.plan import Plan
+from src.schema.day_schedule import day_schedule_list_adapter
+from src.util.cache import create_cache
+from src.util.config import settings
+from src.util.response import dump_json
+
+itinerary_cache = create_cache(
+    "itinerary",
+    max_size=settings.itinerary_cache_size,
+    ttl=settings.itinerary_cache_ttl
+)
+
+async def get_plan_version(db: AsyncSession, plan_id: int) -> int:
+    version = await db.scalar(select(Plan.version).filter(Plan.id == plan_id))
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="플랜을 찾을 수 없습니다."
+        )
+    
+    return version
+
+
+async def touch_plan(db: AsyncSession, plan_id: int) -> int:
+    # 일정이 바뀔 때마다 플랜 버전을 올린다. 플랜의 수정 시각(updated_at)은 그대로 둔다.
+    # 올린 버전은 커밋 후 보내는 이벤트에 담기 위해 세션에 기록한다. 행 잠금을 가진 채 읽으므로 이 트랜잭션의 버전이다.
+    await db.execute(
+        update(Plan).filter(Plan.id == plan_id).values(
+            version=Plan.version + 1,
+            updated_at=Plan.updated_at
+        )
+    )
+    
+    version = await db.scalar(select(Plan.version).filter(Plan.id == plan_id))
+    db.info.setdefault("plan_versions", {})[plan_id] = version
+    
+    return version
+
+
+async def touch_day_plan(db: AsyncSession, day_schedule_id: int) -> Optional[int]:
+    plan_id = await db.scalar(
+        select(DaySchedule.plan_id).filter(DaySchedule.id == day_schedule_id)
+    )
+    
+    if plan_id is not None:
+        await touch_plan(db, plan_id)
+    
+    return plan_id
+
+
+async def get_cached_itinerary(plan_id: int, version: int) -> Optional[bytes]:
+    # 캐시 값은 "버전:JSON" 형식이며, 현재 플랜 버전과 다른 값은 사용하지 않는다.
+    cached = await itinerary_cache.get(str(plan_id))
+    if cached is None:
+        return None
+    
+    cached_version, _, body = cached.partition(b":")
+    if int(cached_version) != version:
+        return None
+    
+    return body
+
+
+async def store_itinerary(plan_id: int, version: int, schedules: List[Dict[str, Any]]) -> bytes:
+    body = dump_json(day_schedule_list_adapter, schedules)
+    
+    await itinerary_cache.set(str(plan_id), b"%d:%s" % (version, body))
+    
+    return body
+
+
+async def invalidate_itinerary(plan_id: Optional[int]) -> None:
+    if plan_id is not None:
+        await itinerary_cache.delete(str(plan_id))
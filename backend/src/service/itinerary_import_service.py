@@ -0,0 +1,180 @@
+import csv
+import io
+from collections import OrderedDict
+from pydantic import ValidationError
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+from src.model.plan import Plan
+from src.model.day_schedule import DaySchedule
+from src.model.schedule_slot import ScheduleSlot
+from src.schema.day_schedule import ItineraryImportRequest, ImportDayRequest, ImportSlotRequest, ItineraryImportResponse
+from src.service.itinerary_cache import invalidate_itinerary, touch_plan
+from src.service.plan_events import publish_plan_event
+from src.util.config import settings
+from src.util.time_budget import seconds_of
+
+CSV_COLUMNS = ["date", "start_time", "end_time", "slot_name", "spending_time", "need_to_reservation"]
+
+
+def invalid_csv(line_num: int, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"CSV {line_num}번째 줄: {message}"
+    )
+
+
+def parse_itinerary_csv(plan_id: int, data: bytes) -> ItineraryImportRequest:
+    # 한 줄에 슬롯 하나를 적고, 같은 날짜의 줄은 하나의 일정으로 묶는다. 슬롯이 없는 날은 slot_name과 spending_time을 비워 둔다.
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV는 UTF-8로 인코딩되어야 합니다."
+        )
+    
+    reader = csv.DictReader(io.StringIO(text))
+    
+    missing_columns = set(CSV_COLUMNS) - set(reader.fieldnames or [])
+    if missing_columns:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV에 필요한 컬럼이 없습니다: {', '.join(sorted(missing_columns))}"
+        )
+    
+    days = OrderedDict()
+    for row in reader:
+        try:
+            row_day = ImportDayRequest(
+                date=row["date"],
+                start_time=row["start_time"],
+                end_time=row["end_time"]
+            )
+            
+            day = days.setdefault(row_day.date, row_day)
+            if (day.start_time, day.end_time) != (row_day.start_time, row_day.end_time):
+                raise invalid_csv(reader.line_num, "같은 날짜의 시작/종료 시간이 서로 다릅니다.")
+            
+            if row["slot_name"] or row["spending_time"]:
+                day.schedule_slots.append(
+                    ImportSlotRequest(
+                        name=row["slot_name"] or None,
+                        spending_time=row["spending_time"],
+                        need_to_reservation=row["need_to_reservation"] or False
+                    )
+                )
+        except ValidationError as e:
+            raise invalid_csv(reader.line_num, e.errors()[0]["msg"])
+    
+    try:
+        return ItineraryImportRequest(plan_id=plan_id, day_schedules=list(days.values()))
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.errors()[0]["msg"]
+        )
+
+
+async def import_itinerary(db: AsyncSession, import_data: ItineraryImportRequest) -> ItineraryImportResponse:
+    # create_day_schedule, create_schedule_slot과 같은 규칙을 메모리에서 모두 검사한 뒤
+    # 일정과 슬롯을 각각 executemany INSERT 한 번으로 저장한다.
+    plan = await db.get(Plan, import_data.plan_id)
+    if not plan:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="플랜을 찾을 수 없습니다."
+        )
+    
+    if plan.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="삭제된 플랜에는 일정을 추가할 수 없습니다."
+        )
+    
+    dates = [day.date for day in import_data.day_schedules]
+    if len(set(dates)) != len(dates):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="같은 날짜의 일정이 중복되어 있습니다."
+        )
+    
+    for day in import_data.day_schedules:
+        if day.start_time >= day.end_time:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{day.date}: 시작 시간은 종료 시간보다 이전이어야 합니다."
+            )
+    
+    existing_date = await db.scalar(
+        select(DaySchedule.date).filter(
+            DaySchedule.plan_id == import_data.plan_id,
+            DaySchedule.date.in_(dates)
+        ).limit(1)
+    )
+    
+    if existing_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{existing_date}: 해당 날짜에 이미 일정이 존재합니다."
+        )
+    
+    try:
+        await db.execute(
+            insert(DaySchedule),
+            [
+                {
+                    "plan_id": import_data.plan_id,
+                    "date": day.date,
+                    "start_time": day.start_time,
+                    "end_time": day.end_time,
+                    "planned_seconds": sum(seconds_of(slot.spending_time) for slot in day.schedule_slots),
+                    "last_order_num": len(day.schedule_slots) * settings.slot_order_gap
+                }
+                for day in import_data.day_schedules
+            ]
+        )
+        
+        result = await db.execute(
+            select(DaySchedule.date, DaySchedule.id).filter(
+                DaySchedule.plan_id == import_data.plan_id,
+                DaySchedule.date.in_(dates)
+            )
+        )
+        day_ids = dict(result.all())
+        
+        gap = settings.slot_order_gap
+        slot_rows = [
+            {
+                "day_schedule_id": day_ids[day.date],
+                "name": slot.name,
+                "spending_time": slot.spending_time,
+                "need_to_reservation": slot.need_to_reservation,
+                "order_num": order * gap
+            }
+            for day in import_data.day_schedules
+            for order, slot in enumerate(day.schedule_slots, start=1)
+        ]
+        
+        if slot_rows:
+            await db.execute(insert(ScheduleSlot), slot_rows)
+        
+        await touch_plan(db, import_data.plan_id)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="해당 날짜에 이미 일정이 존재합니다."
+        )
+    
+    await invalidate_itinerary(import_data.plan_id)
+    await publish_plan_event(db, import_data.plan_id, "day_schedule.imported", dates=dates)
+    
+    return ItineraryImportResponse(
+        success=True,
+        message="일정을 가져왔습니다.",
+        day_count=len(dates),
+        slot_count=len(slot_rows)
+    )
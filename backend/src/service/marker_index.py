@@ -0,0 +1,89 @@
+import math
+from collections import OrderedDict, defaultdict
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Tuple
+from src.model.marker import Marker
+from src.util.config import settings
+from src.util.geo import split_longitudes
+
+
+class MarkerGrid:
+    # 위도/경도를 cell_size(도) 단위 격자로 나눈 geohash 방식의 공간 인덱스 (MySQL SPATIAL을 쓸 수 없을 때 사용)
+    
+    def __init__(self, version: int, cell_size: float, points: List[Tuple[int, float, float]]):
+        self.version = version
+        self.cell_size = cell_size
+        self.size = len(points)
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, float, float]]] = defaultdict(list)
+        
+        for point in points:
+            self.cells[self.cell_of(point[1], point[2])].append(point)
+    
+    def cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+    
+    def points(self) -> List[Tuple[int, float, float]]:
+        return [point for points in self.cells.values() for point in points]
+    
+    def search(self, min_lat: float, max_lat: float, min_lng: float, max_lng: float) -> List[Tuple[int, float, float]]:
+        found = []
+        
+        for range_min_lng, range_max_lng in split_longitudes(min_lng, max_lng):
+            low_row, low_col = self.cell_of(min_lat, range_min_lng)
+            high_row, high_col = self.cell_of(max_lat, range_max_lng)
+            
+            # 범위가 넓어 칸 수가 점유된 칸보다 많으면 점유된 칸만 훑는다.
+            if (high_row - low_row + 1) * (high_col - low_col + 1) > len(self.cells):
+                cells = [
+                    points for (row, col), points in self.cells.items()
+                    if low_row <= row <= high_row and low_col <= col <= high_col
+                ]
+            else:
+                cells = [
+                    self.cells[(row, col)]
+                    for row in range(low_row, high_row + 1)
+                    for col in range(low_col, high_col + 1)
+                    if (row, col) in self.cells
+                ]
+            
+            for points in cells:
+                found.extend(
+                    point for point in points
+                    if min_lat <= point[1] <= max_lat and range_min_lng <= point[2] <= range_max_lng
+                )
+        
+        return found
+
+
+class MarkerGridCache:
+    # 플랜별 격자를 LRU로 보관한다. 마커가 바뀌면 플랜 버전이 올라가므로 버전이 다르면 다시 만든다.
+    
+    def __init__(self, max_size: int, cell_size: float):
+        self.max_size = max_size
+        self.cell_size = cell_size
+        self.grids: "OrderedDict[int, MarkerGrid]" = OrderedDict()
+    
+    async def get(self, db: AsyncSession, plan_id: int, version: int) -> MarkerGrid:
+        grid = self.grids.get(plan_id)
+        
+        if grid is None or grid.version != version:
+            result = await db.execute(
+                select(Marker.id, Marker.latitude, Marker.longitude).filter(
+                    Marker.plan_id == plan_id
+                )
+            )
+            grid = MarkerGrid(version, self.cell_size, [tuple(row) for row in result.all()])
+            self.grids[plan_id] = grid
+        
+        self.grids.move_to_end(plan_id)
+        while len(self.grids) > self.max_size:
+            self.grids.popitem(last=False)
+        
+        return grid
+
+
+marker_grid_cache = MarkerGridCache(
+    max_size=settings.marker_grid_cache_size,
+    cell_size=settings.marker_grid_cell_size
+)
@@ -0,0 +1,238 @@
+from sqlalchemy import Row, delete, select, update, func, literal_column, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+from typing import Any, Dict, List, Tuple
+from src.model.day_schedule import DaySchedule
+from src.model.marker import Marker
+from src.model.plan import Plan
+from src.model.schedule_slot import ScheduleSlot
+from src.model.slot_vote_tally import SlotVoteTally
+from src.model.slot_voting import SlotVoting
+from src.schema.marker import MarkerCreateRequest, MarkerUpdateRequest, MarkerResponse
+from src.service.itinerary_cache import get_plan_version, touch_plan
+from src.service.marker_index import marker_grid_cache
+from src.util.config import settings
+from src.util.database import is_mysql
+from src.util.geo import MAX_DISTANCE_KM, bounding_box, haversine_km, split_longitudes
+from src.util.response import projected_columns
+
+MARKER_COLUMNS = projected_columns(Marker, MarkerResponse)
+
+
+async def create_marker(db: AsyncSession, user_id: int, marker_data: MarkerCreateRequest) -> Marker:
+    plan = await db.get(Plan, marker_data.plan_id)
+    if not plan:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="플랜을 찾을 수 없습니다."
+        )
+    
+    if plan.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="삭제된 플랜에는 마커를 추가할 수 없습니다."
+        )
+    
+    new_marker = Marker(
+        plan_id=marker_data.plan_id,
+        name=marker_data.name,
+        description=marker_data.description,
+        thumbnail=marker_data.thumbnail,
+        url=marker_data.url,
+        latitude=marker_data.latitude,
+        longitude=marker_data.longitude,
+        created_user_id=user_id
+    )
+    
+    db.add(new_marker)
+    await touch_plan(db, marker_data.plan_id)
+    await db.commit()
+    await db.refresh(new_marker)
+    
+    return new_marker
+
+
+async def get_markers_by_plan(db: AsyncSession, plan_id: int) -> List[Row]:
+    await get_plan_version(db, plan_id)
+    
+    result = await db.execute(
+        select(*MARKER_COLUMNS).filter(Marker.plan_id == plan_id).order_by(Marker.id)
+    )
+    
+    return result.all()
+
+
+async def update_marker(db: AsyncSession, marker_id: int, marker_data: MarkerUpdateRequest) -> Marker:
+    marker = await db.get(Marker, marker_id)
+    
+    if not marker:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="마커를 찾을 수 없습니다."
+        )
+    
+    update_data = marker_data.model_dump(exclude_unset=True)
+    
+    for field, value in update_data.items():
+        setattr(marker, field, value)
+    
+    await touch_plan(db, marker.plan_id)
+    await db.commit()
+    await db.refresh(marker)
+    
+    return marker
+
+
+async def delete_marker(db: AsyncSession, marker_id: int) -> bool:
+    marker = await db.get(Marker, marker_id)
+    
+    if not marker:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="마커를 찾을 수 없습니다."
+        )
+    
+    # 마커를 가리키는 확정 슬롯, 투표, 집계도 같은 트랜잭션에서 정리한다.
+    # 플랜의 슬롯 ID로 범위를 좁혀 (schedule_slot_id, ...) 인덱스를 쓴다.
+    slot_ids = (await db.scalars(
+        select(ScheduleSlot.id).join(
+            DaySchedule,
+            DaySchedule.id == ScheduleSlot.day_schedule_id
+        ).filter(DaySchedule.plan_id == marker.plan_id)
+    )).all()
+    
+    if slot_ids:
+        await db.execute(
+            update(ScheduleSlot).filter(
+                ScheduleSlot.id.in_(slot_ids),
+                ScheduleSlot.holding_marker_id == marker_id
+            ).values(holding_marker_id=None)
+        )
+        await db.execute(
+            delete(SlotVoting).filter(
+                SlotVoting.schedule_slot_id.in_(slot_ids),
+                SlotVoting.marker_id == marker_id
+            )
+        )
+        await db.execute(
+            delete(SlotVoteTally).filter(
+                SlotVoteTally.schedule_slot_id.in_(slot_ids),
+                SlotVoteTally.marker_id == marker_id
+            )
+        )
+    
+    await db.delete(marker)
+    await touch_plan(db, marker.plan_id)
+    await db.commit()
+    
+    return True
+
+
+async def find_marker_points(
+    db: AsyncSession,
+    plan_id: int,
+    version: int,
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float
+) -> List[Tuple[int, float, float]]:
+    if not is_mysql(db):
+        grid = await marker_grid_cache.get(db, plan_id, version)
+        return grid.search(min_lat, max_lat, min_lng, max_lng)
+    
+    # MySQL은 markers.location의 SPATIAL 인덱스로 사각형과 겹치는 점만 찾는다.
+    boxes = [
+        func.ST_GeomFromText(
+            f"POLYGON(({low} {min_lat}, {high} {min_lat}, {high} {max_lat}, {low} {max_lat}, {low} {min_lat}))",
+            0
+        )
+        for low, high in split_longitudes(min_lng, max_lng)
+    ]
+    
+    result = await db.execute(
+        select(Marker.id, Marker.latitude, Marker.longitude).filter(
+            Marker.plan_id == plan_id,
+            or_(*[func.MBRIntersects(box, literal_column("markers.location")) for box in boxes])
+        )
+    )
+    
+    return [tuple(row) for row in result.all()]
+
+
+async def get_markers_in_viewport(
+    db: AsyncSession,
+    plan_id: int,
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float
+) -> List[Row]:
+    if min_lat > max_lat:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_lat은 max_lat보다 클 수 없습니다."
+        )
+    
+    version = await get_plan_version(db, plan_id)
+    points = await find_marker_points(db, plan_id, version, min_lat, max_lat, min_lng, max_lng)
+    
+    if not points:
+        return []
+    
+    marker_ids = sorted(point[0] for point in points)[:settings.marker_viewport_max]
+    
+    result = await db.execute(
+        select(*MARKER_COLUMNS).filter(Marker.id.in_(marker_ids)).order_by(Marker.id)
+    )
+    
+    return result.all()
+
+
+async def find_all_marker_points(db: AsyncSession, plan_id: int, version: int) -> List[Tuple[int, float, float]]:
+    if not is_mysql(db):
+        grid = await marker_grid_cache.get(db, plan_id, version)
+        return grid.points()
+    
+    result = await db.execute(
+        select(Marker.id, Marker.latitude, Marker.longitude).filter(Marker.plan_id == plan_id)
+    )
+    
+    return [tuple(row) for row in result.all()]
+
+
+def rank_by_distance(lat: float, lng: float, points: List[Tuple[int, float, float]], radius: float) -> List[Tuple[float, int]]:
+    ranked = sorted(
+        (haversine_km(lat, lng, point_lat, point_lng), marker_id)
+        for marker_id, point_lat, point_lng in points
+    )
+    return [item for item in ranked if item[0] <= radius]
+
+
+async def get_nearby_markers(db: AsyncSession, plan_id: int, lat: float, lng: float, k: int) -> List[Dict[str, Any]]:
+    version = await get_plan_version(db, plan_id)
+    k = min(k, settings.marker_nearby_max)
+    radius = settings.marker_nearby_radius_km
+    
+    # 반경 안의 점은 모두 bounding_box 안에 있으므로, 반경 안에서 k개를 찾으면 그것이 가장 가까운 k개다.
+    # 찾지 못하면 반경을 넓혀 가며 다시 찾지 않고 플랜의 마커 전체에서 한 번에 고른다.
+    points = await find_marker_points(db, plan_id, version, *bounding_box(lat, lng, radius))
+    nearest = rank_by_distance(lat, lng, points, radius)[:k]
+    
+    if len(nearest) < k:
+        points = await find_all_marker_points(db, plan_id, version)
+        nearest = rank_by_distance(lat, lng, points, MAX_DISTANCE_KM)[:k]
+    
+    if not nearest:
+        return []
+    
+    result = await db.execute(
+        select(*MARKER_COLUMNS).filter(Marker.id.in_([marker_id for _, marker_id in nearest]))
+    )
+    markers = {row.id: row for row in result.all()}
+    
+    return [
+        {**markers[marker_id]._mapping, "distance_km": distance}
+        for distance, marker_id in nearest
+        if marker_id in markers
+    ]
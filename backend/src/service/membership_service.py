@@ -0,0 +1,201 @@
+import uuid
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Iterable, Optional, Set
+from src.model.day_schedule import DaySchedule
+from src.model.marker import Marker
+from src.model.plan import Plan
+from src.model.schedule_slot import ScheduleSlot
+from src.model.users_in_plan import UsersInPlan
+from src.util.auth import get_current_user_id
+from src.util.cache import create_cache
+from src.util.config import settings
+from src.util.database import get_db
+
+OWNER = "owner"
+MEMBER = "member"
+
+membership_cache = create_cache(
+    "membership",
+    max_size=settings.membership_cache_size,
+    ttl=settings.membership_cache_ttl
+)
+
+
+def membership_key(plan_id: int, user_id: int) -> str:
+    return f"{plan_id}:{user_id}"
+
+
+def generation_key(plan_id: int) -> str:
+    return f"{plan_id}:generation"
+
+
+async def get_generation(plan_id: int) -> bytes:
+    return await membership_cache.get(generation_key(plan_id)) or b""
+
+
+async def load_plan_role(db: AsyncSession, plan_id: int, user_id: int) -> Optional[str]:
+    owner = await db.scalar(
+        select(UsersInPlan.owner).join(
+            Plan,
+            Plan.id == UsersInPlan.plan_id
+        ).filter(
+            UsersInPlan.plan_id == plan_id,
+            UsersInPlan.user_id == user_id,
+            Plan.is_deleted == False
+        )
+    )
+    
+    return None if owner is None else OWNER if owner else MEMBER
+
+
+async def get_plan_role(db: AsyncSession, plan_id: int, user_id: int) -> Optional[str]:
+    # 멤버가 아닌 경우(빈 값)도 캐시해서 반복 요청이 DB까지 가지 않게 한다.
+    # 방금 참가한 사용자가 다른 워커의 캐시 때문에 오래 거절되지 않도록 이 항목은 짧게 보관한다.
+    # 항목에는 조회를 시작할 때의 플랜 세대를 함께 저장한다. 조회 중에 무효화가 일어나면
+    # 세대가 바뀌므로, 뒤늦게 써진 이전 역할은 다음 확인에서 버려진다.
+    key = membership_key(plan_id, user_id)
+    generation = await get_generation(plan_id)
+    cached = await membership_cache.get(key)
+    if cached is not None:
+        cached_generation, _, role = cached.partition(b":")
+        if cached_generation == generation:
+            return role.decode() or None
+    
+    role = await load_plan_role(db, plan_id, user_id)
+    await membership_cache.set(
+        key,
+        generation + b":" + (role or "").encode(),
+        ttl=None if role else settings.membership_negative_cache_ttl
+    )
+    
+    return role
+
+
+async def invalidate_membership(plan_id: int, user_ids: Iterable[int]) -> None:
+    # 세대 항목이 먼저 만료되면 이전 세대의 항목이 다시 맞을 수 있으므로 역할 항목보다 오래 보관한다.
+    await membership_cache.set(
+        generation_key(plan_id),
+        uuid.uuid4().hex.encode(),
+        ttl=settings.membership_cache_ttl * 2
+    )
+    for user_id in user_ids:
+        await membership_cache.delete(membership_key(plan_id, user_id))
+
+
+async def ensure_plan_member(db: AsyncSession, plan_id: int, user_id: int, owner: bool = False) -> str:
+    # 소유자 확인은 캐시를 거치지 않는다. 소유권 이전 후 다른 워커에 남은 항목이나
+    # 무효화 직후 다시 써진 이전 역할로 예전 소유자가 통과하면 안 되기 때문이다.
+    if owner:
+        role = await load_plan_role(db, plan_id, user_id)
+    else:
+        role = await get_plan_role(db, plan_id, user_id)
+    
+    if role is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="플랜 멤버만 접근할 수 있습니다."
+        )
+    
+    if owner and role != OWNER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="플랜 소유자만 할 수 있습니다."
+        )
+    
+    return role
+
+
+async def require_plan_member(
+    plan_id: int,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> int:
+    await ensure_plan_member(db, plan_id, user_id)
+    return user_id
+
+
+async def require_plan_owner(
+    plan_id: int,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> int:
+    await ensure_plan_member(db, plan_id, user_id, owner=True)
+    return user_id
+
+
+async def get_day_plan_id(db: AsyncSession, day_schedule_id: int) -> int:
+    plan_id = await db.scalar(select(DaySchedule.plan_id).filter(DaySchedule.id == day_schedule_id))
+    
+    if plan_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="일정을 찾을 수 없습니다."
+        )
+    
+    return plan_id
+
+
+async def get_slot_plan_ids(db: AsyncSession, slot_ids: Iterable[int]) -> Set[int]:
+    slot_ids = set(slot_ids)
+    result = await db.execute(
+        select(ScheduleSlot.id, DaySchedule.plan_id).join(
+            DaySchedule,
+            DaySchedule.id == ScheduleSlot.day_schedule_id
+        ).filter(ScheduleSlot.id.in_(slot_ids))
+    )
+    plan_ids = dict(result.all())
+    
+    if len(plan_ids) != len(slot_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="슬롯을 찾을 수 없습니다."
+        )
+    
+    return set(plan_ids.values())
+
+
+async def get_marker_plan_id(db: AsyncSession, marker_id: int) -> int:
+    plan_id = await db.scalar(select(Marker.plan_id).filter(Marker.id == marker_id))
+    
+    if plan_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="마커를 찾을 수 없습니다."
+        )
+    
+    return plan_id
+
+
+async def ensure_slot_member(db: AsyncSession, slot_ids: Iterable[int], user_id: int) -> None:
+    # 여러 플랜의 슬롯이 섞여 있으면 모든 플랜의 멤버여야 한다.
+    for plan_id in await get_slot_plan_ids(db, slot_ids):
+        await ensure_plan_member(db, plan_id, user_id)
+
+
+async def require_day_member(
+    schedule_id: int,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> int:
+    await ensure_plan_member(db, await get_day_plan_id(db, schedule_id), user_id)
+    return user_id
+
+
+async def require_slot_member(
+    slot_id: int,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> int:
+    await ensure_slot_member(db, [slot_id], user_id)
+    return user_id
+
+
+async def require_marker_member(
+    marker_id: int,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> int:
+    await ensure_plan_member(db, await get_marker_plan_id(db, marker_id), user_id)
+    return user_id
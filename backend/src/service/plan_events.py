@@ -0,0 +1,57 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Optional
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.service.membership_service import get_plan_role
+from src.util.broadcast import create_broadcaster
+from src.util.config import settings
+from src.util.database import session_scope
+
+plan_events = create_broadcaster("plan-events")
+
+
+async def publish_plan_event(db: AsyncSession, plan_id: Optional[int], event_type: str, **data: Any) -> None:
+    # 커밋이 끝난 뒤 변경된 부분만 담은 이벤트를 플랜 구독자에게 보낸다.
+    # version은 이 변경을 커밋한 플랜 버전(touch_plan)이다. 구독자는 가진 스냅샷 버전 이하의 이벤트를 버린다.
+    if plan_id is None or plan_events.idle():
+        return
+    
+    version = db.info.get("plan_versions", {}).get(plan_id)
+    await plan_events.publish(
+        plan_id,
+        orjson.dumps({"type": event_type, "plan_id": plan_id, "version": version, **data})
+    )
+
+
+async def is_still_member(plan_id: int, user_id: int) -> bool:
+    async with session_scope() as db:
+        return await get_plan_role(db, plan_id, user_id) is not None
+
+
+async def plan_event_stream(plan_id: int, version: int, user_id: int) -> AsyncIterator[Optional[bytes]]:
+    # 구독을 시작한 시점의 플랜 버전을 먼저 보내고, 이후 이벤트를 순서대로 내보낸다.
+    # event_heartbeat_seconds 동안 이벤트가 없으면 연결 유지를 위해 None을 내보낸다.
+    # 같은 주기로 멤버인지 다시 확인해서 아니면 스트림을 끝낸다. 플랜이 삭제되면 그 이벤트를 보낸 뒤 바로 끝낸다.
+    async with plan_events.subscribe(plan_id) as subscription:
+        yield orjson.dumps({"type": "subscribed", "plan_id": plan_id, "version": version})
+        checked_at = time.monotonic()
+        
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.get(), settings.event_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                message = None
+            
+            if message is not None and orjson.loads(message)["type"] == "plan.deleted":
+                yield message
+                return
+            
+            if time.monotonic() - checked_at >= settings.event_heartbeat_seconds:
+                if not await is_still_member(plan_id, user_id):
+                    return
+                checked_at = time.monotonic()
+            
+            yield message
@@ -0,0 +1,181 @@
+import asyncio
+import math
+import time
+from collections import Counter, defaultdict
+from sqlalchemy import Row, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Tuple
+from src.model.plan import Plan
+from src.schema.plan import PlanResponse
+from src.util.config import settings
+from src.util.database import is_mysql
+from src.util.response import projected_columns
+
+PLAN_COLUMNS = projected_columns(Plan, PlanResponse)
+
+
+def tokenize(text: Optional[str], ngram_size: int) -> List[str]:
+    # MySQL ngram 파서와 같은 방식으로 공백 단위 단어를 n-gram으로 자른다.
+    if not text:
+        return []
+    
+    tokens = []
+    for word in text.lower().split():
+        if len(word) <= ngram_size:
+            tokens.append(word)
+            continue
+        
+        for i in range(len(word) - ngram_size + 1):
+            tokens.append(word[i:i + ngram_size])
+    
+    return tokens
+
+
+class PlanSearchIndex:
+    # MySQL FULLTEXT를 쓸 수 없는 백엔드를 위한 인메모리 역색인 (TF-IDF 점수)
+    
+    def __init__(self, ngram_size: int, ttl: int):
+        self.ngram_size = ngram_size
+        self.ttl = ttl
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.documents: Dict[int, Counter] = {}
+        self.loaded_at: Optional[float] = None
+        self.lock = asyncio.Lock()
+    
+    def add(self, plan: Plan) -> None:
+        self.remove(plan.id)
+        
+        terms = Counter(
+            tokenize(plan.name, self.ngram_size)
+            + tokenize(plan.description, self.ngram_size)
+            + tokenize(plan.city_to_stay, self.ngram_size)
+        )
+        
+        self.documents[plan.id] = terms
+        for term, count in terms.items():
+            self.postings[term][plan.id] = count
+    
+    def remove(self, plan_id: int) -> None:
+        terms = self.documents.pop(plan_id, None)
+        if not terms:
+            return
+        
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(plan_id, None)
+            if not postings:
+                del self.postings[term]
+    
+    def search(self, keyword: str, limit: int) -> List[Tuple[int, float]]:
+        total = len(self.documents)
+        scores: Dict[int, float] = defaultdict(float)
+        
+        for term, query_count in Counter(tokenize(keyword, self.ngram_size)).items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            
+            idf = math.log(1 + total / len(postings))
+            for plan_id, count in postings.items():
+                scores[plan_id] += query_count * count * idf
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit]
+    
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl
+    
+    async def load(self, db: AsyncSession) -> None:
+        result = await db.execute(
+            select(Plan.id, Plan.name, Plan.description, Plan.city_to_stay).filter(
+                Plan.is_deleted == False
+            )
+        )
+        
+        self.postings.clear()
+        self.documents.clear()
+        for row in result.all():
+            self.add(row)
+        
+        self.loaded_at = time.monotonic()
+    
+    async def refresh(self, db: AsyncSession) -> None:
+        if not self.is_stale():
+            return
+        
+        # 적재된 색인이 있으면 한 요청만 다시 적재하고 나머지는 기존 색인으로 응답한다.
+        if self.loaded_at is not None and self.lock.locked():
+            return
+        
+        async with self.lock:
+            if self.is_stale():
+                await self.load(db)
+
+
+plan_search_index = PlanSearchIndex(
+    ngram_size=settings.plan_search_ngram_size,
+    ttl=settings.plan_search_index_ttl
+)
+
+
+def index_plan(plan: Plan) -> None:
+    if plan_search_index.loaded_at is None:
+        return
+    
+    if plan.is_deleted:
+        plan_search_index.remove(plan.id)
+    else:
+        plan_search_index.add(plan)
+
+
+async def search_plans(db: AsyncSession, keyword: str, offset: int = 0, limit: Optional[int] = None, columns=PLAN_COLUMNS) -> List[Row]:
+    keyword = keyword.strip()
+    max_results = settings.plan_search_max_results
+    
+    if offset >= max_results:
+        return []
+    
+    limit = min(limit or max_results, max_results - offset)
+    
+    if len(keyword) < settings.plan_search_ngram_size:
+        # n-gram 길이보다 짧은 검색어는 색인에 토큰이 없으므로 두 백엔드 모두 LIKE로 처리한다.
+        result = await db.execute(
+            select(*columns).filter(
+                Plan.is_deleted == False,
+                Plan.name.like(f"%{keyword}%")
+            ).order_by(Plan.id.desc()).offset(offset).limit(limit)
+        )
+        return result.all()
+    
+    if is_mysql(db):
+        score = match(
+            Plan.name, Plan.description, Plan.city_to_stay,
+            against=keyword
+        ).in_natural_language_mode()
+        
+        result = await db.execute(
+            select(*columns).filter(
+                Plan.is_deleted == False,
+                score
+            ).order_by(score.desc(), Plan.id.desc()).offset(offset).limit(limit)
+        )
+        return result.all()
+    
+    await plan_search_index.refresh(db)
+    
+    ranked = plan_search_index.search(keyword, offset + limit)[offset:]
+    if not ranked:
+        return []
+    
+    result = await db.execute(
+        select(*columns).filter(
+            Plan.id.in_([plan_id for plan_id, _ in ranked]),
+            Plan.is_deleted == False
+        )
+    )
+    plans = {plan.id: plan for plan in result.all()}
+    
+    return [plans[plan_id] for plan_id, _ in ranked if plan_id in plans]
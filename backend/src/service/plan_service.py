@@ -1,20 +1,24 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+from sqlalchemy import Row, select, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.model.plan import Plan
 from src.model.users_in_plan import UsersInPlan
 from src.model.user import User
-from src.schema.plan import PlanCreateRequest, PlanUpdateRequest
+from src.model.marker import Marker
+from src.model.day_schedule import DaySchedule
+from src.model.schedule_slot import ScheduleSlot
+from src.schema.plan import PlanCreateRequest, PlanUpdateRequest, PlanListResponse, PlanItineraryResponse
+from src.service.plan_search_service import PLAN_COLUMNS, search_plans, index_plan
+from src.service.itinerary_cache import touch_plan
+from src.service.plan_events import publish_plan_event
+from src.service.membership_service import invalidate_membership
+from src.util.pagination import resolve_page_size, encode_cursor, decode_cursor, invalid_cursor
 
 
-def create_plan(db: Session, plan_data: PlanCreateRequest) -> Plan:
-    user = db.query(User).filter(User.id == plan_data.user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다."
-        )
-    
+async def create_plan(db: AsyncSession, user_id: int, plan_data: PlanCreateRequest) -> Plan:
     if plan_data.start_date > plan_data.end_date:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -29,56 +33,176 @@ def create_plan(db: Session, plan_data: PlanCreateRequest) -> Plan:
         init_longitude=plan_data.init_longitude,
         start_date=plan_data.start_date,
         end_date=plan_data.end_date,
-        created_user_id=plan_data.user_id
+        created_user_id=user_id
     )
     
     db.add(new_plan)
-    db.flush()
+    await db.flush()
     
     users_in_plan = UsersInPlan(
-        user_id=plan_data.user_id,
+        user_id=user_id,
         plan_id=new_plan.id,
         owner=True
     )
     
     db.add(users_in_plan)
-    db.commit()
-    db.refresh(new_plan)
+    await db.commit()
+    await db.refresh(new_plan)
+    await invalidate_membership(new_plan.id, [user_id])
+    
+    index_plan(new_plan)
     
     return new_plan
 
 
-def get_plans_by_user(db: Session, user_id: int) -> List[Plan]:
-    plans = db.query(Plan).join(
+# 목록의 ETag는 (id, version)과 다음 커서로 정해지므로, 먼저 이 좁은 컬럼으로 페이지를 정하고
+# 조건부 요청이 맞지 않을 때만 나머지 컬럼을 기본 키로 읽는다.
+PLAN_KEY_COLUMNS = (Plan.id, Plan.version, Plan.created_at)
+
+
+async def paginate_plan_keys(db: AsyncSession, query, cursor: Optional[str], limit: Optional[int]) -> Tuple[List[Row], Optional[str]]:
+    page_size = resolve_page_size(limit)
+    
+    if cursor:
+        values = decode_cursor(cursor, "created_at", "id")
+        try:
+            created_at = datetime.fromisoformat(values["created_at"])
+        except (TypeError, ValueError):
+            raise invalid_cursor()
+        
+        if not isinstance(values["id"], int):
+            raise invalid_cursor()
+        
+        query = query.filter(
+            or_(
+                Plan.created_at < created_at,
+                and_(Plan.created_at == created_at, Plan.id < values["id"])
+            )
+        )
+    
+    result = await db.execute(
+        query.order_by(Plan.created_at.desc(), Plan.id.desc()).limit(page_size + 1)
+    )
+    keys = result.all()
+    
+    next_cursor = None
+    if len(keys) > page_size:
+        keys = keys[:page_size]
+        last = keys[-1]
+        next_cursor = encode_cursor({"created_at": last.created_at.isoformat(), "id": last.id})
+    
+    return keys, next_cursor
+
+
+async def load_plans(db: AsyncSession, keys: List[Row], next_cursor: Optional[str]) -> PlanListResponse:
+    if not keys:
+        return PlanListResponse(items=[], next_cursor=next_cursor)
+    
+    result = await db.execute(
+        select(*PLAN_COLUMNS).filter(Plan.id.in_([key.id for key in keys]))
+    )
+    plans = {plan.id: plan for plan in result.all()}
+    
+    return PlanListResponse(items=[plans[key.id] for key in keys if key.id in plans], next_cursor=next_cursor)
+
+
+async def get_plan_keys_by_user(db: AsyncSession, user_id: int, cursor: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[Row], Optional[str]]:
+    query = select(*PLAN_KEY_COLUMNS).join(
         UsersInPlan, 
         Plan.id == UsersInPlan.plan_id
     ).filter(
         UsersInPlan.user_id == user_id,
         Plan.is_deleted == False
-    ).all()
+    )
     
-    return plans
+    return await paginate_plan_keys(db, query, cursor, limit)
 
 
-def get_all_plans(db: Session, keyword: Optional[str] = None) -> List[Plan]:
-    query = db.query(Plan).filter(Plan.is_deleted == False)
+async def get_plans_by_user(db: AsyncSession, user_id: int, cursor: Optional[str] = None, limit: Optional[int] = None) -> PlanListResponse:
+    keys, next_cursor = await get_plan_keys_by_user(db, user_id, cursor, limit)
+    return await load_plans(db, keys, next_cursor)
+
+
+async def get_all_plan_keys(db: AsyncSession, keyword: Optional[str] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[Row], Optional[str]]:
+    if keyword and keyword.strip():
+        page_size = resolve_page_size(limit)
+        offset = decode_cursor(cursor, "offset")["offset"] if cursor else 0
+        
+        if not isinstance(offset, int) or offset < 0:
+            raise invalid_cursor()
+        
+        # 검색 결과 순서는 검색어에 따라 정해지므로 검색 쿼리는 생략할 수 없고, 좁은 컬럼만 읽는다.
+        keys = await search_plans(db, keyword, offset, page_size + 1, PLAN_KEY_COLUMNS)
+        
+        next_cursor = None
+        if len(keys) > page_size:
+            keys = keys[:page_size]
+            next_cursor = encode_cursor({"offset": offset + page_size})
+        
+        return keys, next_cursor
     
-    if keyword:
-        query = query.filter(Plan.name.like(f"%{keyword}%"))
+    query = select(*PLAN_KEY_COLUMNS).filter(Plan.is_deleted == False)
     
-    plans = query.all()
-    return plans
+    return await paginate_plan_keys(db, query, cursor, limit)
+
 
+async def get_all_plans(db: AsyncSession, keyword: Optional[str] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> PlanListResponse:
+    keys, next_cursor = await get_all_plan_keys(db, keyword, cursor, limit)
+    return await load_plans(db, keys, next_cursor)
 
-def join_plan(db: Session, plan_id: int, user_id: int) -> UsersInPlan:
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+
+async def get_plan_itinerary(db: AsyncSession, plan_id: int) -> PlanItineraryResponse:
+    # 플랜, 멤버, 일정, 슬롯, 득표 집계, 마커를 플랜 크기와 무관하게 고정된 6개의 쿼리로 불러온다.
+    plan = await db.get(Plan, plan_id)
+    
+    if not plan:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="플랜을 찾을 수 없습니다."
+        )
+    
+    if plan.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다."
+            detail="삭제된 플랜입니다."
         )
     
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+    members = await db.execute(
+        select(
+            UsersInPlan.user_id,
+            UsersInPlan.owner,
+            User.nickname,
+            User.thumbnail
+        ).join(
+            User,
+            User.id == UsersInPlan.user_id
+        ).filter(
+            UsersInPlan.plan_id == plan_id
+        ).order_by(UsersInPlan.id)
+    )
+    
+    day_schedules = await db.scalars(
+        select(DaySchedule).options(
+            selectinload(DaySchedule.schedule_slots).selectinload(ScheduleSlot.vote_tallies)
+        ).filter(
+            DaySchedule.plan_id == plan_id
+        ).order_by(DaySchedule.date)
+    )
+    
+    markers = await db.scalars(
+        select(Marker).filter(Marker.plan_id == plan_id).order_by(Marker.id)
+    )
+    
+    return PlanItineraryResponse(
+        plan=plan,
+        members=members.all(),
+        day_schedules=day_schedules.all(),
+        markers=markers.all()
+    )
+
+
+async def join_plan(db: AsyncSession, plan_id: int, user_id: int) -> UsersInPlan:
+    plan = await db.get(Plan, plan_id)
     if not plan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -91,10 +215,12 @@ def join_plan(db: Session, plan_id: int, user_id: int) -> UsersInPlan:
             detail="삭제된 플랜에는 참가할 수 없습니다."
         )
     
-    existing = db.query(UsersInPlan).filter(
-        UsersInPlan.user_id == user_id,
-        UsersInPlan.plan_id == plan_id
-    ).first()
+    existing = await db.scalar(
+        select(UsersInPlan).filter(
+            UsersInPlan.user_id == user_id,
+            UsersInPlan.plan_id == plan_id
+        )
+    )
     
     if existing:
         raise HTTPException(
@@ -109,14 +235,17 @@ def join_plan(db: Session, plan_id: int, user_id: int) -> UsersInPlan:
     )
     
     db.add(users_in_plan)
-    db.commit()
-    db.refresh(users_in_plan)
+    await touch_plan(db, plan_id)
+    await db.commit()
+    await db.refresh(users_in_plan)
+    await invalidate_membership(plan_id, [user_id])
+    await publish_plan_event(db, plan_id, "member.joined", member={"user_id": user_id, "owner": False})
     
     return users_in_plan
 
 
-def update_plan(db: Session, plan_id: int, plan_data: PlanUpdateRequest) -> Plan:
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+async def update_plan(db: AsyncSession, plan_id: int, plan_data: PlanUpdateRequest) -> Plan:
+    plan = await db.get(Plan, plan_id)
     
     if not plan:
         raise HTTPException(
@@ -145,14 +274,17 @@ def update_plan(db: Session, plan_id: int, plan_data: PlanUpdateRequest) -> Plan
     for field, value in update_data.items():
         setattr(plan, field, value)
     
-    db.commit()
-    db.refresh(plan)
+    plan.version = Plan.version + 1
+    await db.commit()
+    await db.refresh(plan)
+    
+    index_plan(plan)
     
     return plan
 
 
-def delete_plan(db: Session, plan_id: int, user_id: int) -> bool:
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+async def delete_plan(db: AsyncSession, plan_id: int, user_id: int) -> bool:
+    plan = await db.get(Plan, plan_id)
     
     if not plan:
         raise HTTPException(
@@ -172,14 +304,24 @@ def delete_plan(db: Session, plan_id: int, user_id: int) -> bool:
             detail="이미 삭제된 플랜입니다."
         )
     
+    result = await db.scalars(
+        select(UsersInPlan.user_id).filter(UsersInPlan.plan_id == plan_id)
+    )
+    member_ids = result.all()
+    
     plan.is_deleted = True
-    db.commit()
+    await touch_plan(db, plan_id)
+    await db.commit()
+    await invalidate_membership(plan_id, member_ids)
+    await publish_plan_event(db, plan_id, "plan.deleted")
+    
+    index_plan(plan)
     
     return True
 
 
-def transfer_ownership(db: Session, plan_id: int, old_owner: int, new_owner: int) -> bool:
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+async def transfer_ownership(db: AsyncSession, plan_id: int, old_owner: int, new_owner: int) -> bool:
+    plan = await db.get(Plan, plan_id)
     
     if not plan:
         raise HTTPException(
@@ -193,10 +335,12 @@ def transfer_ownership(db: Session, plan_id: int, old_owner: int, new_owner: int
             detail="삭제된 플랜입니다."
         )
     
-    old_owner_record = db.query(UsersInPlan).filter(
-        UsersInPlan.plan_id == plan_id,
-        UsersInPlan.user_id == old_owner
-    ).first()
+    old_owner_record = await db.scalar(
+        select(UsersInPlan).filter(
+            UsersInPlan.plan_id == plan_id,
+            UsersInPlan.user_id == old_owner
+        )
+    )
     
     if not old_owner_record:
         raise HTTPException(
@@ -210,10 +354,12 @@ def transfer_ownership(db: Session, plan_id: int, old_owner: int, new_owner: int
             detail="소유자만 권한을 넘길 수 있습니다."
         )
     
-    new_owner_record = db.query(UsersInPlan).filter(
-        UsersInPlan.plan_id == plan_id,
-        UsersInPlan.user_id == new_owner
-    ).first()
+    new_owner_record = await db.scalar(
+        select(UsersInPlan).filter(
+            UsersInPlan.plan_id == plan_id,
+            UsersInPlan.user_id == new_owner
+        )
+    )
     
     if not new_owner_record:
         raise HTTPException(
@@ -224,7 +370,7 @@ def transfer_ownership(db: Session, plan_id: int, old_owner: int, new_owner: int
     old_owner_record.owner = False
     new_owner_record.owner = True
     
-    db.commit()
+    await db.commit()
+    await invalidate_membership(plan_id, [old_owner, new_owner])
     
     return True
-
@@ -1,29 +1,71 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from fastapi import HTTPException, status
-from typing import List
-from collections import Counter
+from sqlalchemy import Row, select, insert, update, case, func, literal, union_all
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from fastapi import BackgroundTasks, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, List, Tuple
+from collections import Counter, defaultdict
 from src.model.schedule_slot import ScheduleSlot
 from src.model.slot_voting import SlotVoting
+from src.model.slot_vote_tally import SlotVoteTally
 from src.model.day_schedule import DaySchedule
 from src.model.marker import Marker
-from src.model.user import User
-from src.schema.schedule_slot import ScheduleSlotCreateRequest, ScheduleSlotUpdateRequest
+from src.schema.schedule_slot import (
+    ScheduleSlotCreateRequest,
+    ScheduleSlotUpdateRequest,
+    ScheduleSlotResponse,
+    MoveSlotRequest,
+    VoteSlotRequest,
+    SuggestSlotOrderRequest,
+    SuggestSlotOrderResponse
+)
+from src.service.itinerary_cache import invalidate_itinerary, touch_plan, touch_day_plan
+from src.service.plan_events import plan_events, publish_plan_event
+from src.util.config import settings
+from src.util.database import session_scope, is_mysql
+from src.util.geo import haversine_km
+from src.util.route import optimize_route
+from src.util.time_budget import seconds_of
 
 
-def create_schedule_slot(db: Session, slot_data: ScheduleSlotCreateRequest) -> ScheduleSlot:
-    day_schedule = db.query(DaySchedule).filter(DaySchedule.id == slot_data.day_schedule_id).first()
-    if not day_schedule:
+async def adjust_planned_seconds(db: AsyncSession, day_schedule_id: int, delta: int) -> None:
+    # 일정 전체를 다시 합산하지 않고 바뀐 만큼만 더한다. 순서 변경은 합계에 영향이 없다.
+    if delta:
+        await db.execute(
+            update(DaySchedule).filter(DaySchedule.id == day_schedule_id).values(
+                planned_seconds=DaySchedule.planned_seconds + delta
+            )
+        )
+
+
+async def create_schedule_slot(db: AsyncSession, slot_data: ScheduleSlotCreateRequest) -> ScheduleSlot:
+    # 일정 행의 last_order_num을 먼저 올린 뒤 읽으므로 MAX(order_num) 집계 없이 순번을 정한다.
+    # 행 잠금이 커밋까지 유지되어, 같은 일정에 동시에 추가되는 슬롯도 서로 다른 순번을 받는다.
+    await db.execute(
+        update(DaySchedule).filter(DaySchedule.id == slot_data.day_schedule_id).values(
+            last_order_num=DaySchedule.last_order_num + settings.slot_order_gap,
+            planned_seconds=DaySchedule.planned_seconds + seconds_of(slot_data.spending_time)
+        )
+    )
+    
+    result = await db.execute(
+        select(DaySchedule.plan_id, DaySchedule.last_order_num).filter(
+            DaySchedule.id == slot_data.day_schedule_id
+        )
+    )
+    day = result.first()
+    
+    if day is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="일정을 찾을 수 없습니다."
         )
     
-    max_order = db.query(func.max(ScheduleSlot.order_num)).filter(
-        ScheduleSlot.day_schedule_id == slot_data.day_schedule_id
-    ).scalar()
-    
-    next_order = (max_order or 0) + 1
+    plan_id, next_order = day
     
     new_slot = ScheduleSlot(
         day_schedule_id=slot_data.day_schedule_id,
@@ -34,14 +76,22 @@ def create_schedule_slot(db: Session, slot_data: ScheduleSlotCreateRequest) -> S
     )
     
     db.add(new_slot)
-    db.commit()
-    db.refresh(new_slot)
+    await touch_plan(db, plan_id)
+    await db.commit()
+    await db.refresh(new_slot)
+    await invalidate_itinerary(plan_id)
+    await publish_plan_event(
+        db,
+        plan_id,
+        "schedule_slot.created",
+        schedule_slot=ScheduleSlotResponse.model_validate(new_slot).model_dump()
+    )
     
     return new_slot
 
 
-def update_schedule_slot(db: Session, slot_id: int, slot_data: ScheduleSlotUpdateRequest) -> ScheduleSlot:
-    slot = db.query(ScheduleSlot).filter(ScheduleSlot.id == slot_id).first()
+async def update_schedule_slot(db: AsyncSession, slot_id: int, slot_data: ScheduleSlotUpdateRequest) -> ScheduleSlot:
+    slot = await db.get(ScheduleSlot, slot_id)
     
     if not slot:
         raise HTTPException(
@@ -51,17 +101,31 @@ def update_schedule_slot(db: Session, slot_id: int, slot_data: ScheduleSlotUpdat
     
     update_data = slot_data.model_dump(exclude_unset=True)
     
+    if update_data.get("spending_time") is not None:
+        delta = seconds_of(update_data["spending_time"]) - seconds_of(slot.spending_time)
+        await adjust_planned_seconds(db, slot.day_schedule_id, delta)
+    
     for field, value in update_data.items():
         setattr(slot, field, value)
     
-    db.commit()
-    db.refresh(slot)
+    plan_id = await touch_day_plan(db, slot.day_schedule_id)
+    await db.commit()
+    await db.refresh(slot)
+    await invalidate_itinerary(plan_id)
+    await publish_plan_event(
+        db,
+        plan_id,
+        "schedule_slot.updated",
+        schedule_slot_id=slot.id,
+        day_schedule_id=slot.day_schedule_id,
+        changes=update_data
+    )
     
     return slot
 
 
-def delete_schedule_slot(db: Session, slot_id: int) -> bool:
-    slot = db.query(ScheduleSlot).filter(ScheduleSlot.id == slot_id).first()
+async def delete_schedule_slot(db: AsyncSession, slot_id: int) -> bool:
+    slot = await db.get(ScheduleSlot, slot_id)
     
     if not slot:
         raise HTTPException(
@@ -69,16 +133,29 @@ def delete_schedule_slot(db: Session, slot_id: int) -> bool:
             detail="슬롯을 찾을 수 없습니다."
         )
     
-    db.delete(slot)
-    db.commit()
+    await db.delete(slot)
+    await adjust_planned_seconds(db, slot.day_schedule_id, -seconds_of(slot.spending_time))
+    plan_id = await touch_day_plan(db, slot.day_schedule_id)
+    await db.commit()
+    await invalidate_itinerary(plan_id)
+    await publish_plan_event(
+        db,
+        plan_id,
+        "schedule_slot.deleted",
+        schedule_slot_id=slot.id,
+        day_schedule_id=slot.day_schedule_id
+    )
     
     return True
 
 
-def reorder_schedule_slots(db: Session, day_schedule_id: int, slot_ids: List[int]) -> List[ScheduleSlot]:
-    existing_slots = db.query(ScheduleSlot).filter(
-        ScheduleSlot.day_schedule_id == day_schedule_id
-    ).all()
+async def reorder_schedule_slots(db: AsyncSession, day_schedule_id: int, slot_ids: List[int]) -> List[ScheduleSlot]:
+    result = await db.scalars(
+        select(ScheduleSlot).filter(
+            ScheduleSlot.day_schedule_id == day_schedule_id
+        )
+    )
+    existing_slots = result.all()
     
     if len(existing_slots) != len(slot_ids):
         raise HTTPException(
@@ -95,21 +172,200 @@ def reorder_schedule_slots(db: Session, day_schedule_id: int, slot_ids: List[int
             detail="잘못된 슬롯 ID가 포함되어 있습니다."
         )
     
-    for order, slot_id in enumerate(slot_ids, start=1):
-        slot = db.query(ScheduleSlot).filter(ScheduleSlot.id == slot_id).first()
-        slot.order_num = order
+    slots_by_id = {slot.id: slot for slot in existing_slots}
+    ordered_slots = [slots_by_id[slot_id] for slot_id in slot_ids]
+    
+    await assign_slot_orders(db, day_schedule_id, ordered_slots)
+    await load_updated_at(db, ordered_slots)
+    plan_id = await touch_day_plan(db, day_schedule_id)
+    await db.commit()
+    await invalidate_itinerary(plan_id)
+    await publish_plan_event(db, plan_id, "schedule_slot.reordered", day_schedule_id=day_schedule_id, slot_ids=slot_ids)
     
-    db.commit()
+    return ordered_slots
+
+
+async def assign_slot_orders(db: AsyncSession, day_schedule_id: int, ordered_slots: List[ScheduleSlot]) -> None:
+    gap = settings.slot_order_gap
+    order_by_id = {slot.id: order * gap for order, slot in enumerate(ordered_slots, start=1)}
+    
+    if not order_by_id:
+        return
+    
+    await db.execute(
+        update(ScheduleSlot).filter(
+            ScheduleSlot.day_schedule_id == day_schedule_id,
+            ScheduleSlot.id.in_(order_by_id.keys())
+        ).values(
+            order_num=case(order_by_id, value=ScheduleSlot.id)
+        ).execution_options(synchronize_session=False)
+    )
     
-    updated_slots = db.query(ScheduleSlot).filter(
-        ScheduleSlot.day_schedule_id == day_schedule_id
-    ).order_by(ScheduleSlot.order_num).all()
+    for slot in ordered_slots:
+        set_committed_value(slot, "order_num", order_by_id[slot.id])
+
+
+async def load_updated_at(db: AsyncSession, slots: List[ScheduleSlot]) -> None:
+    # 일괄 UPDATE는 세션의 객체를 갱신하지 않으므로, 응답에 나갈 updated_at만 한 번의 쿼리로 다시 읽는다.
+    result = await db.execute(
+        select(ScheduleSlot.id, ScheduleSlot.updated_at).filter(
+            ScheduleSlot.id.in_([slot.id for slot in slots])
+        )
+    )
+    updated_at_by_id = dict(result.all())
     
-    return updated_slots
+    for slot in slots:
+        set_committed_value(slot, "updated_at", updated_at_by_id[slot.id])
 
 
-def confirm_schedule_slot(db: Session, slot_id: int) -> ScheduleSlot:
-    slot = db.query(ScheduleSlot).filter(ScheduleSlot.id == slot_id).first()
+async def rebalance_schedule_slots(day_schedule_id: int) -> None:
+    async with session_scope() as db:
+        result = await db.scalars(
+            select(ScheduleSlot).filter(
+                ScheduleSlot.day_schedule_id == day_schedule_id
+            ).order_by(ScheduleSlot.order_num, ScheduleSlot.id).with_for_update()
+        )
+        
+        await assign_slot_orders(db, day_schedule_id, result.all())
+        plan_id = await touch_day_plan(db, day_schedule_id)
+        await db.commit()
+        await invalidate_itinerary(plan_id)
+
+
+async def move_schedule_slot(
+    db: AsyncSession,
+    slot_id: int,
+    move_data: MoveSlotRequest,
+    background_tasks: BackgroundTasks
+) -> ScheduleSlot:
+    if (move_data.before_slot_id is None) == (move_data.after_slot_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before_slot_id와 after_slot_id 중 하나만 지정해야 합니다."
+        )
+    
+    move_before = move_data.before_slot_id is not None
+    anchor_id = move_data.before_slot_id if move_before else move_data.after_slot_id
+    
+    if anchor_id == slot_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="자기 자신을 기준으로 이동할 수 없습니다."
+        )
+    
+    # 같은 일정의 이동을 직렬화하도록 일정 행을 먼저 잠근다. 잠그지 않으면 두 이동이 같은 이웃 순번을 읽고
+    # 같은 중간값을 저장할 수 있다. 이후 조회도 잠금 읽기로 해서 먼저 끝난 이동이 커밋한 순번을 본다.
+    day_schedule_id = await db.scalar(
+        select(DaySchedule.id).join(
+            ScheduleSlot,
+            ScheduleSlot.day_schedule_id == DaySchedule.id
+        ).filter(ScheduleSlot.id == slot_id).with_for_update()
+    )
+    
+    result = await db.scalars(
+        select(ScheduleSlot).filter(
+            ScheduleSlot.id.in_([slot_id, anchor_id])
+        ).with_for_update().execution_options(populate_existing=True)
+    )
+    slots_by_id = {found.id: found for found in result.all()}
+    slot = slots_by_id.get(slot_id)
+    anchor = slots_by_id.get(anchor_id)
+    
+    if day_schedule_id is None or not slot or not anchor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="슬롯을 찾을 수 없습니다."
+        )
+    
+    if slot.day_schedule_id != anchor.day_schedule_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="같은 일정의 슬롯 기준으로만 이동할 수 있습니다."
+        )
+    
+    gap = settings.slot_order_gap
+    
+    if move_before:
+        neighbour_order = await db.scalar(
+            select(func.max(ScheduleSlot.order_num)).filter(
+                ScheduleSlot.day_schedule_id == slot.day_schedule_id,
+                ScheduleSlot.order_num < anchor.order_num,
+                ScheduleSlot.id != slot.id
+            ).with_for_update()
+        )
+        low = neighbour_order if neighbour_order is not None else anchor.order_num - 2 * gap
+        high = anchor.order_num
+    else:
+        neighbour_order = await db.scalar(
+            select(func.min(ScheduleSlot.order_num)).filter(
+                ScheduleSlot.day_schedule_id == slot.day_schedule_id,
+                ScheduleSlot.order_num > anchor.order_num,
+                ScheduleSlot.id != slot.id
+            ).with_for_update()
+        )
+        low = anchor.order_num
+        high = neighbour_order if neighbour_order is not None else anchor.order_num + 2 * gap
+    
+    if high - low < 2:
+        # 두 슬롯 사이에 남은 순번이 없으면 이 일정의 순번을 다시 벌린 뒤 배치한다.
+        result = await db.scalars(
+            select(ScheduleSlot).filter(
+                ScheduleSlot.day_schedule_id == slot.day_schedule_id,
+                ScheduleSlot.id != slot.id
+            ).order_by(ScheduleSlot.order_num, ScheduleSlot.id).with_for_update()
+        )
+        ordered_slots = result.all()
+        
+        index = ordered_slots.index(anchor)
+        ordered_slots.insert(index if move_before else index + 1, slot)
+        
+        await assign_slot_orders(db, slot.day_schedule_id, ordered_slots)
+        await load_updated_at(db, [slot])
+        plan_id = await touch_day_plan(db, slot.day_schedule_id)
+        await db.commit()
+        await invalidate_itinerary(plan_id)
+        await publish_plan_event(
+            db,
+            plan_id,
+            "schedule_slot.reordered",
+            day_schedule_id=slot.day_schedule_id,
+            slot_ids=[ordered_slot.id for ordered_slot in ordered_slots]
+        )
+        
+        return slot
+    
+    slot.order_num = (low + high) // 2
+    
+    if not move_before and neighbour_order is None:
+        # 마지막 슬롯 뒤로 옮기면 새 순번이 최댓값이 되므로, 이후 추가되는 슬롯이 그 뒤에 오도록 맞춘다.
+        await db.execute(
+            update(DaySchedule).filter(
+                DaySchedule.id == slot.day_schedule_id,
+                DaySchedule.last_order_num < slot.order_num
+            ).values(last_order_num=slot.order_num)
+        )
+    
+    plan_id = await touch_day_plan(db, slot.day_schedule_id)
+    await db.commit()
+    await db.refresh(slot)
+    await invalidate_itinerary(plan_id)
+    await publish_plan_event(
+        db,
+        plan_id,
+        "schedule_slot.moved",
+        schedule_slot_id=slot.id,
+        day_schedule_id=slot.day_schedule_id,
+        order_num=slot.order_num
+    )
+    
+    if min(slot.order_num - low, high - slot.order_num) <= 1:
+        background_tasks.add_task(rebalance_schedule_slots, slot.day_schedule_id)
+    
+    return slot
+
+
+async def confirm_schedule_slot(db: AsyncSession, slot_id: int) -> ScheduleSlot:
+    slot = await db.get(ScheduleSlot, slot_id)
     
     if not slot:
         raise HTTPException(
@@ -117,58 +373,150 @@ def confirm_schedule_slot(db: Session, slot_id: int) -> ScheduleSlot:
             detail="슬롯을 찾을 수 없습니다."
         )
     
-    votes = db.query(SlotVoting).filter(SlotVoting.schedule_slot_id == slot_id).all()
+    most_voted_marker_id = await db.scalar(
+        select(SlotVoteTally.marker_id).filter(
+            SlotVoteTally.schedule_slot_id == slot_id,
+            SlotVoteTally.vote_count > 0
+        ).order_by(
+            SlotVoteTally.vote_count.desc(),
+            SlotVoteTally.marker_id
+        ).limit(1)
+    )
     
-    if not votes:
+    if most_voted_marker_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="투표 내역이 없어 확정할 수 없습니다."
         )
     
-    marker_ids = [vote.marker_id for vote in votes]
-    vote_counts = Counter(marker_ids)
-    most_voted_marker_id = vote_counts.most_common(1)[0][0]
-    
     slot.holding_marker_id = most_voted_marker_id
     
-    db.commit()
-    db.refresh(slot)
+    plan_id = await touch_day_plan(db, slot.day_schedule_id)
+    await db.commit()
+    await db.refresh(slot)
+    await invalidate_itinerary(plan_id)
+    await publish_plan_event(
+        db,
+        plan_id,
+        "schedule_slot.confirmed",
+        schedule_slot_id=slot.id,
+        day_schedule_id=slot.day_schedule_id,
+        holding_marker_id=slot.holding_marker_id
+    )
     
     return slot
 
 
-def vote_schedule_slot(db: Session, slot_id: int, marker_id: int, user_id: int) -> SlotVoting:
-    slot = db.query(ScheduleSlot).filter(ScheduleSlot.id == slot_id).first()
-    if not slot:
+def path_length_km(points: List[Tuple[float, float]]) -> float:
+    return sum(haversine_km(*start, *end) for start, end in zip(points, points[1:]))
+
+
+async def suggest_slot_order(db: AsyncSession, suggest_data: SuggestSlotOrderRequest) -> SuggestSlotOrderResponse:
+    plan_id = await db.scalar(
+        select(DaySchedule.plan_id).filter(DaySchedule.id == suggest_data.day_schedule_id)
+    )
+    if plan_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="슬롯을 찾을 수 없습니다."
+            detail="일정을 찾을 수 없습니다."
         )
     
-    marker = db.query(Marker).filter(Marker.id == marker_id).first()
-    if not marker:
+    result = await db.execute(
+        select(ScheduleSlot.id, Marker.latitude, Marker.longitude).outerjoin(
+            Marker, Marker.id == ScheduleSlot.holding_marker_id
+        ).filter(
+            ScheduleSlot.day_schedule_id == suggest_data.day_schedule_id
+        ).order_by(ScheduleSlot.order_num, ScheduleSlot.id)
+    )
+    rows = result.all()
+    
+    pinned_ids = set(suggest_data.pinned_slot_ids)
+    if not pinned_ids <= {row.id for row in rows}:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 슬롯 ID가 포함되어 있습니다."
+        )
+    
+    # 마커가 정해지지 않은 슬롯은 위치가 없으므로 지금 자리에 그대로 두고, 나머지 슬롯만 경로를 최적화한다.
+    located = [index for index, row in enumerate(rows) if row.latitude is not None]
+    points = [(rows[index].latitude, rows[index].longitude) for index in located]
+    pinned = [rows[index].id in pinned_ids for index in located]
+    
+    route = await run_in_threadpool(optimize_route, points, pinned, settings.route_time_budget_ms)
+    
+    slot_ids = [row.id for row in rows]
+    for index, point_index in zip(located, route):
+        slot_ids[index] = rows[located[point_index]].id
+    
+    applied = suggest_data.apply and [row.id for row in rows] != slot_ids
+    if applied:
+        await reorder_schedule_slots(db, suggest_data.day_schedule_id, slot_ids)
+    
+    return SuggestSlotOrderResponse(
+        day_schedule_id=suggest_data.day_schedule_id,
+        slot_ids=slot_ids,
+        original_distance_km=path_length_km(points),
+        distance_km=path_length_km([points[point_index] for point_index in route]),
+        applied=applied
+    )
+
+
+async def validate_vote_targets(db: AsyncSession, votes: List[Tuple[int, int]]) -> Dict[int, int]:
+    # 슬롯과 마커의 존재와 소속 플랜을 쿼리 하나로 확인하고, 슬롯 ID → 플랜 ID를 반환한다.
+    slot_ids = {slot_id for slot_id, _ in votes}
+    marker_ids = {marker_id for _, marker_id in votes}
+    result = await db.execute(
+        union_all(
+            select(
+                literal("slot").label("kind"),
+                ScheduleSlot.id.label("id"),
+                DaySchedule.plan_id.label("plan_id")
+            ).join(
+                DaySchedule,
+                DaySchedule.id == ScheduleSlot.day_schedule_id
+            ).filter(ScheduleSlot.id.in_(slot_ids)),
+            select(literal("marker"), Marker.id, Marker.plan_id).filter(Marker.id.in_(marker_ids))
+        )
+    )
+    
+    plan_ids = defaultdict(dict)
+    for kind, found_id, plan_id in result.all():
+        plan_ids[kind][found_id] = plan_id
+    
+    if slot_ids - plan_ids["slot"].keys():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="마커를 찾을 수 없습니다."
+            detail="슬롯을 찾을 수 없습니다."
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    if marker_ids - plan_ids["marker"].keys():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다."
+            detail="마커를 찾을 수 없습니다."
         )
     
-    existing_vote = db.query(SlotVoting).filter(
-        SlotVoting.schedule_slot_id == slot_id,
-        SlotVoting.voted_user_id == user_id
-    ).first()
+    if any(plan_ids["slot"][slot_id] != plan_ids["marker"][marker_id] for slot_id, marker_id in votes):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="다른 플랜의 마커에는 투표할 수 없습니다."
+        )
     
-    if existing_vote:
+    return plan_ids["slot"]
+
+
+async def commit_votes(db: AsyncSession) -> None:
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 투표한 슬롯입니다."
         )
+
+
+async def vote_schedule_slot(db: AsyncSession, slot_id: int, marker_id: int, user_id: int) -> SlotVoting:
+    plan_ids = await validate_vote_targets(db, [(slot_id, marker_id)])
     
     new_vote = SlotVoting(
         schedule_slot_id=slot_id,
@@ -177,8 +525,114 @@ def vote_schedule_slot(db: Session, slot_id: int, marker_id: int, user_id: int)
     )
     
     db.add(new_vote)
-    db.commit()
-    db.refresh(new_vote)
+    await increment_vote_tallies(db, {(slot_id, marker_id): 1})
+    await touch_vote_plans(db, plan_ids)
+    await commit_votes(db)
+    await publish_vote_events(db, {(slot_id, marker_id): 1}, plan_ids)
     
     return new_vote
 
+
+async def vote_schedule_slots(db: AsyncSession, user_id: int, votes: List[VoteSlotRequest]) -> int:
+    if len({vote.schedule_slot_id for vote in votes}) != len(votes):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="같은 슬롯에 대한 중복 투표가 포함되어 있습니다."
+        )
+    
+    plan_ids = await validate_vote_targets(db, [(vote.schedule_slot_id, vote.marker_id) for vote in votes])
+    
+    try:
+        await db.execute(
+            insert(SlotVoting),
+            [
+                {
+                    "schedule_slot_id": vote.schedule_slot_id,
+                    "marker_id": vote.marker_id,
+                    "voted_user_id": user_id
+                }
+                for vote in votes
+            ]
+        )
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 투표한 슬롯입니다."
+        )
+    
+    vote_counts = Counter((vote.schedule_slot_id, vote.marker_id) for vote in votes)
+    await increment_vote_tallies(db, vote_counts)
+    await touch_vote_plans(db, plan_ids)
+    await commit_votes(db)
+    await publish_vote_events(db, vote_counts, plan_ids)
+    
+    return len(votes)
+
+
+async def touch_vote_plans(db: AsyncSession, plan_ids: Dict[int, int]) -> None:
+    # 투표도 플랜 버전을 올려 이벤트와 스냅샷의 순서를 비교할 수 있게 한다.
+    # 여러 플랜에 걸친 일괄 투표가 서로 교착되지 않도록 플랜 ID 순서로 잠근다.
+    for plan_id in sorted(set(plan_ids.values())):
+        await touch_plan(db, plan_id)
+        await invalidate_itinerary(plan_id)
+
+
+async def publish_vote_events(db: AsyncSession, vote_counts: Dict[Tuple[int, int], int], plan_ids: Dict[int, int]) -> None:
+    # 득표 수는 늘어난 만큼만 보낸다. 구독자는 스냅샷보다 버전이 큰 이벤트만 가지고 있는 집계에 더한다.
+    if plan_events.idle():
+        return
+    
+    votes_by_plan = defaultdict(list)
+    for (slot_id, marker_id), count in vote_counts.items():
+        votes_by_plan[plan_ids[slot_id]].append(
+            {"schedule_slot_id": slot_id, "marker_id": marker_id, "count": count}
+        )
+    
+    for plan_id, plan_votes in votes_by_plan.items():
+        await publish_plan_event(db, plan_id, "schedule_slot.voted", votes=plan_votes)
+
+
+async def increment_vote_tallies(db: AsyncSession, vote_counts: Dict[Tuple[int, int], int]) -> None:
+    rows = [
+        {"schedule_slot_id": slot_id, "marker_id": marker_id, "vote_count": count}
+        for (slot_id, marker_id), count in vote_counts.items()
+    ]
+    
+    if not rows:
+        return
+    
+    if is_mysql(db):
+        statement = mysql_insert(SlotVoteTally).values(rows)
+        statement = statement.on_duplicate_key_update(
+            vote_count=SlotVoteTally.vote_count + statement.inserted.vote_count
+        )
+    else:
+        dialect_insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        statement = dialect_insert(SlotVoteTally).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[SlotVoteTally.schedule_slot_id, SlotVoteTally.marker_id],
+            set_={"vote_count": SlotVoteTally.vote_count + statement.excluded.vote_count}
+        )
+    
+    await db.execute(statement)
+
+
+async def get_vote_tallies(db: AsyncSession, slot_id: int) -> List[Row]:
+    slot = await db.get(ScheduleSlot, slot_id)
+    if not slot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="슬롯을 찾을 수 없습니다."
+        )
+    
+    result = await db.execute(
+        select(SlotVoteTally.marker_id, SlotVoteTally.vote_count).filter(
+            SlotVoteTally.schedule_slot_id == slot_id
+        ).order_by(
+            SlotVoteTally.vote_count.desc(),
+            SlotVoteTally.marker_id
+        )
+    )
+    
+    return result.all()
@@ -1,33 +1,55 @@
-import bcrypt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from src.model.user import User
 from src.schema.user import UserSignupRequest, UserLoginRequest, UserLoginResponse
+from src.util.auth import issue_token
+from src.util.password_hasher import password_hasher, PasswordPoolFullError
 
 
-def check_nickname_duplicate(db: Session, nickname: str) -> bool:
-    existing_user = db.query(User).filter(User.nickname == nickname).first()
+async def check_nickname_duplicate(db: AsyncSession, nickname: str) -> bool:
+    existing_user = await db.scalar(select(User).filter(User.nickname == nickname))
     return existing_user is not None
 
 
-def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+def password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"}
+    )
+
+
+def ensure_password_capacity() -> None:
+    if password_hasher.is_full:
+        raise password_pool_busy()
+
 
+async def hash_password(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except PasswordPoolFullError:
+        raise password_pool_busy()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except PasswordPoolFullError:
+        raise password_pool_busy()
 
-def create_user(db: Session, user_data: UserSignupRequest) -> User:
-    if check_nickname_duplicate(db, user_data.nickname):
+
+async def create_user(db: AsyncSession, user_data: UserSignupRequest) -> User:
+    ensure_password_capacity()
+    
+    if await check_nickname_duplicate(db, user_data.nickname):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 사용 중인 닉네임입니다."
         )
     
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password(user_data.password)
     
     new_user = User(
         nickname=user_data.nickname,
@@ -36,14 +58,24 @@ def create_user(db: Session, user_data: UserSignupRequest) -> User:
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 동시에 같은 닉네임으로 가입한 경우 uq_users_nickname 인덱스가 막아준다.
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 닉네임입니다."
+        )
+    await db.refresh(new_user)
     
     return new_user
 
 
-def login_user(db: Session, login_data: UserLoginRequest) -> UserLoginResponse:
-    user = db.query(User).filter(User.nickname == login_data.nickname).first()
+async def login_user(db: AsyncSession, login_data: UserLoginRequest) -> UserLoginResponse:
+    ensure_password_capacity()
+    
+    user = await db.scalar(select(User).filter(User.nickname == login_data.nickname))
     
     if not user:
         return UserLoginResponse(
@@ -52,16 +84,20 @@ def login_user(db: Session, login_data: UserLoginRequest) -> UserLoginResponse:
             user=None
         )
     
-    if not verify_password(login_data.password, user.password):
+    if not await verify_password(login_data.password, user.password):
         return UserLoginResponse(
             success=False,
             message="닉네임 또는 비밀번호가 일치하지 않습니다.",
             user=None
         )
     
+    access_token, expires_at = issue_token(user.id)
+    
     return UserLoginResponse(
         success=True,
         message="로그인 성공",
-        user=user
+        user=user,
+        access_token=access_token,
+        token_type="bearer",
+        expires_at=expires_at
     )
-
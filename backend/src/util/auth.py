@@ -0,0 +1,106 @@
+import base64
+import hashlib
+import hmac
+import logging
+import secrets
+import time
+from datetime import datetime, timezone
+from fastapi import Header, HTTPException, Query, status
+from typing import Optional, Tuple
+
+from src.util.config import settings
+
+logger = logging.getLogger(__name__)
+
+if settings.auth_secret_key:
+    token_secret = settings.auth_secret_key.encode("utf-8")
+else:
+    # 키가 없으면 프로세스마다 임의의 키를 쓴다. 재시작하면 토큰이 무효가 되고 워커 간에도 공유되지 않는다.
+    logger.warning("AUTH_SECRET_KEY가 설정되지 않아 임시 키로 토큰을 서명합니다.")
+    token_secret = secrets.token_bytes(32)
+
+
+def require_admin(x_admin_key: Optional[str] = Header(None)) -> None:
+    # ADMIN_API_KEY가 설정되지 않은 환경에서는 관리자 API를 모두 막는다.
+    if not settings.admin_api_key or not x_admin_key:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
+        )
+    
+    if not secrets.compare_digest(x_admin_key.encode("utf-8"), settings.admin_api_key.encode("utf-8")):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
+        )
+
+
+def sign(payload: str) -> str:
+    digest = hmac.new(token_secret, payload.encode("ascii"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def issue_token(user_id: int) -> Tuple[str, datetime]:
+    # 토큰 형식: "{user_id}.{만료 시각(unix)}.{HMAC-SHA256 서명}"
+    expires_at = int(time.time()) + settings.auth_token_ttl
+    payload = f"{user_id}.{expires_at}"
+    
+    return f"{payload}.{sign(payload)}", datetime.fromtimestamp(expires_at, tz=timezone.utc)
+
+
+def verify_token(token: str) -> Optional[int]:
+    # 서명과 만료 시각만 확인하므로 DB를 조회하지 않는다.
+    if not token.isascii():
+        return None
+    
+    payload, _, signature = token.rpartition(".")
+    user_id, _, expires_at = payload.partition(".")
+    
+    if not user_id.isdigit() or not expires_at.isdigit():
+        return None
+    
+    if not hmac.compare_digest(signature, sign(payload)):
+        return None
+    
+    if int(expires_at) <= time.time():
+        return None
+    
+    return int(user_id)
+
+
+def unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def user_id_from_token(token: Optional[str]) -> int:
+    if not token:
+        raise unauthorized("로그인이 필요합니다.")
+    
+    user_id = verify_token(token)
+    if user_id is None:
+        raise unauthorized("유효하지 않거나 만료된 토큰입니다.")
+    
+    return user_id
+
+
+def bearer_token(authorization: Optional[str]) -> Optional[str]:
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    return token.strip()
+
+
+def get_current_user_id(authorization: Optional[str] = Header(None)) -> int:
+    return user_id_from_token(bearer_token(authorization))
+
+
+def get_stream_user_id(
+    authorization: Optional[str] = Header(None),
+    access_token: Optional[str] = Query(None)
+) -> int:
+    # EventSource와 WebSocket은 브라우저에서 헤더를 지정할 수 없으므로 쿼리 파라미터의 토큰도 받는다.
+    return user_id_from_token(bearer_token(authorization) or access_token)
@@ -0,0 +1,169 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+import orjson
+
+from src.util.config import settings
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    # 구독자 한 명의 이벤트 큐. 크기가 제한되어 있어 느린 구독자가 발행자를 막거나 메모리를 계속 차지하지 않는다.
+    
+    def __init__(self, channel: int, max_size: int):
+        self.channel = channel
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue(max_size)
+        self.dropped = 0
+    
+    def push(self, message: bytes) -> bool:
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            pass
+        
+        # 큐가 가득 차면 쌓인 이벤트를 버리고 resync 이벤트 하나만 남긴다.
+        # 구독자는 resync를 받으면 전체 일정을 다시 조회한다.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.dropped += 1
+        self.queue.put_nowait(orjson.dumps({"type": "resync", "plan_id": self.channel}))
+        return False
+    
+    async def get(self) -> bytes:
+        return await self.queue.get()
+
+
+class Broadcaster:
+    # 채널(플랜 ID)별 이벤트 fan-out 인터페이스. 이벤트는 직렬화된 JSON(bytes)으로 주고받는다.
+    
+    def __init__(self, name: str, queue_size: int):
+        self.name = name
+        self.queue_size = queue_size
+        self.subscriptions: Dict[int, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+    
+    async def publish(self, channel: int, message: bytes) -> None:
+        raise NotImplementedError
+    
+    def idle(self) -> bool:
+        # 이벤트를 받을 구독자가 확실히 없으면 True. 발행자는 이벤트를 만드는 비용을 건너뛸 수 있다.
+        return False
+    
+    async def start(self) -> None:
+        pass
+    
+    async def close(self) -> None:
+        pass
+    
+    @asynccontextmanager
+    async def subscribe(self, channel: int) -> AsyncIterator[Subscription]:
+        await self.start()
+        
+        subscription = Subscription(channel, self.queue_size)
+        self.subscriptions.setdefault(channel, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self.subscriptions.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self.subscriptions[channel]
+    
+    def deliver(self, channel: int, message: bytes) -> None:
+        # 이 프로세스에 연결된 구독자에게만 전달한다. 큐에 넣기만 하므로 기다리지 않는다.
+        for subscription in self.subscriptions.get(channel, ()):
+            if subscription.push(message):
+                self.delivered += 1
+            else:
+                self.overflows += 1
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "channels": len(self.subscriptions),
+            "subscribers": sum(len(subscribers) for subscribers in self.subscriptions.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+        }
+
+
+class MemoryBroadcaster(Broadcaster):
+    # 프로세스 내 fan-out. 워커가 하나일 때 사용한다.
+    
+    async def publish(self, channel: int, message: bytes) -> None:
+        self.published += 1
+        self.deliver(channel, message)
+    
+    def idle(self) -> bool:
+        return not self.subscriptions
+
+
+class RedisBroadcaster(Broadcaster):
+    # Redis pub/sub으로 모든 워커에 이벤트를 전달한다. 발행한 워커도 Redis에서 받은 이벤트만 전달한다.
+    
+    def __init__(self, name: str, url: str, queue_size: int):
+        if redis is None:
+            raise RuntimeError("redis 패키지가 설치되어 있지 않습니다. (pip install redis)")
+        
+        super().__init__(name, queue_size)
+        self.prefix = f"travel-maker:{name}:"
+        self.client = redis.from_url(url)
+        self.listener: Optional[asyncio.Task] = None
+    
+    async def publish(self, channel: int, message: bytes) -> None:
+        self.published += 1
+        try:
+            await self.client.publish(f"{self.prefix}{channel}", message)
+        except Exception:
+            # 이벤트 발행 실패로 이미 커밋된 요청을 실패시키지 않는다.
+            logger.exception("이벤트 발행 실패: %s", channel)
+    
+    async def start(self) -> None:
+        if self.listener is None or self.listener.done():
+            self.listener = asyncio.create_task(self.listen())
+    
+    async def close(self) -> None:
+        if self.listener is not None:
+            self.listener.cancel()
+            self.listener = None
+        await self.client.aclose()
+    
+    async def listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.psubscribe(f"{self.prefix}*")
+                    async for message in pubsub.listen():
+                        if message["type"] != "pmessage":
+                            continue
+                        channel = int(message["channel"][len(self.prefix):])
+                        self.deliver(channel, message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("이벤트 구독 연결이 끊어졌습니다. 다시 연결합니다.")
+            
+            # 연결이 끊긴 동안의 이벤트는 잃어버렸으므로 모든 구독자에게 resync를 보낸다.
+            for channel in list(self.subscriptions):
+                self.deliver(channel, orjson.dumps({"type": "resync", "plan_id": channel}))
+            await asyncio.sleep(1)
+
+
+def create_broadcaster(name: str) -> Broadcaster:
+    if settings.event_backend == "redis":
+        return RedisBroadcaster(name, settings.redis_url, settings.event_queue_size)
+    
+    return MemoryBroadcaster(name, settings.event_queue_size)
@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import time
+
+from src.util.config import settings
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+
+class CacheBackend:
+    # 직렬화된 값(bytes)을 저장하는 캐시 인터페이스. 적중/실패/축출 횟수를 함께 기록한다.
+    
+    def __init__(self, name: str, ttl: int):
+        self.name = name
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+    
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        # ttl을 주면 이 항목만 기본 유효 시간 대신 ttl초 동안 보관한다.
+        raise NotImplementedError
+    
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+    
+    async def clear(self) -> None:
+        raise NotImplementedError
+    
+    def record(self, value: Optional[bytes]) -> Optional[bytes]:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class MemoryCacheBackend(CacheBackend):
+    # 프로세스 내 LRU 캐시. max_size를 넘으면 가장 오래 사용하지 않은 항목부터 축출한다.
+    
+    def __init__(self, name: str, max_size: int, ttl: int):
+        super().__init__(name, ttl)
+        self.max_size = max_size
+        self.expirations = 0
+        self.entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return self.record(None)
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            self.expirations += 1
+            return self.record(None)
+        
+        self.entries.move_to_end(key)
+        return self.record(value)
+    
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        self.entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self.entries.move_to_end(key)
+        
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    async def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+    
+    async def clear(self) -> None:
+        self.entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            **super().stats(),
+            "expirations": self.expirations,
+            "size": len(self.entries),
+            "max_size": self.max_size,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    # 여러 워커가 공유하는 Redis 캐시. 용량 제한과 축출은 Redis 서버의 maxmemory 정책을 따른다.
+    
+    def __init__(self, name: str, url: str, ttl: int):
+        if redis is None:
+            raise RuntimeError("redis 패키지가 설치되어 있지 않습니다. (pip install redis)")
+        
+        super().__init__(name, ttl)
+        self.prefix = f"travel-maker:{name}:"
+        self.client = redis.from_url(url)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.record(await self.client.get(self.prefix + key))
+    
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        await self.client.set(self.prefix + key, value, ex=self.ttl if ttl is None else ttl)
+    
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+    
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=self.prefix + "*")]
+        if keys:
+            await self.client.delete(*keys)
+
+
+def create_cache(name: str, max_size: int, ttl: int) -> CacheBackend:
+    if settings.cache_backend == "redis":
+        return RedisCacheBackend(name, settings.redis_url, ttl)
+    
+    return MemoryCacheBackend(name, max_size, ttl)
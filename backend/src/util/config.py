@@ -18,17 +18,66 @@ def get_env_file() -> str:
     return str(env_file)
 
 
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
 class Settings(BaseSettings):
     db_host: str = "localhost"
     db_port: int = 3306
     db_user: str = "root"
     db_password: str = ""
     db_name: str = "travel_maker"
+    db_url: Optional[str] = None
+    use_async_db: bool = True
     
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     debug: bool = False
     
+    password_pool_size: int = 2
+    password_queue_size: int = 32
+    bcrypt_rounds: int = 12
+    
+    page_size_default: int = 20
+    page_size_max: int = 100
+    
+    slot_order_gap: int = 1024
+    route_time_budget_ms: int = 50
+    
+    plan_search_max_results: int = 50
+    plan_search_ngram_size: int = 2
+    plan_search_index_ttl: int = 60
+    
+    cache_backend: str = "memory"
+    redis_url: str = "redis://localhost:6379/0"
+    itinerary_cache_size: int = 1024
+    itinerary_cache_ttl: int = 300
+    membership_cache_size: int = 10000
+    membership_cache_ttl: int = 300
+    membership_negative_cache_ttl: int = 10
+    
+    admin_api_key: Optional[str] = None
+    auth_secret_key: Optional[str] = None
+    auth_token_ttl: int = 7 * 24 * 60 * 60
+    export_batch_size: int = 500
+    
+    event_backend: str = "memory"
+    event_queue_size: int = 100
+    event_heartbeat_seconds: int = 15
+    
+    marker_grid_cell_size: float = 0.01
+    marker_grid_cache_size: int = 256
+    marker_nearby_radius_km: float = 1.0
+    marker_nearby_max: int = 50
+    marker_viewport_max: int = 2000
+    
+    health_probe_interval: float = 5.0
+    query_repeat_threshold: int = 3
+    
     model_config = SettingsConfigDict(
         env_file=get_env_file(),
         env_file_encoding="utf-8",
@@ -38,10 +87,25 @@ class Settings(BaseSettings):
     
     @property
     def database_url(self) -> str:
+        if self.db_url:
+            return self.db_url
+        
         return (
             f"mysql+pymysql://{self.db_user}:{self.db_password}"
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
+    
+    @property
+    def async_database_url(self) -> str:
+        if self.db_url:
+            scheme, _, rest = self.db_url.partition("://")
+            dialect = scheme.split("+")[0]
+            return f"{ASYNC_DRIVERS.get(dialect, scheme)}://{rest}"
+        
+        return (
+            f"mysql+aiomysql://{self.db_user}:{self.db_password}"
+            f"@{self.db_host}:{self.db_port}/{self.db_name}"
+        )
 
 
 settings = Settings()
@@ -1,16 +1,44 @@
-from sqlalchemy import create_engine, event
+from contextlib import asynccontextmanager
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import BigInteger, create_engine, event, text
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.sql import functions
+from typing import AsyncGenerator, AsyncIterator
 import logging
 
 from src.util.config import settings
+from src.util.metrics import TimedPoolMixin, instrument_engine
+from src.util.query_recorder import attach_query_recorder
 
 logger = logging.getLogger(__name__)
 
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
 engine = create_engine(
     settings.database_url,
     echo=settings.debug,
+    poolclass=TimedQueuePool,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    pool_size=10,
+    max_overflow=20,
+)
+
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=settings.debug,
+    poolclass=TimedAsyncQueuePool,
     pool_pre_ping=True,
     pool_recycle=3600,
     pool_size=10,
@@ -18,7 +46,6 @@ engine = create_engine(
 )
 
 
-@event.listens_for(engine, "connect")
 def set_mysql_charset(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("SET NAMES utf8mb4")
@@ -27,27 +54,163 @@ def set_mysql_charset(dbapi_connection, connection_record):
     cursor.close()
 
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
+
+# 테스트와 벤치마크는 MySQL 대신 SQLite 파일을 쓴다. 두 DB의 차이 중 동작에 영향을 주는 부분만 맞춘다.
+@compiles(BigInteger, "sqlite")
+def compile_big_integer_sqlite(type_, compiler, **kw):
+    # SQLite는 INTEGER PRIMARY KEY 컬럼만 자동 증가한다.
+    return "INTEGER"
+
+
+@compiles(functions.now, "sqlite")
+def compile_now_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP는 초 단위까지만 저장되어, SQLAlchemy가 바인딩하는 "... HH:MM:SS.ffffff" 형식과
+    # 문자열로 비교되는 (created_at, id) 커서 페이지네이션이 어긋난다. 같은 형식으로 맞춘다.
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+if engine.dialect.name == "mysql":
+    event.listen(engine, "connect", set_mysql_charset)
+    event.listen(async_engine.sync_engine, "connect", set_mysql_charset)
+elif engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+attach_query_recorder(engine)
+attach_query_recorder(async_engine.sync_engine)
+
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
 
+AsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    bind=async_engine
+)
+
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+class ThreadedStreamResult:
+    # AsyncResult.partitions()와 같은 방식으로 서버 측 커서의 결과를 나눠서 가져온다.
+    
+    def __init__(self, result):
+        self.result = result
+    
+    async def partitions(self, size=None):
+        try:
+            while True:
+                rows = await run_in_threadpool(self.result.fetchmany, size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            await run_in_threadpool(self.result.close)
+
+
+class ThreadedSession:
+    # AsyncSession과 같은 인터페이스로 동기 Session을 감싸고, 블로킹 호출은 스레드풀에서 실행한다.
+    # use_async_db=False 설정에서 기존 동기 드라이버 경로를 비교 측정하기 위해 사용한다.
+    
+    def __init__(self, sync_session: Session):
+        self.sync_session = sync_session
+    
+    @property
+    def bind(self):
+        return self.sync_session.get_bind()
+    
+    @property
+    def info(self):
+        return self.sync_session.info
+    
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+    
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+    
+    async def execute(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.execute, statement, params, **kwargs)
+    
+    async def scalar(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalar, statement, params, **kwargs)
+    
+    async def scalars(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalars, statement, params, **kwargs)
+    
+    async def stream(self, statement, params=None, **kwargs):
+        result = await run_in_threadpool(
+            self.sync_session.execute,
+            statement.execution_options(stream_results=True),
+            params,
+            **kwargs
+        )
+        return ThreadedStreamResult(result)
+    
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+    
+    async def refresh(self, instance, attribute_names=None) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance, attribute_names)
+    
+    async def delete(self, instance) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+    
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+    
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+    
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+    
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    if settings.use_async_db:
+        async with AsyncSessionLocal() as db:
+            yield db
+    else:
+        db = ThreadedSession(SessionLocal())
+        try:
+            yield db
+        finally:
+            await db.close()
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with session_scope() as db:
         yield db
-    finally:
-        db.close()
+
+
+def is_mysql(db) -> bool:
+    return db.bind.dialect.name == "mysql"
 
 
 def init_db() -> None:
+    from src.util.migration import upgrade_database
+    
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("데이터베이스 테이블 생성 완료")
+        upgrade_database()
+        logger.info("데이터베이스 마이그레이션 완료")
     except Exception as e:
         logger.error(f"데이터베이스 초기화 실패: {e}")
         raise
@@ -56,7 +219,7 @@ def init_db() -> None:
 def check_db_connection() -> bool:
     try:
         with engine.connect() as connection:
-            connection.execute("SELECT 1")
+            connection.execute(text("SELECT 1"))
         return True
     except Exception as e:
         logger.error(f"데이터베이스 연결 실패: {e}")
@@ -0,0 +1,26 @@
+import hashlib
+import json
+from fastapi import Response, status
+from typing import Any, Optional
+
+
+def make_etag(value: str) -> str:
+    return f'"{value}"'
+
+
+def hash_etag(*parts: Any) -> str:
+    raw = json.dumps(parts, separators=(",", ":"), default=str).encode("utf-8")
+    return make_etag(hashlib.sha1(raw).hexdigest())
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두사를 무시한다.
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
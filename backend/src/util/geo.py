@@ -0,0 +1,42 @@
+import math
+from typing import List, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def split_longitudes(min_lng: float, max_lng: float) -> List[Tuple[float, float]]:
+    # 날짜 변경선을 지나는 범위(min_lng > max_lng)는 두 구간으로 나눈다.
+    if min_lng <= max_lng:
+        return [(min_lng, max_lng)]
+    return [(min_lng, 180.0), (-180.0, max_lng)]
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    # 중심에서 radius_km 이내의 모든 점을 포함하는 (min_lat, max_lat, min_lng, max_lng)
+    delta_lat = radius_km / KM_PER_DEGREE
+    min_lat = max(-90.0, lat - delta_lat)
+    max_lat = min(90.0, lat + delta_lat)
+    
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return min_lat, max_lat, -180.0, 180.0
+    
+    delta_lng = math.degrees(math.asin(min(1.0, math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(lat)))))
+    if delta_lng >= 180.0 or radius_km >= MAX_DISTANCE_KM / 2:
+        return min_lat, max_lat, -180.0, 180.0
+    
+    min_lng = lng - delta_lng
+    max_lng = lng + delta_lng
+    if min_lng < -180.0:
+        min_lng += 360.0
+    if max_lng > 180.0:
+        max_lng -= 360.0
+    
+    return min_lat, max_lat, min_lng, max_lng
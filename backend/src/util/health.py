@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, Dict, Optional
+
+from src.util.config import settings
+from src.util.database import check_db_connection, engine, async_engine
+
+logger = logging.getLogger(__name__)
+
+
+def pool_status(pool) -> Dict[str, int]:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+class DatabaseProbe:
+    # 주기적으로 DB 연결을 확인하고 결과를 보관한다. /health는 요청마다 커넥션을 쓰지 않고 이 결과만 읽는다.
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.connected = False
+        self.latency_ms: Optional[float] = None
+        self.checked_at: Optional[datetime] = None
+        self.checked_monotonic: Optional[float] = None
+        self.failures = 0
+        self.task: Optional[asyncio.Task] = None
+    
+    async def probe(self) -> bool:
+        started = time.perf_counter()
+        connected = await run_in_threadpool(check_db_connection)
+        elapsed = time.perf_counter() - started
+        
+        if connected != self.connected:
+            logger.info(f"데이터베이스 상태 변경: {'connected' if connected else 'disconnected'}")
+        
+        self.connected = connected
+        self.latency_ms = round(elapsed * 1000, 3)
+        self.checked_at = datetime.now(timezone.utc)
+        self.checked_monotonic = time.monotonic()
+        if not connected:
+            self.failures += 1
+        
+        return connected
+    
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.probe()
+            except Exception as e:
+                logger.error(f"데이터베이스 상태 확인 실패: {e}")
+    
+    async def start(self) -> bool:
+        connected = await self.probe()
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+        return connected
+    
+    async def stop(self) -> None:
+        if self.task is None:
+            return
+        
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.task = None
+    
+    @property
+    def stale(self) -> bool:
+        # 확인 작업이 멈춰 결과가 오래되었으면 연결 상태를 신뢰하지 않는다.
+        if self.checked_monotonic is None:
+            return True
+        return time.monotonic() - self.checked_monotonic > self.interval * 3
+    
+    @property
+    def healthy(self) -> bool:
+        return self.connected and not self.stale
+    
+    def details(self) -> Dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "stale": self.stale,
+            "checked_at": self.checked_at,
+            "latency_ms": self.latency_ms,
+            "failures": self.failures,
+            "interval": self.interval,
+            "pool": {
+                "sync": pool_status(engine.pool),
+                "async": pool_status(async_engine.pool),
+            },
+        }
+
+
+db_probe = DatabaseProbe(settings.health_probe_interval)
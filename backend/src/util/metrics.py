@@ -0,0 +1,326 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric:
+    type = "untyped"
+    
+    def __init__(self, registry: "MetricsRegistry", name: str, help: str, label_names: Sequence[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        registry.metrics.append(self)
+
+
+class Counter(Metric):
+    type = "counter"
+    
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        values = self.registry.shard()
+        key = (self, label_values)
+        values[key] = values.get(key, 0) + amount
+
+
+class Gauge(Counter):
+    # 스레드별 증감을 수집 시점에 합산한다. 같은 스레드에서 inc/dec 하는 값(처리 중인 요청 수 등)에 사용한다.
+    type = "gauge"
+    
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        self.inc(*label_values, amount=-amount)
+
+
+class Histogram(Metric):
+    type = "histogram"
+    
+    def __init__(self, registry, name, help, label_names=(), buckets: Sequence[float] = DURATION_BUCKETS):
+        super().__init__(registry, name, help, label_names)
+        self.buckets = tuple(buckets)
+    
+    def observe(self, value: float, *label_values: str) -> None:
+        # [버킷별 개수..., +Inf 개수, 합계]. 누적 개수는 수집할 때 계산한다.
+        values = self.registry.shard()
+        key = (self, label_values)
+        entry = values.get(key)
+        if entry is None:
+            entry = values[key] = [0] * (len(self.buckets) + 2)
+        entry[bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+
+
+class CallbackMetric(Metric):
+    # 다른 모듈이 이미 가지고 있는 값(풀 상태, 캐시 통계 등)을 수집 시점에 읽는다.
+    
+    def __init__(self, registry, name, help, label_names, metric_type: str, collect: Callable[[], Dict[LabelValues, float]]):
+        super().__init__(registry, name, help, label_names)
+        self.type = metric_type
+        self.collect = collect
+
+
+def merge(total: dict, values: dict) -> None:
+    for key, value in values.items():
+        if isinstance(value, list):
+            entry = total.get(key)
+            if entry is None:
+                total[key] = list(value)
+            else:
+                for index, count in enumerate(value):
+                    entry[index] += count
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class MetricsRegistry:
+    # 기록은 스레드별 dict에만 쓰므로 락이 없다. 수집(/metrics) 시점에 모든 스레드의 값을 합산한다.
+    # 종료된 스레드의 값은 retired로 옮겨 누적값을 유지한다.
+    
+    def __init__(self):
+        self.metrics: List[Metric] = []
+        self.shards: List[Tuple[threading.Thread, dict]] = []
+        self.retired: dict = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+    
+    def shard(self) -> dict:
+        try:
+            return self.local.values
+        except AttributeError:
+            values = self.local.values = {}
+            with self.lock:
+                self.shards.append((threading.current_thread(), values))
+            return values
+    
+    def counter(self, name: str, help: str, label_names: Sequence[str] = ()) -> Counter:
+        return Counter(self, name, help, label_names)
+    
+    def gauge(self, name: str, help: str, label_names: Sequence[str] = ()) -> Gauge:
+        return Gauge(self, name, help, label_names)
+    
+    def histogram(self, name: str, help: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DURATION_BUCKETS) -> Histogram:
+        return Histogram(self, name, help, label_names, buckets)
+    
+    def callback(self, name: str, help: str, label_names: Sequence[str], metric_type: str, collect: Callable[[], Dict[LabelValues, float]]) -> CallbackMetric:
+        return CallbackMetric(self, name, help, label_names, metric_type, collect)
+    
+    def snapshot(self) -> dict:
+        with self.lock:
+            alive = []
+            for thread, values in self.shards:
+                if thread.is_alive():
+                    alive.append((thread, values))
+                else:
+                    merge(self.retired, values)
+            self.shards = alive
+            
+            total: dict = {}
+            merge(total, self.retired)
+            for _, values in alive:
+                # 다른 스레드가 기록 중일 수 있으므로 복사본을 합산한다. 값 하나가 한 번의 수집에서 빠지는 정도는 허용한다.
+                merge(total, dict(values))
+        
+        return total
+    
+    def render(self) -> str:
+        total = self.snapshot()
+        series: Dict[Metric, List[Tuple[LabelValues, object]]] = {}
+        for (metric, label_values), value in total.items():
+            series.setdefault(metric, []).append((label_values, value))
+        
+        lines = []
+        for metric in self.metrics:
+            if isinstance(metric, CallbackMetric):
+                samples = sorted(metric.collect().items())
+            else:
+                samples = sorted(series.get(metric, []))
+            
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            
+            for label_values, value in samples:
+                if isinstance(metric, Histogram):
+                    lines.extend(self.render_histogram(metric, label_values, value))
+                else:
+                    lines.append(f"{metric.name}{format_labels(metric.label_names, label_values)} {format_value(value)}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def render_histogram(self, metric: Histogram, label_values: LabelValues, entry: list) -> List[str]:
+        names = metric.label_names + ("le",)
+        lines = []
+        cumulative = 0
+        for bound, count in zip(metric.buckets + (float("inf"),), entry):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else format_value(float(bound))
+            lines.append(f"{metric.name}_bucket{format_labels(names, label_values + (le,))} {cumulative}")
+        lines.append(f"{metric.name}_sum{format_labels(metric.label_names, label_values)} {format_value(entry[-1])}")
+        lines.append(f"{metric.name}_count{format_labels(metric.label_names, label_values)} {cumulative}")
+        return lines
+
+
+metrics = MetricsRegistry()
+
+http_requests_total = metrics.counter(
+    "http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration_seconds = metrics.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+http_requests_in_flight = metrics.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수"
+)
+http_request_db_statements = metrics.histogram(
+    "http_request_db_statements", "요청 하나가 실행한 SQL 문 수", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+http_request_db_seconds = metrics.histogram(
+    "http_request_db_seconds", "요청 하나가 SQL 실행에 쓴 시간", ("method", "route")
+)
+http_request_db_connection_seconds = metrics.histogram(
+    "http_request_db_connection_seconds", "요청 하나가 풀 커넥션을 점유한 시간", ("method", "route")
+)
+db_statements_total = metrics.counter(
+    "db_statements_total", "실행한 SQL 문 수", ("engine",)
+)
+db_statement_duration_seconds = metrics.histogram(
+    "db_statement_duration_seconds", "SQL 문 실행 시간", ("engine",), QUERY_DURATION_BUCKETS
+)
+db_pool_checkout_seconds = metrics.histogram(
+    "db_pool_checkout_seconds", "풀에서 커넥션을 얻기까지 기다린 시간", ("engine",), QUERY_DURATION_BUCKETS
+)
+
+
+class RequestMetrics:
+    # 요청 하나 동안의 DB 사용량. 미들웨어가 contextvar에 넣고 커서/풀 이벤트가 누적한다.
+    
+    __slots__ = ("statements", "db_seconds", "connection_seconds")
+    
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.connection_seconds = 0.0
+
+
+current_request: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request", default=None)
+
+
+def route_label(scope) -> str:
+    # 경로 파라미터별로 시계열이 늘어나지 않도록 매칭된 라우트의 경로 템플릿을 쓴다.
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    # 라우트별 지연 시간과 요청당 SQL 사용량을 기록하는 ASGI 미들웨어.
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        request = RequestMetrics()
+        token = current_request.set(request)
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            current_request.reset(token)
+            
+            method = scope["method"]
+            route = route_label(scope)
+            http_requests_total.inc(method, route, str(status_code))
+            http_request_duration_seconds.observe(elapsed, method, route)
+            http_request_db_statements.observe(request.statements, method, route)
+            if request.statements:
+                http_request_db_seconds.observe(request.db_seconds, method, route)
+            if request.connection_seconds:
+                http_request_db_connection_seconds.observe(request.connection_seconds, method, route)
+
+
+class TimedPoolMixin:
+    # 커넥션을 얻을 때까지(풀이 가득 차 대기하거나 새로 연결하는 시간 포함)를 측정한다.
+    metrics_label = "default"
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - started, self.metrics_label)
+
+
+def instrument_engine(engine, label: str) -> None:
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+    
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_started"].pop()
+        db_statements_total.inc(label)
+        db_statement_duration_seconds.observe(elapsed, label)
+        
+        request = current_request.get()
+        if request is not None:
+            request.statements += 1
+            request.db_seconds += elapsed
+    
+    def handle_error(context):
+        started = context.connection.info.get("metrics_started") if context.connection is not None else None
+        if started:
+            started.pop()
+    
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["metrics_checkout"] = (time.perf_counter(), current_request.get())
+    
+    def checkin(dbapi_connection, connection_record):
+        checked_out = connection_record.info.pop("metrics_checkout", None)
+        if checked_out is None:
+            return
+        
+        started, request = checked_out
+        if request is not None:
+            request.connection_seconds += time.perf_counter() - started
+    
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+    event.listen(engine, "checkout", checkout)
+    event.listen(engine, "checkin", checkin)
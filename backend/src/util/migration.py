@@ -0,0 +1,84 @@
+from alembic import command, op
+from alembic.config import Config
+from pathlib import Path
+from sqlalchemy import inspect
+from typing import List, Optional
+import logging
+
+from src.util.database import engine
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+BASELINE_REVISION = "0001"
+
+
+def get_alembic_config() -> Config:
+    config = Config(str(BASE_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BASE_DIR / "migrations"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_database(revision: str = "head") -> None:
+    config = get_alembic_config()
+    
+    with engine.connect() as connection:
+        table_names = inspect(connection).get_table_names()
+    
+    if "alembic_version" not in table_names and "plans" in table_names:
+        # create_all로 만들어진 기존 데이터베이스는 초기 스키마 리비전으로 표시한 뒤 업그레이드한다.
+        logger.info("기존 데이터베이스를 초기 리비전으로 표시합니다.")
+        command.stamp(config, BASELINE_REVISION)
+    
+    command.upgrade(config, revision)
+
+
+def add_index(
+    table_name: str,
+    index_name: str,
+    columns: List[str],
+    unique: bool = False,
+    prefix: Optional[str] = None,
+    parser: Optional[str] = None
+) -> None:
+    if has_index(table_name, index_name):
+        # create_all로 만들어진 데이터베이스에는 일부 인덱스가 이미 있을 수 있다.
+        return
+    
+    if op.get_bind().dialect.name != "mysql":
+        if prefix is None:
+            op.create_index(index_name, table_name, columns, unique=unique)
+        return
+    
+    # MySQL에서는 테이블 잠금 없이(온라인 DDL) 인덱스를 추가한다. FULLTEXT/SPATIAL은 LOCK=NONE을 지원하지 않는다.
+    kind = "UNIQUE INDEX" if unique else f"{prefix} INDEX" if prefix else "INDEX"
+    with_parser = f" WITH PARSER {parser}" if parser else ""
+    lock = "SHARED" if prefix in ("FULLTEXT", "SPATIAL") else "NONE"
+    
+    op.execute(
+        f"ALTER TABLE {table_name} ADD {kind} {index_name} ({', '.join(columns)}){with_parser}, "
+        f"ALGORITHM=INPLACE, LOCK={lock}"
+    )
+
+
+def has_table(table_name: str) -> bool:
+    return inspect(op.get_bind()).has_table(table_name)
+
+
+def has_index(table_name: str, index_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    names = {index["name"] for index in inspector.get_indexes(table_name)}
+    names.update(constraint["name"] for constraint in inspector.get_unique_constraints(table_name))
+    return index_name in names
+
+
+def drop_index(table_name: str, index_name: str) -> None:
+    if not has_index(table_name, index_name):
+        return
+    
+    if op.get_bind().dialect.name != "mysql":
+        op.drop_index(index_name, table_name)
+        return
+    
+    op.execute(f"ALTER TABLE {table_name} DROP INDEX {index_name}, ALGORITHM=INPLACE, LOCK=NONE")
@@ -0,0 +1,35 @@
+import base64
+import json
+from fastapi import HTTPException, status
+from typing import Any, Dict, Optional
+
+from src.util.config import settings
+
+
+def resolve_page_size(limit: Optional[int]) -> int:
+    return min(limit or settings.page_size_default, settings.page_size_max)
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="잘못된 커서입니다."
+    )
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *keys: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        values = None
+    
+    if not isinstance(values, dict) or any(key not in values for key in keys):
+        raise invalid_cursor()
+    
+    return values
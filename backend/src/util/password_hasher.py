@@ -0,0 +1,73 @@
+import asyncio
+import bcrypt
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.util.config import settings
+
+
+class PasswordPoolFullError(Exception):
+    pass
+
+
+def _hashpw(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _checkpw(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+
+class PasswordHasher:
+    # bcrypt 연산은 이벤트 루프를 막지 않도록 전용 프로세스 풀에서 실행한다.
+    # 실행 중 + 대기 중 작업 수가 max_workers + max_queue에 도달하면 즉시 거절한다.
+    
+    def __init__(self, max_workers: int, max_queue: int, rounds: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rounds = rounds
+        self.pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    @property
+    def is_full(self) -> bool:
+        return self.pending >= self.max_workers + self.max_queue
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+    
+    async def _submit(self, fn, *args):
+        if self.is_full:
+            raise PasswordPoolFullError()
+        
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self.pending -= 1
+    
+    async def hash(self, password: str) -> str:
+        hashed = await self._submit(_hashpw, password.encode('utf-8'), self.rounds)
+        return hashed.decode('utf-8')
+    
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(_checkpw, plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_pool_size,
+    max_queue=settings.password_queue_size,
+    rounds=settings.bcrypt_rounds
+)
@@ -0,0 +1,167 @@
+import functools
+import inspect
+import logging
+import os
+import sys
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from src.util.config import settings
+
+try:
+    from greenlet import getcurrent
+except ImportError:
+    getcurrent = None
+
+logger = logging.getLogger(__name__)
+
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+UTIL_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+def find_call_site(frame) -> Optional[str]:
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(SOURCE_DIR) and not filename.startswith(UTIL_DIR):
+            return f"{os.path.relpath(filename, os.path.dirname(SOURCE_DIR.rstrip(os.sep)))}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return None
+
+
+def call_site() -> str:
+    # AsyncSession은 greenlet 안에서 커서를 실행하므로, 현재 스택에 서비스 코드가 없으면 부모 greenlet의 스택을 본다.
+    site = find_call_site(sys._getframe())
+    if site is None and getcurrent is not None:
+        parent = getcurrent().parent
+        if parent is not None:
+            site = find_call_site(parent.gr_frame)
+    return site or "?"
+
+
+class QueryRecorder:
+    # 실행된 SQL 문과 호출 위치를 모은다. 같은 SQL이 파라미터만 바뀌어 반복되면 N+1 쿼리를 의심할 수 있다.
+    
+    def __init__(self):
+        self.statements: List[Tuple[str, str]] = []
+    
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+    
+    def record(self, statement: str, site: str) -> None:
+        self.statements.append((statement, site))
+    
+    def repeated(self, threshold: int) -> List[Tuple[str, int, Dict[str, int]]]:
+        sites_by_statement: Dict[str, Counter] = {}
+        for statement, site in self.statements:
+            sites_by_statement.setdefault(statement, Counter())[site] += 1
+        
+        return sorted(
+            (
+                (statement, sum(sites.values()), dict(sites))
+                for statement, sites in sites_by_statement.items()
+                if sum(sites.values()) >= threshold
+            ),
+            key=lambda item: -item[1]
+        )
+    
+    def report(self, threshold: int) -> str:
+        lines = []
+        for statement, count, sites in self.repeated(threshold):
+            lines.append(f"{count}회: {' '.join(statement.split())}")
+            lines.extend(f"    {site} x{site_count}" for site, site_count in sites.items())
+        return "\n".join(lines)
+
+
+current_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar("current_recorder", default=None)
+
+# query_budget은 테스트 클라이언트가 요청을 다른 스레드/태스크에서 처리해도 잡을 수 있도록 프로세스 전체에 등록한다.
+global_recorders: List[QueryRecorder] = []
+
+
+def record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    recorder = current_recorder.get()
+    if recorder is None and not global_recorders:
+        return
+    
+    site = call_site()
+    if recorder is not None:
+        recorder.record(statement, site)
+    for global_recorder in global_recorders:
+        if global_recorder is not recorder:
+            global_recorder.record(statement, site)
+
+
+def attach_query_recorder(engine) -> None:
+    event.listen(engine, "before_cursor_execute", record_statement)
+
+
+class QueryLogMiddleware:
+    # debug 모드에서 요청마다 같은 SQL이 QUERY_REPEAT_THRESHOLD번 이상 실행되면 호출 위치와 함께 경고를 남긴다.
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        recorder = QueryRecorder()
+        token = current_recorder.set(recorder)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_recorder.reset(token)
+            
+            report = recorder.report(settings.query_repeat_threshold)
+            if report:
+                logger.warning(
+                    f"반복 쿼리 감지: {scope['method']} {scope['path']} (총 {recorder.count}개)\n{report}"
+                )
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class query_budget:
+    # 블록(또는 함수) 안에서 실행된 SQL 문 수가 max_queries를 넘으면 QueryBudgetExceeded를 던진다.
+    # with query_budget(3): client.get(...) 또는 @query_budget(3)처럼 쓰며 async 함수에도 붙일 수 있다.
+    
+    def __init__(self, max_queries: int, repeat_threshold: int = 2):
+        self.max_queries = max_queries
+        self.repeat_threshold = repeat_threshold
+        self.recorder: Optional[QueryRecorder] = None
+    
+    def __enter__(self) -> QueryRecorder:
+        self.recorder = QueryRecorder()
+        global_recorders.append(self.recorder)
+        return self.recorder
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        global_recorders.remove(self.recorder)
+        
+        if exc_type is None and self.recorder.count > self.max_queries:
+            message = f"쿼리 {self.recorder.count}개 실행 (허용: {self.max_queries}개)"
+            report = self.recorder.report(self.repeat_threshold)
+            if report:
+                message += f"\n{report}"
+            raise QueryBudgetExceeded(message)
+    
+    def __call__(self, func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with query_budget(self.max_queries, self.repeat_threshold):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with query_budget(self.max_queries, self.repeat_threshold):
+                return func(*args, **kwargs)
+        return wrapper
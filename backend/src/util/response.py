@@ -0,0 +1,29 @@
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Dict, List, Optional, Type
+
+
+def projected_columns(model, schema: Type[BaseModel]) -> List:
+    # 응답 스키마에 필요한 컬럼만 조회해 ORM 엔티티 생성 비용을 줄인다.
+    table = model.__table__
+    return [table.c[name] for name in schema.model_fields if name in table.c]
+
+
+def dump_json(adapter: TypeAdapter, data: Any) -> bytes:
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    data: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    # 미리 만들어 둔 TypeAdapter로 pydantic-core에서 바로 JSON bytes를 만든다.
+    # FastAPI의 response_model 재검증과 jsonable_encoder 변환을 건너뛴다.
+    return Response(
+        content=dump_json(adapter, data),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
@@ -0,0 +1,126 @@
+import time
+import numpy as np
+from typing import List, Sequence, Tuple
+from src.util.geo import EARTH_RADIUS_KM
+
+
+def haversine_matrix(points: Sequence[Tuple[float, float]]) -> np.ndarray:
+    # (위도, 경도) 목록의 모든 쌍에 대한 거리(km) 행렬
+    coords = np.radians(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+    lat = coords[:, 0]
+    lng = coords[:, 1]
+    
+    d_lat = lat[:, None] - lat[None, :]
+    d_lng = lng[:, None] - lng[None, :]
+    a = np.sin(d_lat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(d_lng / 2) ** 2
+    
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def route_length(distances: np.ndarray, order: Sequence[int]) -> float:
+    order = np.asarray(order, dtype=np.intp)
+    if len(order) < 2:
+        return 0.0
+    return float(distances[order[:-1], order[1:]].sum())
+
+
+def nearest_neighbour(distances: np.ndarray, pinned: np.ndarray) -> np.ndarray:
+    # 고정된 위치는 그대로 두고, 빈 위치는 직전 지점에서 가장 가까운 남은 지점으로 채운다.
+    size = len(pinned)
+    route = np.arange(size)
+    remaining = np.flatnonzero(~pinned)
+    
+    for position in range(size):
+        if pinned[position]:
+            continue
+        
+        if position == 0:
+            # 출발지는 사용자가 정한 첫 지점을 그대로 쓴다.
+            chosen = 0
+        else:
+            chosen = int(np.argmin(distances[route[position - 1], remaining]))
+        
+        route[position] = remaining[chosen]
+        remaining = np.delete(remaining, chosen)
+    
+    return route
+
+
+def improve_route(distances: np.ndarray, route: np.ndarray, pinned: np.ndarray, deadline: float) -> np.ndarray:
+    # 양 끝에 모든 지점과 거리가 0인 가상 지점을 두어 열린 경로도 같은 식으로 계산한다.
+    size = len(route)
+    padded = np.zeros((size + 1, size + 1))
+    padded[:size, :size] = distances
+    dummy = size
+    
+    route = np.concatenate(([dummy], route, [dummy]))
+    fixed = np.concatenate(([True], pinned, [True]))
+    fixed_count = np.concatenate(([0], np.cumsum(fixed)))
+    free_positions = np.flatnonzero(~fixed)
+    
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        
+        # 2-opt: 고정 지점이 없는 구간 [i, j]를 뒤집는다.
+        for i in range(1, size):
+            if fixed[i]:
+                continue
+            
+            j = np.arange(i + 1, size + 1)
+            j = j[fixed_count[j + 1] - fixed_count[i] == 0]
+            if not len(j):
+                continue
+            
+            a, b = route[i - 1], route[i]
+            c, d = route[j], route[j + 1]
+            delta = padded[a, c] + padded[b, d] - padded[a, b] - padded[c, d]
+            
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                route[i:j[best] + 1] = route[i:j[best] + 1][::-1]
+                improved = True
+        
+        # 교환: 고정 지점을 사이에 둔 두 지점도 서로 자리를 바꿀 수 있게 한다.
+        for index, i in enumerate(free_positions):
+            j = free_positions[index + 1:]
+            j = j[j > i + 1]
+            if not len(j):
+                continue
+            
+            prev_i, node_i, next_i = route[i - 1], route[i], route[i + 1]
+            prev_j, node_j, next_j = route[j - 1], route[j], route[j + 1]
+            delta = (
+                padded[prev_i, node_j] + padded[node_j, next_i] + padded[prev_j, node_i] + padded[node_i, next_j]
+                - padded[prev_i, node_i] - padded[node_i, next_i] - padded[prev_j, node_j] - padded[node_j, next_j]
+            )
+            
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                route[i], route[j[best]] = route[j[best]], route[i]
+                improved = True
+    
+    return route[1:-1]
+
+
+def optimize_route(
+    points: Sequence[Tuple[float, float]],
+    pinned: Sequence[bool],
+    time_budget_ms: float
+) -> List[int]:
+    # 현재 순서의 지점 목록을 받아, 고정 지점의 위치는 유지하면서 이동 거리가 짧은 방문 순서(원래 인덱스 목록)를 반환한다.
+    size = len(points)
+    if size < 3:
+        return list(range(size))
+    
+    deadline = time.perf_counter() + time_budget_ms / 1000
+    distances = haversine_matrix(points)
+    pinned = np.asarray(pinned, dtype=bool)
+    
+    # 최근접 이웃으로 만든 순서와 현재 순서를 각각 개선해 더 짧은 쪽을 쓴다. 현재 순서보다 나빠지는 일은 없다.
+    routes = [
+        improve_route(distances, nearest_neighbour(distances, pinned), pinned, deadline),
+        improve_route(distances, np.arange(size), pinned, deadline)
+    ]
+    
+    return min(routes, key=lambda route: route_length(distances, route)).tolist()
@@ -0,0 +1,15 @@
+from datetime import time
+from typing import Optional
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def seconds_of(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def time_of(seconds: int) -> Optional[time]:
+    # 자정을 넘는 시각은 time으로 표현할 수 없으므로 None을 반환한다.
+    if not 0 <= seconds < SECONDS_PER_DAY:
+        return None
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
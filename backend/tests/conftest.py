@@ -0,0 +1,190 @@
+import itertools
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, time as dtime, timedelta
+from typing import Callable, Dict, List
+
+import pytest
+
+# src의 설정과 엔진은 import 시점에 환경 변수를 읽으므로 src보다 먼저 설정한다.
+# 기본은 임시 SQLite 파일이며, TEST_DB_URL을 주면 그 DB(테스트 전용 MySQL 등)에 마이그레이션을 적용해 실행한다.
+TEST_DIR = tempfile.mkdtemp(prefix="travel-maker-test-")
+os.environ["DB_URL"] = os.environ.get("TEST_DB_URL") or f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}"
+os.environ["DEBUG"] = "false"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["EVENT_BACKEND"] = "memory"
+os.environ["AUTH_SECRET_KEY"] = "test-secret-key"
+os.environ["BCRYPT_ROUNDS"] = "4"
+
+from fastapi.testclient import TestClient
+
+from main import app
+from src.model.day_schedule import DaySchedule
+from src.model.marker import Marker
+from src.model.plan import Plan
+from src.model.schedule_slot import ScheduleSlot
+from src.model.slot_vote_tally import SlotVoteTally
+from src.model.slot_voting import SlotVoting
+from src.model.user import User
+from src.model.users_in_plan import UsersInPlan
+from src.util.auth import issue_token
+from src.util.config import settings
+from src.util.database import SessionLocal, engine
+from src.util.migration import upgrade_database
+from src.util.query_recorder import QueryRecorder, global_recorders, query_budget
+
+API = "/api/v1"
+
+sequence = itertools.count(1)
+
+
+@dataclass
+class SeededPlan:
+    id: int
+    owner_id: int
+    member_ids: List[int]
+    day_ids: List[int] = field(default_factory=list)
+    slot_ids: Dict[int, List[int]] = field(default_factory=dict)
+    marker_ids: List[int] = field(default_factory=list)
+
+
+def create_users(session, count: int) -> List[int]:
+    users = [User(nickname=f"tester{next(sequence)}", password="-", thumbnail="") for _ in range(count)]
+    session.add_all(users)
+    session.flush()
+    return [user.id for user in users]
+
+
+def create_plan(members: int = 1, days: int = 1, slots: int = 1, markers: int = 1, votes: int = 0) -> SeededPlan:
+    # 플랜 소유자를 포함한 members명의 멤버, days일치 일정과 일정마다 slots개의 슬롯, markers개의 마커를 만든다.
+    # 슬롯마다 앞쪽 votes명의 멤버가 투표하며 집계 테이블도 함께 채운다.
+    with SessionLocal() as session:
+        member_ids = create_users(session, members)
+        plan = Plan(
+            name=f"테스트 여행 {next(sequence)}",
+            init_latitude=37.5,
+            init_longitude=127.0,
+            start_date=date(2024, 5, 1),
+            end_date=date(2024, 5, 1) + timedelta(days=max(days - 1, 0)),
+            created_user_id=member_ids[0]
+        )
+        session.add(plan)
+        session.flush()
+        
+        session.add_all(
+            UsersInPlan(user_id=user_id, plan_id=plan.id, owner=index == 0)
+            for index, user_id in enumerate(member_ids)
+        )
+        
+        marker_rows = [
+            Marker(
+                plan_id=plan.id,
+                name=f"마커 {index}",
+                latitude=37.5 + index * 0.001,
+                longitude=127.0 + index * 0.001,
+                created_user_id=member_ids[0]
+            )
+            for index in range(markers)
+        ]
+        session.add_all(marker_rows)
+        session.flush()
+        
+        seeded = SeededPlan(plan.id, member_ids[0], member_ids, marker_ids=[marker.id for marker in marker_rows])
+        for day_index in range(days):
+            day = DaySchedule(
+                plan_id=plan.id,
+                date=plan.start_date + timedelta(days=day_index),
+                start_time=dtime(9),
+                end_time=dtime(21),
+                planned_seconds=slots * 3600,
+                last_order_num=slots * settings.slot_order_gap
+            )
+            session.add(day)
+            session.flush()
+            
+            slot_rows = [
+                ScheduleSlot(
+                    day_schedule_id=day.id,
+                    name=f"슬롯 {index}",
+                    spending_time=dtime(1),
+                    order_num=(index + 1) * settings.slot_order_gap
+                )
+                for index in range(slots)
+            ]
+            session.add_all(slot_rows)
+            session.flush()
+            
+            for slot in slot_rows:
+                counts: Dict[int, int] = {}
+                for voter_index, user_id in enumerate(member_ids[:votes]):
+                    marker_id = seeded.marker_ids[voter_index % len(seeded.marker_ids)]
+                    session.add(SlotVoting(schedule_slot_id=slot.id, marker_id=marker_id, voted_user_id=user_id))
+                    counts[marker_id] = counts.get(marker_id, 0) + 1
+                session.add_all(
+                    SlotVoteTally(schedule_slot_id=slot.id, marker_id=marker_id, vote_count=count)
+                    for marker_id, count in counts.items()
+                )
+            
+            seeded.day_ids.append(day.id)
+            seeded.slot_ids[day.id] = [slot.id for slot in slot_rows]
+        
+        session.commit()
+    
+    return seeded
+
+
+def pytest_collection_modifyitems(config, items):
+    if engine.dialect.name == "mysql":
+        return
+    
+    skip_mysql = pytest.mark.skip(reason="TEST_DB_URL에 MySQL을 지정해야 실행됩니다.")
+    for item in items:
+        if "mysql" in item.keywords:
+            item.add_marker(skip_mysql)
+
+
+@pytest.fixture(scope="session")
+def database() -> None:
+    upgrade_database()
+
+
+@pytest.fixture(scope="session")
+def client(database):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def make_plan(database) -> Callable[..., SeededPlan]:
+    return create_plan
+
+
+@pytest.fixture
+def auth_headers() -> Callable[[int], Dict[str, str]]:
+    def headers(user_id: int) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {issue_token(user_id)[0]}"}
+    
+    return headers
+
+
+@pytest.fixture
+def query_recorder():
+    # 테스트 본문에서 실행된 SQL 문을 모두 모은다. recorder.count, recorder.repeated(n)으로 확인한다.
+    recorder = QueryRecorder()
+    global_recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        global_recorders.remove(recorder)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    # @pytest.mark.query_budget(n)이 붙은 테스트는 픽스처 준비를 뺀 본문의 SQL 문 수가 n을 넘으면 실패한다.
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+    
+    with query_budget(*marker.args, **marker.kwargs):
+        return (yield)
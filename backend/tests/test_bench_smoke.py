@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_bench(module, tmp_path, *args):
+    # 벤치마크 모듈은 import 시점에 DB 설정을 바꾸므로 테스트 프로세스와 분리해서 실행한다.
+    env = {
+        **os.environ,
+        "BENCH_DATA_DIR": str(tmp_path / "data"),
+        "BENCH_RESULTS_DIR": str(tmp_path / "results"),
+    }
+    completed = subprocess.run(
+        [sys.executable, "-m", module, *args],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_generate_and_services_run_at_small_scale(tmp_path):
+    run_bench("bench.generate", tmp_path, "--scale", "small")
+    output = tmp_path / "services.json"
+    run_bench("bench.services", tmp_path, "--iterations", "1", "--warmup", "0", "--output", str(output))
+    
+    manifest = json.loads((tmp_path / "data" / "dataset.json").read_text())
+    results = json.loads(output.read_text())["results"]
+    
+    assert manifest["scale"] == "small"
+    assert "plan.get_plan_itinerary" in [result["name"] for result in results]
+    assert all(result["errors"] == 0 for result in results)
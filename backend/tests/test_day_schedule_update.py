@@ -0,0 +1,62 @@
+from sqlalchemy import func, inspect, select
+
+from src.model.day_schedule import DaySchedule
+from src.model.schedule_slot import ScheduleSlot
+from src.util.database import SessionLocal
+
+from conftest import API
+
+
+def test_moving_day_onto_existing_date_returns_400(client, make_plan, auth_headers):
+    plan = make_plan(days=2)
+    headers = auth_headers(plan.owner_id)
+    first_day, second_day = client.get(f"{API}/day-schedules", params={"plan_id": plan.id}, headers=headers).json()
+    
+    response = client.put(f"{API}/day-schedules/{second_day['id']}", json={"date": first_day["date"]}, headers=headers)
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "해당 날짜에 이미 일정이 존재합니다."
+    days = client.get(f"{API}/day-schedules", params={"plan_id": plan.id}, headers=headers).json()
+    assert [day["date"] for day in days] == [first_day["date"], second_day["date"]]
+
+
+def test_moving_day_to_free_date(client, make_plan, auth_headers):
+    plan = make_plan(days=1)
+    headers = auth_headers(plan.owner_id)
+    
+    response = client.put(f"{API}/day-schedules/{plan.day_ids[0]}", json={"date": "2024-06-01"}, headers=headers)
+    
+    assert response.status_code == 200
+    assert response.json()["date"] == "2024-06-01"
+
+
+def test_update_rejects_null_fields(client, make_plan, auth_headers):
+    plan = make_plan()
+    headers = auth_headers(plan.owner_id)
+    
+    for field in ("date", "start_time", "end_time"):
+        response = client.put(f"{API}/day-schedules/{plan.day_ids[0]}", json={field: None}, headers=headers)
+        assert response.status_code == 422, field
+
+
+def test_loading_day_does_not_load_slots(make_plan):
+    plan = make_plan(slots=3)
+    
+    with SessionLocal() as session:
+        day = session.get(DaySchedule, plan.day_ids[0])
+        assert "schedule_slots" in inspect(day).unloaded
+
+
+def test_update_returns_slots_and_delete_removes_them(client, make_plan, auth_headers):
+    plan = make_plan(slots=3)
+    headers = auth_headers(plan.owner_id)
+    day_id = plan.day_ids[0]
+    
+    updated = client.put(f"{API}/day-schedules/{day_id}", json={"start_time": "10:00:00"}, headers=headers).json()
+    deleted = client.delete(f"{API}/day-schedules/{day_id}", headers=headers)
+    
+    assert [slot["id"] for slot in updated["schedule_slots"]] == plan.slot_ids[day_id]
+    assert updated["schedule_slots"][0]["projected_start_time"] == "10:00:00"
+    assert deleted.status_code == 200
+    with SessionLocal() as session:
+        assert session.scalar(select(func.count()).select_from(ScheduleSlot).filter(ScheduleSlot.day_schedule_id == day_id)) == 0
@@ -0,0 +1,18 @@
+import time
+
+from src.util.health import db_probe
+
+
+def test_health_is_degraded_when_probe_result_is_stale(client, monkeypatch):
+    assert client.get("/health").json()["status"] == "healthy"
+    
+    # 확인 작업이 멈춰 마지막 결과가 주기의 3배보다 오래되었다.
+    monkeypatch.setattr(db_probe, "checked_monotonic", time.monotonic() - db_probe.interval * 4)
+    
+    health = client.get("/health").json()
+    details = client.get("/health/details").json()
+    
+    assert health["status"] == "degraded"
+    assert health["database"] == "disconnected"
+    assert details["database"]["connected"] is True
+    assert details["database"]["stale"] is True
@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import event
+
+from src.util.database import async_engine, engine
+
+from conftest import API
+
+# MySQL 옵티마이저가 실제로 쓰는 실행 계획을 확인하므로 MySQL에서만 실행한다.
+pytestmark = pytest.mark.mysql
+
+
+@pytest.fixture
+def captured_selects():
+    statements = []
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+    
+    for target in (engine, async_engine.sync_engine):
+        event.listen(target, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        for target in (engine, async_engine.sync_engine):
+            event.remove(target, "before_cursor_execute", capture)
+
+
+def full_scans(statement, parameters):
+    # 인덱스 없이 테이블 전체를 읽는 접근(type=ALL이면서 후보 인덱스도 없음)을 찾는다.
+    # 테스트 데이터가 작아 옵티마이저가 인덱스 대신 전체 스캔을 고를 수 있으므로 후보 인덱스 유무로 판단한다.
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+    
+    return [
+        row["table"]
+        for row in rows
+        if row["table"] and not row["table"].startswith("<")
+        and row["type"] == "ALL" and row["possible_keys"] is None
+    ]
+
+
+def test_service_queries_use_indexes(client, make_plan, auth_headers, captured_selects):
+    plan = make_plan(members=3, days=2, slots=4, markers=10, votes=2)
+    headers = auth_headers(plan.owner_id)
+    day_id = plan.day_ids[0]
+    slot_id = plan.slot_ids[day_id][0]
+    
+    requests = [
+        ("GET", f"{API}/plans", {}),
+        ("GET", f"{API}/plans/all", {}),
+        ("GET", f"{API}/plans/all", {"params": {"keyword": "테스트 여행"}}),
+        ("GET", f"{API}/plans/{plan.id}/itinerary", {}),
+        ("GET", f"{API}/day-schedules", {"params": {"plan_id": plan.id}}),
+        ("GET", f"{API}/markers", {"params": {"plan_id": plan.id}}),
+        ("GET", f"{API}/markers/viewport", {"params": {
+            "plan_id": plan.id, "min_lat": 37.4, "min_lng": 126.9, "max_lat": 37.6, "max_lng": 127.1
+        }}),
+        ("GET", f"{API}/markers/nearby", {"params": {"plan_id": plan.id, "lat": 37.5, "lng": 127.0}}),
+        ("GET", f"{API}/schedule-slots/{slot_id}/votes", {}),
+        ("POST", f"{API}/schedule-slots/suggest-order", {"json": {"day_schedule_id": day_id}}),
+    ]
+    for method, url, kwargs in requests:
+        response = client.request(method, url, headers=headers, **kwargs)
+        assert response.status_code == 200, (url, response.text)
+    
+    assert captured_selects
+    failures = [
+        f"{' '.join(statement.split())} -> {tables}"
+        for statement, parameters in captured_selects
+        if (tables := full_scans(statement, parameters))
+    ]
+    assert not failures, "\n".join(failures)
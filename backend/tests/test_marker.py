@@ -0,0 +1,58 @@
+from src.service import marker_service
+from src.util.query_recorder import query_budget
+
+from conftest import API
+
+
+def test_update_rejects_null_coordinates(client, make_plan, auth_headers):
+    plan = make_plan()
+    headers = auth_headers(plan.owner_id)
+    url = f"{API}/markers/{plan.marker_ids[0]}"
+    
+    for body in ({"latitude": None}, {"longitude": None}):
+        assert client.put(url, json=body, headers=headers).status_code == 422
+    
+    assert client.put(url, json={"name": "이름만"}, headers=headers).status_code == 200
+
+
+def test_delete_clears_holding_slot_votes_and_tallies(client, make_plan, auth_headers):
+    plan = make_plan(members=2, slots=2, markers=2, votes=2)
+    headers = auth_headers(plan.owner_id)
+    slot_id = plan.slot_ids[plan.day_ids[0]][0]
+    
+    confirmed = client.post(f"{API}/schedule-slots/{slot_id}/confirm", headers=headers).json()
+    held_marker_id = confirmed["holding_marker_id"]
+    
+    response = client.delete(f"{API}/markers/{held_marker_id}", headers=headers)
+    
+    assert response.status_code == 200
+    itinerary = client.get(f"{API}/plans/{plan.id}/itinerary", headers=headers).json()
+    assert held_marker_id not in [marker["id"] for marker in itinerary["markers"]]
+    [day] = itinerary["day_schedules"]
+    for slot in day["schedule_slots"]:
+        assert slot["holding_marker_id"] is None
+        assert all(tally["marker_id"] != held_marker_id for tally in slot["vote_tallies"])
+    votes = client.get(f"{API}/schedule-slots/{slot_id}/votes", headers=headers).json()
+    assert [vote["marker_id"] for vote in votes] == [marker_id for marker_id in plan.marker_ids if marker_id != held_marker_id]
+
+
+def test_nearby_with_fewer_markers_than_k_is_bounded(client, make_plan, auth_headers, monkeypatch):
+    plan = make_plan(markers=3)
+    params = {"plan_id": plan.id, "lat": -33.9, "lng": 151.2, "k": 10}
+    searches = []
+    find_marker_points = marker_service.find_marker_points
+    
+    async def counted(*args):
+        searches.append(args[3:])
+        return await find_marker_points(*args)
+    
+    monkeypatch.setattr(marker_service, "find_marker_points", counted)
+    
+    # 멤버 권한, 플랜 버전, 격자 적재, 마커 조회
+    with query_budget(4):
+        response = client.get(f"{API}/markers/nearby", params=params, headers=auth_headers(plan.owner_id))
+    
+    assert response.status_code == 200
+    assert sorted(marker["id"] for marker in response.json()) == plan.marker_ids
+    # 반경을 넓혀 가며 다시 찾지 않고, 첫 반경 다음에는 플랜 전체에서 고른다.
+    assert len(searches) == 1
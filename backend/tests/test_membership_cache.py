@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+from src.service import membership_service
+from src.service.membership_service import (
+    MEMBER,
+    OWNER,
+    get_generation,
+    get_plan_role,
+    invalidate_membership,
+    membership_cache,
+    membership_key,
+)
+from src.util.config import settings
+
+from conftest import API
+
+
+def cache_role(plan_id, user_id, role):
+    # 다른 워커에 남아 있는 오래된 항목을 흉내 낸다.
+    async def cache():
+        generation = await get_generation(plan_id)
+        await membership_cache.set(membership_key(plan_id, user_id), generation + b":" + role.encode())
+    
+    asyncio.run(cache())
+
+
+def test_owner_check_ignores_stale_cached_role(client, make_plan, auth_headers):
+    plan = make_plan(members=2)
+    member_id = plan.member_ids[1]
+    cache_role(plan.id, member_id, OWNER)
+    cache_role(plan.id, plan.owner_id, MEMBER)
+    
+    member = client.put(f"{API}/plans/{plan.id}", json={"description": "변경"}, headers=auth_headers(member_id))
+    owner = client.put(f"{API}/plans/{plan.id}", json={"description": "변경"}, headers=auth_headers(plan.owner_id))
+    
+    assert member.status_code == 403
+    assert owner.status_code == 200
+
+
+def test_non_member_result_expires_quickly(client, make_plan, auth_headers):
+    plan = make_plan()
+    outsider = make_plan()
+    
+    response = client.get(f"{API}/plans/{plan.id}/itinerary", headers=auth_headers(outsider.owner_id))
+    
+    assert response.status_code == 403
+    expires_at, value = membership_cache.entries[membership_key(plan.id, outsider.owner_id)]
+    assert value.endswith(b":")
+    assert expires_at - time.monotonic() <= settings.membership_negative_cache_ttl
+
+
+def test_role_read_before_invalidation_is_not_served(make_plan, monkeypatch):
+    plan = make_plan(members=2)
+    member_id = plan.member_ids[1]
+    roles = iter([MEMBER, None])
+    
+    async def load_plan_role(db, plan_id, user_id):
+        role = next(roles)
+        if role:
+            # 역할을 읽은 직후 플랜이 삭제되어 무효화가 먼저 끝난 경우
+            await invalidate_membership(plan_id, [user_id])
+        return role
+    
+    monkeypatch.setattr(membership_service, "load_plan_role", load_plan_role)
+    
+    async def check_twice():
+        return [await get_plan_role(None, plan.id, member_id) for _ in range(2)]
+    
+    assert asyncio.run(check_twice()) == [MEMBER, None]
@@ -0,0 +1,25 @@
+import re
+
+from conftest import API
+
+
+def scrape(client, name, **labels):
+    text = client.get("/metrics").text
+    selector = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{name}{{{re.escape(selector)}}} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_metrics_count_requests_per_route(client, make_plan, auth_headers):
+    plan = make_plan()
+    labels = {"method": "GET", "route": f"{API}/plans/{{plan_id}}/itinerary"}
+    requests_before = scrape(client, "http_requests_total", **labels, status="200")
+    statements_before = scrape(client, "http_request_db_statements_count", **labels)
+    
+    response = client.get(f"{API}/plans/{plan.id}/itinerary", headers=auth_headers(plan.owner_id))
+    assert response.status_code == 200
+    
+    # 경로 템플릿 하나로 모이므로 플랜 ID마다 시계열이 생기지 않는다.
+    assert scrape(client, "http_requests_total", **labels, status="200") == requests_before + 1
+    assert scrape(client, "http_request_db_statements_count", **labels) == statements_before + 1
+    assert f'route="{API}/plans/{plan.id}/itinerary"' not in client.get("/metrics").text
@@ -0,0 +1,97 @@
+import asyncio
+
+import orjson
+import pytest
+from sqlalchemy import delete
+from starlette.websockets import WebSocketDisconnect
+
+from src.model.users_in_plan import UsersInPlan
+from src.service.membership_service import invalidate_membership
+from src.util.broadcast import MemoryBroadcaster
+from src.util.config import settings
+from src.util.database import SessionLocal
+
+from conftest import API
+
+
+def test_subscriber_receives_versioned_events(client, make_plan, auth_headers):
+    plan = make_plan(members=2, slots=2, markers=2)
+    headers = auth_headers(plan.owner_id)
+    slot_id = plan.slot_ids[plan.day_ids[0]][0]
+    
+    with client.websocket_connect(f"{API}/plans/{plan.id}/ws", headers=headers) as websocket:
+        subscribed = websocket.receive_json()
+        assert subscribed["type"] == "subscribed"
+        
+        # 구독과 전체 조회 사이에 커밋된 투표. 스냅샷에 이미 반영되어 있으므로 버전으로 걸러야 한다.
+        client.post(
+            f"{API}/schedule-slots/vote",
+            json={"schedule_slot_id": slot_id, "marker_id": plan.marker_ids[0]},
+            headers=auth_headers(plan.member_ids[1])
+        )
+        snapshot = client.get(f"{API}/plans/{plan.id}/itinerary", headers=headers).json()
+        client.put(f"{API}/schedule-slots/{slot_id}", json={"name": "변경"}, headers=headers)
+        
+        voted = websocket.receive_json()
+        updated = websocket.receive_json()
+    
+    assert voted["type"] == "schedule_slot.voted"
+    assert voted["votes"] == [{"schedule_slot_id": slot_id, "marker_id": plan.marker_ids[0], "count": 1}]
+    assert subscribed["version"] < voted["version"] == snapshot["plan"]["version"]
+    assert updated["type"] == "schedule_slot.updated"
+    assert updated["version"] == snapshot["plan"]["version"] + 1
+
+
+def test_slow_subscriber_gets_single_resync():
+    async def scenario():
+        broadcaster = MemoryBroadcaster("test", queue_size=3)
+        async with broadcaster.subscribe(1) as subscription:
+            for version in range(1, 6):
+                await broadcaster.publish(1, orjson.dumps({"type": "schedule_slot.updated", "version": version}))
+            
+            messages = [orjson.loads(await subscription.get()) for _ in range(subscription.queue.qsize())]
+            return messages, subscription.dropped, broadcaster.stats()
+    
+    messages, dropped, stats = asyncio.run(scenario())
+    
+    # 넷째 이벤트에서 큐가 넘쳐 쌓인 이벤트 대신 resync 하나만 남고, 이후 이벤트는 그 뒤에 이어진다.
+    assert messages == [{"type": "resync", "plan_id": 1}, {"type": "schedule_slot.updated", "version": 5}]
+    assert dropped == 4
+    assert stats["overflows"] == 1
+
+
+def test_stream_closes_when_plan_is_deleted(client, make_plan, auth_headers):
+    plan = make_plan(members=2)
+    
+    with client.websocket_connect(f"{API}/plans/{plan.id}/ws", headers=auth_headers(plan.member_ids[1])) as websocket:
+        subscribed = websocket.receive_json()
+        client.delete(f"{API}/plans/{plan.id}", headers=auth_headers(plan.owner_id))
+        
+        deleted = websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as closed:
+            websocket.receive_json()
+    
+    assert deleted["type"] == "plan.deleted"
+    assert deleted["version"] == subscribed["version"] + 1
+    assert closed.value.code == 1008
+
+
+def test_stream_closes_when_membership_is_lost(client, make_plan, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "event_heartbeat_seconds", 0.05)
+    plan = make_plan(members=2)
+    member_id = plan.member_ids[1]
+    
+    with client.websocket_connect(f"{API}/plans/{plan.id}/ws", headers=auth_headers(member_id)) as websocket:
+        assert websocket.receive_json()["type"] == "subscribed"
+        
+        # 멤버십 행이 사라지면 다음 확인 주기에 스트림이 닫힌다.
+        with SessionLocal() as session:
+            session.execute(delete(UsersInPlan).filter(UsersInPlan.plan_id == plan.id, UsersInPlan.user_id == member_id))
+            session.commit()
+        asyncio.run(invalidate_membership(plan.id, [member_id]))
+        
+        with pytest.raises(WebSocketDisconnect) as closed:
+            while True:
+                assert websocket.receive_json()["type"] == "ping"
+    
+    assert closed.value.code == 1008
@@ -0,0 +1,34 @@
+from src.util.query_recorder import query_budget
+
+from conftest import API
+
+# 플랜, 멤버, 일정, 슬롯, 득표 집계, 마커 (src/service/plan_service.py get_plan_itinerary)
+ITINERARY_QUERIES = 6
+
+
+def fetch_itinerary(client, plan, headers):
+    # 첫 요청으로 멤버 권한을 캐시에 올린 뒤, 두 번째 요청의 쿼리 수만 센다.
+    url = f"{API}/plans/{plan.id}/itinerary"
+    assert client.get(url, headers=headers).status_code == 200
+    
+    with query_budget(ITINERARY_QUERIES) as recorder:
+        response = client.get(url, headers=headers)
+    
+    assert response.status_code == 200
+    return response.json(), recorder.count
+
+
+def test_itinerary_query_count_does_not_grow_with_plan_size(client, make_plan, auth_headers):
+    small = make_plan()
+    large = make_plan(members=5, days=5, slots=20, markers=30, votes=3)
+    
+    small_itinerary, small_count = fetch_itinerary(client, small, auth_headers(small.owner_id))
+    large_itinerary, large_count = fetch_itinerary(client, large, auth_headers(large.owner_id))
+    
+    assert small_count == large_count == ITINERARY_QUERIES
+    
+    assert len(large_itinerary["members"]) == 5
+    assert len(large_itinerary["markers"]) == 30
+    assert [len(day["schedule_slots"]) for day in large_itinerary["day_schedules"]] == [20] * 5
+    assert all(slot["vote_tallies"] for day in large_itinerary["day_schedules"] for slot in day["schedule_slots"])
+    assert len(small_itinerary["day_schedules"][0]["schedule_slots"]) == 1
@@ -0,0 +1,40 @@
+import pytest
+
+from src.util.query_recorder import query_budget
+
+from conftest import API
+
+
+@pytest.mark.parametrize("path, params", [
+    ("/plans", {}),
+    ("/plans/all", {}),
+    ("/plans/all", {"keyword": "테스트 여행"}),
+])
+def test_not_modified_listing_skips_row_query(client, make_plan, auth_headers, path, params):
+    plan = make_plan()
+    headers = auth_headers(plan.owner_id)
+    
+    first = client.get(f"{API}{path}", params=params, headers=headers)
+    assert first.status_code == 200
+    assert first.json()["items"]
+    
+    # 페이지의 (id, version)만 읽고 끝나야 한다.
+    with query_budget(1):
+        cached = client.get(f"{API}{path}", params=params, headers={**headers, "If-None-Match": first.headers["etag"]})
+    
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == first.headers["etag"]
+
+
+def test_listing_etag_changes_when_plan_changes(client, make_plan, auth_headers):
+    plan = make_plan()
+    headers = auth_headers(plan.owner_id)
+    first = client.get(f"{API}/plans", headers=headers)
+    
+    updated = client.put(f"{API}/plans/{plan.id}", json={"description": "변경"}, headers=headers)
+    assert updated.status_code == 200
+    
+    second = client.get(f"{API}/plans", headers={**headers, "If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["items"][0]["description"] == "변경"
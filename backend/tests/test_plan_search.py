@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+from src.service import plan_search_service
+from src.service.plan_search_service import PlanSearchIndex
+
+from conftest import API
+
+
+def stale_index(loads):
+    index = PlanSearchIndex(ngram_size=2, ttl=60)
+    
+    async def load(db):
+        loads.append(db)
+        await asyncio.sleep(0.05)
+        index.loaded_at = time.monotonic()
+    
+    index.load = load
+    return index
+
+
+def test_first_load_runs_once_for_concurrent_searches():
+    loads = []
+    index = stale_index(loads)
+    
+    async def search_concurrently():
+        await asyncio.gather(*(index.refresh(None) for _ in range(5)))
+    
+    asyncio.run(search_concurrently())
+    
+    assert len(loads) == 1
+    assert not index.is_stale()
+
+
+def test_stale_index_is_served_while_one_search_reloads():
+    loads = []
+    index = stale_index(loads)
+    index.loaded_at = time.monotonic() - 120
+    finished = []
+    
+    async def search(name):
+        await index.refresh(None)
+        finished.append((name, index.is_stale()))
+    
+    async def search_concurrently():
+        await asyncio.gather(search("reload"), *(search(f"stale-{i}") for i in range(4)))
+    
+    asyncio.run(search_concurrently())
+    
+    assert len(loads) == 1
+    # 다시 적재하는 요청을 기다리지 않고 기존 색인으로 먼저 응답한다.
+    assert [name for name, _ in finished][-1] == "reload"
+    assert all(stale for name, stale in finished if name != "reload")
+
+
+def test_short_keyword_matches_inside_words(client, make_plan, auth_headers, monkeypatch):
+    monkeypatch.setattr(plan_search_service, "plan_search_index", PlanSearchIndex(ngram_size=2, ttl=60))
+    plan = make_plan()
+    
+    response = client.get(f"{API}/plans/all", params={"keyword": "행"}, headers=auth_headers(plan.owner_id))
+    
+    assert response.status_code == 200
+    assert plan.id in [item["id"] for item in response.json()["items"]]
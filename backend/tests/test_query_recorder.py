@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.service.membership_service import get_plan_role, membership_cache
+from src.util.config import settings
+from src.util.database import engine
+from src.util.query_recorder import QueryBudgetExceeded, attach_query_recorder, query_budget
+
+from conftest import API
+
+
+def run_selects(count: int) -> None:
+    with engine.connect() as connection:
+        for _ in range(count):
+            connection.execute(text("SELECT 1"))
+
+
+async def load_roles(plan_id: int, user_ids) -> None:
+    # 사용자마다 권한을 따로 조회하는 N+1 패턴. 앱 엔진의 커넥션은 TestClient의 이벤트 루프에 묶여 있어 따로 만든다.
+    async_engine = create_async_engine(settings.async_database_url, poolclass=NullPool)
+    attach_query_recorder(async_engine.sync_engine)
+    try:
+        async with AsyncSession(async_engine) as db:
+            for user_id in user_ids:
+                await get_plan_role(db, plan_id, user_id)
+    finally:
+        await async_engine.dispose()
+
+
+@pytest.fixture
+def small_plan(make_plan):
+    return make_plan(members=3, days=2, slots=3)
+
+
+def test_query_budget_passes_within_limit(database):
+    with query_budget(2) as recorder:
+        run_selects(2)
+    
+    assert recorder.count == 2
+
+
+def test_query_budget_fails_over_limit_with_report(database):
+    with pytest.raises(QueryBudgetExceeded) as error:
+        with query_budget(2):
+            run_selects(3)
+    
+    message = str(error.value)
+    assert "쿼리 3개 실행 (허용: 2개)" in message
+    assert "3회: SELECT 1" in message
+
+
+def test_query_budget_keeps_original_error(database):
+    with pytest.raises(ZeroDivisionError):
+        with query_budget(0):
+            run_selects(1)
+            1 / 0
+
+
+def test_query_budget_decorator(database):
+    @query_budget(1)
+    def sync_case():
+        run_selects(1)
+    
+    @query_budget(1)
+    async def async_case():
+        run_selects(2)
+    
+    sync_case()
+    with pytest.raises(QueryBudgetExceeded):
+        asyncio.run(async_case())
+
+
+def test_repeated_reports_service_call_site(small_plan, query_recorder):
+    asyncio.run(membership_cache.clear())
+    
+    asyncio.run(load_roles(small_plan.id, small_plan.member_ids))
+    
+    [(statement, count, sites)] = query_recorder.repeated(3)
+    assert "users_in_plan" in statement
+    assert count == 3
+    [site] = sites
+    assert site.startswith("src/service/membership_service.py:")
+    assert query_recorder.repeated(4) == []
+
+
+@pytest.mark.query_budget(7)
+def test_query_budget_marker_counts_only_test_body(client, small_plan, auth_headers, query_recorder):
+    # 픽스처에서 만든 데이터는 세지 않는다. 멤버 권한 조회(캐시 미스) 1개와 일정 조회 6개다.
+    response = client.get(f"{API}/plans/{small_plan.id}/itinerary", headers=auth_headers(small_plan.owner_id))
+    
+    assert response.status_code == 200
+    assert query_recorder.count == 7
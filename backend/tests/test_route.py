@@ -0,0 +1,43 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.util.route import haversine_matrix, optimize_route, route_length
+
+
+def random_points(size, seed=0):
+    rng = np.random.default_rng(seed)
+    return [tuple(point) for point in rng.uniform([37.4, 126.9], [37.6, 127.1], size=(size, 2))]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_route_is_never_longer_than_input_order(seed):
+    points = random_points(30, seed)
+    pinned = [False] * 30
+    pinned[0] = pinned[10] = pinned[29] = True
+    
+    route = optimize_route(points, pinned, time_budget_ms=200)
+    distances = haversine_matrix(points)
+    
+    assert sorted(route) == list(range(30))
+    assert [route[i] for i in (0, 10, 29)] == [0, 10, 29]
+    assert route_length(distances, route) <= route_length(distances, range(30)) + 1e-9
+
+
+def test_route_untangles_crossing_order():
+    # 입력 순서(0 → 1 → 2 → 3)대로 가면 직선 위를 오가게 되는 지점
+    points = [(37.50, 127.0), (37.52, 127.0), (37.51, 127.0), (37.53, 127.0)]
+    
+    assert optimize_route(points, [False] * 4, time_budget_ms=200) == [0, 2, 1, 3]
+
+
+def test_route_respects_time_budget():
+    points = random_points(300)
+    
+    started = time.perf_counter()
+    optimize_route(points, [False] * 300, time_budget_ms=20)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    
+    # 예산 없이 끝까지 개선하면 수백 ms가 걸리는 크기다. 마지막 한 바퀴만큼은 넘을 수 있다.
+    assert elapsed_ms < 100
@@ -0,0 +1,51 @@
+from src.util.config import settings
+
+from conftest import API
+
+GAP = settings.slot_order_gap
+
+
+def create_slot(client, headers, day_id):
+    response = client.post(
+        f"{API}/schedule-slots",
+        json={"day_schedule_id": day_id, "name": "추가 슬롯", "spending_time": "01:00:00"},
+        headers=headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_create_appends_without_aggregate_query(client, make_plan, auth_headers, query_recorder):
+    plan = make_plan(slots=3)
+    headers = auth_headers(plan.owner_id)
+    day_id = plan.day_ids[0]
+    
+    first = create_slot(client, headers, day_id)
+    second = create_slot(client, headers, day_id)
+    
+    assert first["order_num"] == 4 * GAP
+    assert second["order_num"] == 5 * GAP
+    assert not any("max(" in statement.lower() for statement, _ in query_recorder.statements)
+
+
+def test_create_goes_after_slot_moved_to_end(client, make_plan, auth_headers):
+    plan = make_plan(slots=3)
+    headers = auth_headers(plan.owner_id)
+    day_id = plan.day_ids[0]
+    first_id, _, last_id = plan.slot_ids[day_id]
+    
+    moved = client.post(f"{API}/schedule-slots/{first_id}/move", json={"after_slot_id": last_id}, headers=headers).json()
+    created = create_slot(client, headers, day_id)
+    
+    assert moved["order_num"] > 3 * GAP
+    assert created["order_num"] > moved["order_num"]
+
+
+def test_create_in_missing_day_returns_404(client, make_plan, auth_headers):
+    plan = make_plan()
+    response = client.post(
+        f"{API}/schedule-slots",
+        json={"day_schedule_id": 999999, "name": "없는 일정", "spending_time": "01:00:00"},
+        headers=auth_headers(plan.owner_id)
+    )
+    assert response.status_code == 404
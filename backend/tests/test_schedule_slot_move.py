@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.model.schedule_slot import ScheduleSlot
+from src.schema.schedule_slot import MoveSlotRequest
+from src.service.schedule_slot_service import move_schedule_slot
+from src.util.config import settings
+from src.util.database import SessionLocal
+
+from conftest import API
+
+
+def stored_orders(day_id):
+    with SessionLocal() as session:
+        return dict(session.execute(
+            select(ScheduleSlot.id, ScheduleSlot.order_num).filter(ScheduleSlot.day_schedule_id == day_id)
+        ).all())
+
+
+async def move_concurrently(slot_ids, after_slot_id):
+    # 요청마다 커넥션을 따로 써서 실제로 동시에 실행되는 트랜잭션을 만든다.
+    async_engine = create_async_engine(settings.async_database_url, poolclass=NullPool)
+    
+    async def move(slot_id):
+        async with AsyncSession(async_engine) as db:
+            await move_schedule_slot(db, slot_id, MoveSlotRequest(after_slot_id=after_slot_id), BackgroundTasks())
+    
+    try:
+        await asyncio.gather(*(move(slot_id) for slot_id in slot_ids))
+    finally:
+        await async_engine.dispose()
+
+
+def test_moves_into_same_gap_get_distinct_ranks(client, make_plan, auth_headers):
+    plan = make_plan(slots=4)
+    headers = auth_headers(plan.owner_id)
+    day_id = plan.day_ids[0]
+    first_id, _, third_id, fourth_id = plan.slot_ids[day_id]
+    
+    for slot_id in (third_id, fourth_id):
+        response = client.post(f"{API}/schedule-slots/{slot_id}/move", json={"after_slot_id": first_id}, headers=headers)
+        assert response.status_code == 200
+    
+    orders = stored_orders(day_id)
+    assert len(set(orders.values())) == len(orders)
+    assert orders[first_id] < orders[fourth_id] < orders[third_id]
+
+
+def test_move_missing_slot_returns_404(client, make_plan, auth_headers):
+    plan = make_plan(slots=2)
+    slot_id = plan.slot_ids[plan.day_ids[0]][0]
+    
+    response = client.post(f"{API}/schedule-slots/{slot_id}/move", json={"after_slot_id": 999999}, headers=auth_headers(plan.owner_id))
+    
+    assert response.status_code == 404
+
+
+@pytest.mark.mysql
+def test_concurrent_moves_into_same_gap_get_distinct_ranks(make_plan):
+    plan = make_plan(slots=8)
+    day_id = plan.day_ids[0]
+    first_id, *others = plan.slot_ids[day_id]
+    
+    asyncio.run(move_concurrently(others[1:], first_id))
+    
+    orders = stored_orders(day_id)
+    assert len(set(orders.values())) == len(orders)
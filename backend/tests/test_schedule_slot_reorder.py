@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import select
+
+from src.model.schedule_slot import ScheduleSlot
+from src.util.database import SessionLocal
+from src.util.query_recorder import query_budget
+
+from conftest import API
+
+# 권한 확인(일정의 플랜 ID, 멤버 권한), 슬롯 조회, 순번 일괄 UPDATE, updated_at 재조회, 플랜 ID 조회, 플랜 버전 증가와 재조회
+REORDER_QUERIES = 8
+
+
+def stored_updated_at(day_id):
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(ScheduleSlot.id, ScheduleSlot.updated_at).filter(ScheduleSlot.day_schedule_id == day_id)
+        )
+        return {slot_id: updated_at.isoformat() for slot_id, updated_at in rows}
+
+
+def reorder(client, headers, day_id, slot_ids):
+    with query_budget(REORDER_QUERIES) as recorder:
+        response = client.post(
+            f"{API}/schedule-slots/reorder",
+            json={"day_schedule_id": day_id, "slot_ids": slot_ids},
+            headers=headers
+        )
+    
+    assert response.status_code == 200
+    return response.json(), recorder.count
+
+
+@pytest.mark.parametrize("slot_count", [5, 50])
+def test_reorder_runs_constant_queries(client, make_plan, auth_headers, slot_count):
+    plan = make_plan(slots=slot_count)
+    day_id = plan.day_ids[0]
+    slot_ids = list(reversed(plan.slot_ids[day_id]))
+    
+    slots, count = reorder(client, auth_headers(plan.owner_id), day_id, slot_ids)
+    
+    assert count == REORDER_QUERIES
+    assert [slot["id"] for slot in slots] == slot_ids
+    assert [slot["order_num"] for slot in slots] == sorted(slot["order_num"] for slot in slots)
+
+
+def test_reorder_returns_written_updated_at(client, make_plan, auth_headers):
+    plan = make_plan(slots=3)
+    day_id = plan.day_ids[0]
+    before = stored_updated_at(day_id)
+    
+    slots, _ = reorder(client, auth_headers(plan.owner_id), day_id, list(reversed(plan.slot_ids[day_id])))
+    
+    returned = {slot["id"]: slot["updated_at"] for slot in slots}
+    assert returned == stored_updated_at(day_id)
+    assert all(returned[slot_id] > before[slot_id] for slot_id in returned)
@@ -0,0 +1,40 @@
+from conftest import API
+
+
+def test_vote_for_marker_of_another_plan_is_rejected(client, make_plan, auth_headers):
+    plan = make_plan(members=2)
+    other = make_plan()
+    headers = auth_headers(plan.owner_id)
+    slot_id = plan.slot_ids[plan.day_ids[0]][0]
+    foreign_marker_id = other.marker_ids[0]
+    
+    single = client.post(
+        f"{API}/schedule-slots/vote",
+        json={"schedule_slot_id": slot_id, "marker_id": foreign_marker_id},
+        headers=headers
+    )
+    batch = client.post(
+        f"{API}/schedule-slots/votes:batch",
+        json={"votes": [{"schedule_slot_id": slot_id, "marker_id": foreign_marker_id}]},
+        headers=auth_headers(plan.member_ids[1])
+    )
+    
+    assert single.status_code == 400
+    assert batch.status_code == 400
+    assert client.get(f"{API}/schedule-slots/{slot_id}/votes", headers=headers).json() == []
+    assert client.post(f"{API}/schedule-slots/{slot_id}/confirm", headers=headers).status_code == 400
+
+
+def test_batch_vote_checks_each_pair(client, make_plan, auth_headers):
+    plan = make_plan(slots=2, markers=2)
+    other = make_plan()
+    first_slot_id, second_slot_id = plan.slot_ids[plan.day_ids[0]]
+    votes = [
+        {"schedule_slot_id": first_slot_id, "marker_id": plan.marker_ids[0]},
+        {"schedule_slot_id": second_slot_id, "marker_id": other.marker_ids[0]},
+    ]
+    
+    response = client.post(f"{API}/schedule-slots/votes:batch", json={"votes": votes}, headers=auth_headers(plan.owner_id))
+    
+    assert response.status_code == 400
+    assert client.get(f"{API}/schedule-slots/{first_slot_id}/votes", headers=auth_headers(plan.owner_id)).json() == []
@@ -0,0 +1,55 @@
+from conftest import API
+
+
+def get_day(client, plan, headers):
+    response = client.get(f"{API}/day-schedules", params={"plan_id": plan.id}, headers=headers)
+    assert response.status_code == 200
+    return response.json()[0]
+
+
+def projected(day):
+    return [(slot["projected_start_time"], slot["projected_end_time"]) for slot in day["schedule_slots"]]
+
+
+def test_day_projection_for_seeded_day(client, make_plan, auth_headers):
+    # 09:00~21:00 일정에 1시간짜리 슬롯 3개
+    plan = make_plan(slots=3)
+    
+    day = get_day(client, plan, auth_headers(plan.owner_id))
+    
+    assert day["planned_seconds"] == 3 * 3600
+    assert day["remaining_seconds"] == 9 * 3600
+    assert day["is_overflowing"] is False
+    assert projected(day) == [
+        ("09:00:00", "10:00:00"),
+        ("10:00:00", "11:00:00"),
+        ("11:00:00", "12:00:00"),
+    ]
+
+
+def test_day_projection_tracks_slot_changes_and_overflow(client, make_plan, auth_headers):
+    plan = make_plan(slots=3)
+    headers = auth_headers(plan.owner_id)
+    day_id = plan.day_ids[0]
+    
+    created = client.post(
+        f"{API}/schedule-slots",
+        json={"day_schedule_id": day_id, "name": "추가", "spending_time": "00:30:00"},
+        headers=headers
+    )
+    assert created.status_code == 201
+    client.delete(f"{API}/schedule-slots/{plan.slot_ids[day_id][0]}", headers=headers)
+    updated = client.put(f"{API}/day-schedules/{day_id}", json={"start_time": "22:00:00", "end_time": "23:30:00"}, headers=headers)
+    assert updated.status_code == 200
+    
+    day = get_day(client, plan, headers)
+    
+    assert day["planned_seconds"] == 2 * 3600 + 1800
+    assert day["remaining_seconds"] == -3600
+    assert day["is_overflowing"] is True
+    # 자정을 넘는 시각은 비워 둔다.
+    assert projected(day) == [
+        ("22:00:00", "23:00:00"),
+        ("23:00:00", None),
+        (None, None),
+    ]
@@ -0,0 +1,73 @@
+import pytest
+
+from conftest import API
+
+
+def write_requests(plan):
+    day_id = plan.day_ids[0]
+    slot_id, other_slot_id = plan.slot_ids[day_id]
+    marker_id = plan.marker_ids[0]
+    
+    # 멤버가 순서대로 보내도 모두 성공하도록 슬롯 추가와 삭제는 마지막에 둔다.
+    return [
+        ("PUT", f"{API}/day-schedules/{day_id}", {"json": {"start_time": "10:00:00"}}),
+        ("PUT", f"{API}/markers/{marker_id}", {"json": {"name": "변경"}}),
+        ("PUT", f"{API}/schedule-slots/{slot_id}", {"json": {"name": "변경"}}),
+        ("POST", f"{API}/schedule-slots/reorder", {"json": {"day_schedule_id": day_id, "slot_ids": [other_slot_id, slot_id]}}),
+        ("POST", f"{API}/schedule-slots/suggest-order", {"json": {"day_schedule_id": day_id}}),
+        ("POST", f"{API}/schedule-slots/{slot_id}/move", {"json": {"after_slot_id": other_slot_id}}),
+        ("POST", f"{API}/schedule-slots/vote", {"json": {"schedule_slot_id": slot_id, "marker_id": marker_id}}),
+        ("POST", f"{API}/schedule-slots/votes:batch", {"json": {"votes": [{"schedule_slot_id": other_slot_id, "marker_id": marker_id}]}}),
+        ("GET", f"{API}/schedule-slots/{slot_id}/votes", {}),
+        ("POST", f"{API}/schedule-slots/{slot_id}/confirm", {}),
+        ("POST", f"{API}/schedule-slots", {"json": {"day_schedule_id": day_id, "name": "추가", "spending_time": "01:00:00"}}),
+        ("DELETE", f"{API}/schedule-slots/{slot_id}", {}),
+        ("DELETE", f"{API}/markers/{marker_id}", {}),
+        ("DELETE", f"{API}/day-schedules/{day_id}", {}),
+    ]
+
+
+@pytest.fixture
+def plan(make_plan):
+    return make_plan(slots=2)
+
+
+def test_writes_by_id_require_token(client, plan):
+    for method, url, kwargs in write_requests(plan):
+        response = client.request(method, url, **kwargs)
+        assert response.status_code == 401, (method, url, response.text)
+
+
+def test_writes_by_id_reject_non_members(client, make_plan, plan, auth_headers):
+    outsider = make_plan()
+    headers = auth_headers(outsider.owner_id)
+    itinerary_url = f"{API}/plans/{plan.id}/itinerary"
+    before = client.get(itinerary_url, headers=auth_headers(plan.owner_id)).json()
+    
+    for method, url, kwargs in write_requests(plan):
+        response = client.request(method, url, headers=headers, **kwargs)
+        assert response.status_code == 403, (method, url, response.text)
+    
+    assert client.get(itinerary_url, headers=auth_headers(plan.owner_id)).json() == before
+
+
+def test_writes_by_id_allow_members(client, make_plan, auth_headers):
+    plan = make_plan(members=2, slots=2)
+    headers = auth_headers(plan.member_ids[1])
+    
+    for method, url, kwargs in write_requests(plan):
+        response = client.request(method, url, headers=headers, **kwargs)
+        assert response.status_code in (200, 201), (method, url, response.text)
+
+
+def test_batch_vote_across_plans_requires_every_membership(client, make_plan, auth_headers):
+    plan = make_plan()
+    other = make_plan()
+    votes = [
+        {"schedule_slot_id": plan.slot_ids[plan.day_ids[0]][0], "marker_id": plan.marker_ids[0]},
+        {"schedule_slot_id": other.slot_ids[other.day_ids[0]][0], "marker_id": other.marker_ids[0]},
+    ]
+    
+    response = client.post(f"{API}/schedule-slots/votes:batch", json={"votes": votes}, headers=auth_headers(plan.owner_id))
+    
+    assert response.status_code == 403